@@ -0,0 +1 @@
+"""마스터 시트 규모별 성능 벤치마크 (python -m benchmarks.run)"""
@@ -0,0 +1,269 @@
+"""마스터 시트 규모별 단계 벤치마크
+
+합성 마스터 시트(benchmarks/synthetic.py)로 로드 → 주차 맵 → 엔진 인덱스 → 주차별 가공 데이터 →
+섹션(집계 + 차트) → 정적 HTML 렌더링 단계를 각각 시간/메모리 측정하고, 결과를 JSON으로 저장한 뒤
+저장된 기준값(benchmarks/baseline.json)보다 느려지거나 메모리를 더 쓰면 종료 코드 1로 실패합니다.
+
+사용 예:
+    python -m benchmarks.run --scale 10x
+    python -m benchmarks.run --scale 10x 100x --repeat 5
+    python -m benchmarks.run --scale 10x --update-baseline   # 현재 결과를 기준값으로 저장
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.synthetic import DEFAULT_BASE_DATE, SCALES, generate_master_sheets
+from cnc import snapshot
+from cnc.engine import FILTERED_DATA_BUILDERS, ReportEngine
+from cnc.loader import CONTENT_DETAIL_PATH, EVENT_SUMMARY_PATH, parse_content_csv, parse_event_csv
+from cnc.report import blocks_to_html
+from cnc.sections import SECTIONS, build_section
+from cnc.weeks import generate_week_map
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA_DIR = os.path.join(BENCH_DIR, '.data')
+DEFAULT_RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+# 이 값보다 작은 차이는 측정 잡음으로 보고 회귀로 판정하지 않음
+MIN_TIME_DELTA_SEC = 0.05
+MIN_MEMORY_DELTA_MB = 2.0
+
+
+# ----------------- 측정 단계 -----------------
+def _stage_load_csv(ctx):
+    ctx['df_event'] = parse_event_csv(ctx['event_path'])
+    ctx['df_content'] = parse_content_csv(ctx['content_path'])
+
+
+def _stage_snapshot_write(ctx):
+    for path, df in ((ctx['event_path'], ctx['df_event']), (ctx['content_path'], ctx['df_content'])):
+        snapshot.write_snapshot(path, df, snapshot.source_signature(path))
+
+
+def _stage_snapshot_read(ctx):
+    ctx['df_event'] = snapshot.load_with_snapshot(ctx['event_path'], parse_event_csv)
+    ctx['df_content'] = snapshot.load_with_snapshot(ctx['content_path'], parse_content_csv)
+
+
+def _stage_week_map(ctx):
+    ctx['week_map'] = generate_week_map(ctx['df_event'], DEFAULT_BASE_DATE)
+
+
+def _stage_engine_index(ctx):
+    engine = ReportEngine(ctx['df_event'], ctx['df_content'], version='bench', base_date=DEFAULT_BASE_DATE)
+    engine.week_index
+    engine.cube
+    ctx['engine'] = engine
+    ctx['week'] = next(iter(engine.week_map))
+
+
+# 제목 검색 단계에서 사용할 검색어 (합성 제목 어휘 기준: 한 글자, 두 글자, 여러 단어, 결과 없음)
+SEARCH_QUERIES = ['셰', '노포', '샘표 연구소', '페스티브 시즌 운영', '없는검색어']
+
+
+def _stage_title_index(ctx):
+    ctx['engine'].title_index
+
+
+def _stage_search(ctx):
+    # 결과 캐시를 거치지 않고 색인 검색 + 조회수 순위만 측정
+    for query in SEARCH_QUERIES:
+        ctx['engine'].search_articles(query, 50)
+
+
+def _filtered_stage(name):
+    def run(ctx):
+        ctx['engine'].get(name, ctx['week'])
+    return run
+
+
+def _section_stage(section):
+    def run(ctx):
+        ctx.setdefault('blocks', {})[section.key] = build_section(section, ctx['engine'], ctx['week'])
+    return run
+
+
+def _stage_render_html(ctx):
+    for blocks in ctx['blocks'].values():
+        blocks_to_html(blocks)
+
+
+STAGES = (
+    [('load_csv', _stage_load_csv),
+     ('snapshot_write', _stage_snapshot_write),
+     ('snapshot_read', _stage_snapshot_read),
+     ('generate_week_map', _stage_week_map),
+     ('engine_index', _stage_engine_index),
+     ('title_index', _stage_title_index),
+     ('search', _stage_search)]
+    + [(f'filtered:{name}', _filtered_stage(name)) for name in FILTERED_DATA_BUILDERS]
+    + [(f'section:{section.key}', _section_stage(section)) for section in SECTIONS]
+    + [('render_html', _stage_render_html)]
+)
+
+
+def _run_pipeline(ctx, trace_memory):
+    """모든 단계를 순서대로 1회 실행 -> {단계: (초, 최대 할당 MB 또는 None)}"""
+    measured = {}
+    for name, stage in STAGES:
+        if trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        stage(ctx)
+        elapsed = time.perf_counter() - started
+        peak_mb = (tracemalloc.get_traced_memory()[1] - base) / 2**20 if trace_memory else None
+        measured[name] = (elapsed, peak_mb)
+    return measured
+
+
+# ----------------- 데이터 준비 / 실행 -----------------
+def prepare_data(data_dir, scale, rows, seed):
+    """규모별 합성 시트를 준비 (이전에 끝까지 생성된 파일이 있으면 재사용)"""
+    out_dir = os.path.join(data_dir, f"{scale}-seed{seed}")
+    marker = os.path.join(out_dir, '.complete')
+    if os.path.exists(marker):
+        with open(marker, encoding='utf-8') as f:
+            if f.read().strip() == str(rows):
+                return os.path.join(out_dir, EVENT_SUMMARY_PATH), os.path.join(out_dir, CONTENT_DETAIL_PATH)
+
+    print(f"[{scale}] 합성 마스터 시트 생성 중 ({rows:,}행)...", flush=True)
+    paths = generate_master_sheets(out_dir, rows, seed=seed)
+    with open(marker, 'w', encoding='utf-8') as f:
+        f.write(str(rows))
+    return paths
+
+
+def run_scale(scale, rows, event_path, content_path, repeat, trace_memory=True):
+    """한 규모의 벤치마크 결과 dict"""
+    timings = {name: [] for name, _ in STAGES}
+    for _ in range(repeat):
+        ctx = {'event_path': event_path, 'content_path': content_path}
+        for name, (elapsed, _) in _run_pipeline(ctx, trace_memory=False).items():
+            timings[name].append(elapsed)
+
+    # tracemalloc은 실행 속도를 떨어뜨리므로 메모리는 별도 1회 실행으로 측정
+    peaks = {}
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            ctx = {'event_path': event_path, 'content_path': content_path}
+            peaks = {name: peak for name, (_, peak) in _run_pipeline(ctx, trace_memory=True).items()}
+        finally:
+            tracemalloc.stop()
+
+    stages = {}
+    for name, values in timings.items():
+        stages[name] = {
+            'seconds': round(statistics.median(values), 4),
+            'seconds_min': round(min(values), 4),
+            'peak_mb': round(peaks[name], 2) if name in peaks else None,
+        }
+    return {
+        'scale': scale,
+        'rows': rows,
+        'repeat': repeat,
+        'stages': stages,
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def compare_with_baseline(result, baseline, time_tolerance, memory_tolerance):
+    """기준값 대비 회귀 목록 (문자열)"""
+    regressions = []
+    base_stages = baseline.get(result['scale'], {}).get('stages', {})
+    for name, current in result['stages'].items():
+        base = base_stages.get(name)
+        if not base:
+            continue
+        if (current['seconds'] > base['seconds'] * (1 + time_tolerance)
+                and current['seconds'] - base['seconds'] > MIN_TIME_DELTA_SEC):
+            regressions.append(f"[{result['scale']}] {name}: {base['seconds']:.3f}s -> {current['seconds']:.3f}s")
+        if (current['peak_mb'] is not None and base.get('peak_mb') is not None
+                and current['peak_mb'] > base['peak_mb'] * (1 + memory_tolerance)
+                and current['peak_mb'] - base['peak_mb'] > MIN_MEMORY_DELTA_MB):
+            regressions.append(f"[{result['scale']}] {name}: {base['peak_mb']:.1f}MB -> {current['peak_mb']:.1f}MB")
+    return regressions
+
+
+def _print_result(result):
+    print(f"\n[{result['scale']}] {result['rows']:,}행 (반복 {result['repeat']}회, 최대 RSS {result['max_rss_mb']:,.0f}MB)")
+    print(f"  {'단계':<24}{'시간(중앙값)':>14}{'최대 할당':>12}")
+    for name, stage in result['stages'].items():
+        peak = f"{stage['peak_mb']:,.1f}MB" if stage['peak_mb'] is not None else '-'
+        print(f"  {name:<24}{stage['seconds']:>13.3f}s{peak:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿡앤셰프 대시보드 규모별 벤치마크")
+    parser.add_argument('--scale', nargs='+', choices=list(SCALES), default=['10x'], help="측정 규모 (기본: 10x)")
+    parser.add_argument('--repeat', type=int, default=3, help="시간 측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="합성 시트 보관 폴더")
+    parser.add_argument('--results-dir', default=DEFAULT_RESULTS_DIR, help="결과 JSON 저장 폴더")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="기준값 JSON 경로")
+    parser.add_argument('--update-baseline', action='store_true', help="이번 결과로 기준값 갱신")
+    parser.add_argument('--time-tolerance', type=float, default=0.3, help="허용 시간 증가율 (기본 0.3 = 30%%)")
+    parser.add_argument('--memory-tolerance', type=float, default=0.2, help="허용 메모리 증가율 (기본 0.2 = 20%%)")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 메모리 측정 생략")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scale:
+        rows = SCALES[scale]
+        event_path, content_path = prepare_data(args.data_dir, scale, rows, args.seed)
+        result = run_scale(scale, rows, event_path, content_path, args.repeat, trace_memory=not args.no_memory)
+        _print_result(result)
+        results.append(result)
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    run_info = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    result_path = os.path.join(args.results_dir, f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(run_info, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {result_path}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        for result in results:
+            baseline[result['scale']] = {'rows': result['rows'], 'platform': run_info['platform'], 'stages': result['stages']}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"기준값 갱신: {args.baseline}")
+        return 0
+
+    regressions = []
+    for result in results:
+        regressions += compare_with_baseline(result, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\n성능 회귀 감지:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("기준값 대비 회귀 없음" if baseline else "기준값 없음 (--update-baseline으로 저장)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
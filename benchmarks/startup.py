@@ -0,0 +1,220 @@
+"""새 서버 프로세스의 시작 시간(콜드 스타트) 점검
+
+새 파이썬 프로세스에서 대시보드 첫 실행과 같은 순서로 단계를 밟으며 시간을 재고, 첫 화면까지 걸린
+시간이 예산(benchmarks/startup_budget.json)을 넘으면 종료 코드 1로 실패합니다. 별도 1회 실행을
+`-X importtime`으로 돌려 단계별로 어떤 패키지를 가져오는 데 시간이 들었는지도 함께 보여 줍니다.
+
+단계 (streamlit 자체는 서버가 먼저 가져오므로 제외):
+    title          CSS/제목을 그리기 전까지 가져오는 모듈 (cnc.theme, cnc.profiling)
+    import         데이터 모듈 (cnc.loader, cnc.formatting, cnc.sections, cnc.shared)
+    engine         마스터 시트 로드 + 엔진 준비 (shared_watcher().get(), 스냅샷이 있는 상태)
+    first_section  기본 섹션(첫 번째 탭) 집계 + 차트 (plotly는 여기서 처음 가져옴)
+
+첫 화면(first_paint)은 title 단계까지, 첫 섹션(first_section)은 모든 단계의 합입니다.
+기본 데이터는 실제 시트 규모(1x)의 합성 시트이며, 측정 전에 한 번 실행해 스냅샷을 만들어 둡니다.
+
+사용 예:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --event event_summary.csv --content content_detail.csv
+    python -m benchmarks.startup --update-budget   # 현재 결과 x (1 + --margin)을 예산으로 저장
+"""
+# 자식 프로세스에서 실행되는 모듈이므로 표준 라이브러리만 맨 위에서 가져옴 (측정 대상 오염 방지)
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+DEFAULT_BUDGET = os.path.join(BENCH_DIR, 'startup_budget.json')
+DEFAULT_RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+PHASES = ['title', 'import', 'engine', 'first_section']
+# 자식 프로세스가 단계가 끝날 때마다 stderr에 남기는 표시 (-X importtime 출력을 단계별로 나눔)
+PHASE_MARKER = '# startup-phase: '
+# 예산 갱신 시 최소 여유 (아주 짧은 단계가 측정 잡음만으로 예산을 넘지 않도록)
+MIN_BUDGET_SLACK_SEC = 0.05
+
+
+# ----------------- 자식 프로세스: 대시보드 첫 실행 재현 -----------------
+def _child_main(event_path, content_path):
+    """대시보드 첫 실행 순서대로 단계 실행 -> stdout에 {단계: 초} JSON 한 줄"""
+    phases = {}
+    last = time.perf_counter()
+    # 인터프리터 시작과 이 모듈 실행까지 가져온 모듈은 측정 단계와 구분
+    print(f"{PHASE_MARKER}interpreter", file=sys.stderr, flush=True)
+
+    def mark(name):
+        nonlocal last
+        now = time.perf_counter()
+        phases[name] = now - last
+        last = now
+        print(f"{PHASE_MARKER}{name}", file=sys.stderr, flush=True)
+
+    from cnc.profiling import StageProfiler  # noqa: F401
+    from cnc.theme import CSS
+    len(CSS)
+    mark('title')
+
+    from cnc.formatting import column_config  # noqa: F401
+    from cnc.sections import SECTIONS, build_section
+    from cnc.shared import shared_watcher
+    mark('import')
+
+    watcher = shared_watcher(event_path, content_path)
+    engine = watcher.get()
+    if engine is None:
+        print(f"마스터 시트 로드 실패: {watcher.last_error}", file=sys.stderr, flush=True)
+        os._exit(2)
+    mark('engine')
+
+    build_section(SECTIONS[0], engine, next(iter(engine.week_map)))
+    mark('first_section')
+
+    print(json.dumps(phases), flush=True)
+    # 감시 스레드를 기다리지 않고 종료
+    os._exit(0)
+
+
+# ----------------- 측정 -----------------
+def run_child(event_path, content_path, importtime=False):
+    """새 프로세스 1회 실행 -> ({단계: 초}, stderr 출력)"""
+    cmd = [sys.executable] + (['-X', 'importtime'] if importtime else [])
+    cmd += ['-m', 'benchmarks.startup', '--child', os.path.abspath(event_path), os.path.abspath(content_path)]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT_DIR, os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT_DIR, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"시작 시간 측정 실패 (종료 코드 {proc.returncode}):\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def import_breakdown(stderr, top=5):
+    """-X importtime 출력 -> {단계: {'seconds', 'packages': [(최상위 패키지, 초), ...]}}
+
+    각 모듈의 자체(self) 시간을 최상위 패키지 이름(pandas, plotly, cnc ...)별로 합산합니다.
+    """
+    breakdown = {}
+    current = {}
+    for line in stderr.splitlines():
+        if line.startswith(PHASE_MARKER):
+            phase = line[len(PHASE_MARKER):].strip()
+            packages = sorted(current.items(), key=lambda item: -item[1])
+            breakdown[phase] = {'seconds': round(sum(current.values()), 4),
+                                'packages': [(name, round(sec, 4)) for name, sec in packages[:top]]}
+            current = {}
+            continue
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        root = name.strip().split('.')[0]
+        current[root] = current.get(root, 0.0) + int(self_us) / 1e6
+    return breakdown
+
+
+def measure(event_path, content_path, repeat):
+    """단계별 시간(중앙값), 첫 화면/첫 섹션까지 누적 시간, 가져오기 분해"""
+    # 첫 실행은 스냅샷을 만드는 비용이 섞이므로 버림 (실제 서버 재시작은 스냅샷이 있는 상태)
+    run_child(event_path, content_path)
+    runs = [run_child(event_path, content_path)[0] for _ in range(repeat)]
+    phases = {name: round(statistics.median(run[name] for run in runs), 4) for name in PHASES}
+    _, stderr = run_child(event_path, content_path, importtime=True)
+    return {
+        'repeat': repeat,
+        'phases': phases,
+        'first_paint_sec': phases['title'],
+        'first_section_sec': round(sum(phases.values()), 4),
+        'imports': import_breakdown(stderr),
+    }
+
+
+def check_budget(result, budget):
+    """예산 초과 목록 (문자열)"""
+    over = []
+    for key in ('first_paint_sec', 'first_section_sec'):
+        if key in budget and result[key] > budget[key]:
+            over.append(f"{key}: {result[key]:.3f}s > 예산 {budget[key]:.3f}s")
+    return over
+
+
+def _print_result(result):
+    print(f"\n새 프로세스 시작 시간 (반복 {result['repeat']}회 중앙값)")
+    print(f"  {'단계':<16}{'시간':>10}{'가져오기':>10}  가져오기 상위 패키지 (-X importtime)")
+    for name in PHASES:
+        imports = result['imports'].get(name, {'seconds': 0.0, 'packages': []})
+        top = ', '.join(f"{pkg} {sec * 1000:.0f}ms" for pkg, sec in imports['packages'])
+        print(f"  {name:<16}{result['phases'][name]:>9.3f}s{imports['seconds']:>9.3f}s  {top}")
+    print(f"  첫 화면(제목)까지 {result['first_paint_sec']:.3f}s, 첫 섹션까지 {result['first_section_sec']:.3f}s")
+
+
+def prepare_default_data(data_dir, seed):
+    """실제 시트 규모(1x) 합성 시트 경로"""
+    from benchmarks.run import prepare_data
+    from benchmarks.synthetic import REAL_CONTENT_ROWS
+
+    return prepare_data(data_dir, '1x', REAL_CONTENT_ROWS, seed)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['--child']:
+        return _child_main(*argv[1:3])
+
+    parser = argparse.ArgumentParser(description="쿡앤셰프 대시보드 시작 시간(콜드 스타트) 점검")
+    parser.add_argument('--event', help="이벤트 요약 시트 경로 (기본: 1x 합성 시트)")
+    parser.add_argument('--content', help="기사 상세 시트 경로 (기본: 1x 합성 시트)")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', default=os.path.join(BENCH_DIR, '.data'), help="합성 시트 보관 폴더")
+    parser.add_argument('--results-dir', default=DEFAULT_RESULTS_DIR, help="결과 JSON 저장 폴더")
+    parser.add_argument('--budget', default=DEFAULT_BUDGET, help="예산 JSON 경로")
+    parser.add_argument('--update-budget', action='store_true', help="이번 결과 x (1 + margin)을 예산으로 저장")
+    parser.add_argument('--margin', type=float, default=0.5, help="예산 갱신 시 여유율 (기본 0.5 = 50%%)")
+    args = parser.parse_args(argv)
+
+    if bool(args.event) != bool(args.content):
+        parser.error("--event와 --content는 함께 지정해야 합니다")
+    if args.event:
+        event_path, content_path = args.event, args.content
+    else:
+        event_path, content_path = prepare_default_data(args.data_dir, args.seed)
+
+    result = measure(event_path, content_path, args.repeat)
+    _print_result(result)
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    result_path = os.path.join(args.results_dir, f"startup_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump({'created': datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(),
+                   'platform': platform.platform(), 'event': event_path, 'content': content_path, **result},
+                  f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {result_path}")
+
+    if args.update_budget:
+        budget = {key: round(max(result[key] * (1 + args.margin), result[key] + MIN_BUDGET_SLACK_SEC), 3)
+                  for key in ('first_paint_sec', 'first_section_sec')}
+        with open(args.budget, 'w', encoding='utf-8') as f:
+            json.dump({**budget, 'platform': platform.platform()}, f, ensure_ascii=False, indent=2)
+        print(f"예산 갱신: {args.budget}")
+        return 0
+
+    if not os.path.exists(args.budget):
+        print("예산 없음 (--update-budget으로 저장)")
+        return 0
+    with open(args.budget, encoding='utf-8') as f:
+        over = check_budget(result, json.load(f))
+    if over:
+        print("\n시작 시간 예산 초과:")
+        for line in over:
+            print(f"  {line}")
+        return 1
+    print("시작 시간 예산 이내")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
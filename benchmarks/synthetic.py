@@ -0,0 +1,157 @@
+"""벤치마크용 합성 마스터 시트 생성기
+
+실제 마스터 시트와 같은 컬럼/형식(UTF-8 BOM, CRLF, 한글 제목, '91.50%' 형태의 비율 문자열)으로
+content_detail / event_summary CSV를 만듭니다. 행은 청크 단위로 써서 1,500만 행도
+메모리에 한꺼번에 올리지 않습니다.
+
+사용 예:
+    python -m benchmarks.synthetic --rows 150000 --out benchmarks/.data/10x
+"""
+import argparse
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from cnc.loader import CONTENT_DETAIL_PATH, EVENT_SUMMARY_PATH
+
+# 실제 content_detail 마스터 시트 행 수 (헤더 제외)
+REAL_CONTENT_ROWS = 15_395
+
+SCALES = {
+    '10x': 150_000,
+    '100x': 1_500_000,
+    '1000x': 15_000_000,
+}
+
+DEFAULT_BASE_DATE = date(2025, 12, 10)
+
+CONTENT_COLUMNS = [
+    'page_path', 'total_views', 'total_users', 'avg_engagement_time_sec', 'total_events',
+    'total_sessions', 'new_users_count', 'article_title', 'writer_name', 'category_main',
+    'category_sub', 'publishing_datetime', 'likes_count', 'comments_count',
+    'new_user_ratio_str', 'bounce_rate_str', 'scroll_90_count',
+]
+
+WRITERS = ['김철호', '이경엽', '이정호', '안정미', '조용수', '오요리']
+
+CATEGORIES = [
+    ('Chef', '인터뷰'), ('건강', '식자재'), ('라이프', '제철'), ('맛집', '핫플'), ('이슈', '산업'),
+    ('이슈', '트렌드'), ('인터뷰', '스타'), ('호텔', '시즌'), ('호텔', '이벤트'), ('호텔', '프로모션'),
+]
+
+# 제목 = 말머리 + 대상 + 내용 조합 (실제 시트의 제목 형식을 흉내 냄)
+TITLE_PREFIXES = ['', '[Cook&Life] ', '[식생활 건강] ', '[맛집탐방] ', '[이슈] ', '[인터뷰] ', '[호텔뉴스] ', '[해외 셰프] ']
+TITLE_SUBJECTS = [
+    '코트야드 메리어트 세종', '파르나스 호텔 제주', '앰배서더 서울 풀만', '뉴욕 셰프들', '미슐랭 2스타 셰프',
+    '성수동 베이글 맛집', '제철 과메기', "채소 '쪽파'", '2025 식품 외식 산업', '샘표 연구소',
+    '을지로 노포', '부산 돼지국밥', '비건 디저트', '전통주 양조장', '한우 오마카세',
+]
+TITLE_TOPICS = [
+    '페스티브 시즌 운영', '겨울 미식 프로모션', "'딸기 애프터눈 티' 출시", 'K-푸드 배우러 찾다',
+    '효능과 맛있게 먹는 법', '줄 서는 이유', "전망 '푸드테크'", '한식을 말하다', "'모던 할머니'의 손맛",
+    '신메뉴 공개', '연말 코스 예약 시작', '지역 상생 협약',
+]
+
+EVENT_NAMES = ['user_engagement', 'session_start', 'page_view']
+
+
+def latest_week_id(base_date=DEFAULT_BASE_DATE):
+    """base_date 기준 가장 최근 주차 번호 (cnc.weeks.week_ranges와 같은 주차 체계)"""
+    base_sunday = base_date - timedelta(days=base_date.weekday() + 1)
+    return (base_sunday - base_sunday.replace(month=1, day=1)).days // 7 + 1
+
+
+def _percent_strings(values):
+    return pd.Series(values).map('{:.2f}%'.format)
+
+
+def content_chunk(rng, start, n, base_date=DEFAULT_BASE_DATE):
+    """content_detail 합성 행 n개 (start는 page_path 고유 번호 시작값)"""
+    views = np.minimum(np.round(rng.lognormal(2.6, 1.1, n)), 5000).astype(np.int64) + 1
+    users = np.maximum(1, (views * rng.uniform(0.7, 0.95, n)).astype(np.int64))
+    sessions = (users * rng.uniform(1.0, 1.1, n)).round()
+    new_users = (sessions * rng.uniform(0.8, 1.0, n)).round()
+    missing = rng.random(n) < 0.018
+    sessions[missing] = np.nan
+    new_users[missing] = np.nan
+
+    base_sunday = base_date - timedelta(days=base_date.weekday() + 1)
+    year_start = np.datetime64(base_sunday.replace(month=1, day=1), 'm')
+    span_minutes = int((np.datetime64(base_sunday + timedelta(days=1), 'm') - year_start).astype(np.int64))
+    published = pd.Series(year_start + rng.integers(0, span_minutes, n).astype('timedelta64[m]'))
+
+    pairs = rng.integers(0, len(CATEGORIES), n)
+    prefixes = np.array(TITLE_PREFIXES, dtype=object)[rng.integers(0, len(TITLE_PREFIXES), n)]
+    subjects = np.array(TITLE_SUBJECTS, dtype=object)[rng.integers(0, len(TITLE_SUBJECTS), n)]
+    topics = np.array(TITLE_TOPICS, dtype=object)[rng.integers(0, len(TITLE_TOPICS), n)]
+
+    return pd.DataFrame({
+        'page_path': '/news/view/' + pd.Series(1065500000000000 + start + np.arange(n)).astype(str),
+        'total_views': views,
+        'total_users': users,
+        'avg_engagement_time_sec': rng.lognormal(2.8, 0.6, n).round(8),
+        'total_events': (views * rng.uniform(3.0, 4.0, n)).astype(np.int64),
+        'total_sessions': pd.array(sessions, dtype='Int64'),
+        'new_users_count': pd.array(new_users, dtype='Int64'),
+        'article_title': prefixes + subjects + ', ' + topics,
+        'writer_name': np.array(WRITERS, dtype=object)[rng.integers(0, len(WRITERS), n)],
+        'category_main': [CATEGORIES[i][0] for i in pairs],
+        'category_sub': [CATEGORIES[i][1] for i in pairs],
+        'publishing_datetime': published.dt.strftime('%Y-%m-%d %H:%M'),
+        'likes_count': rng.integers(0, 150, n),
+        'comments_count': rng.integers(0, 30, n),
+        'new_user_ratio_str': _percent_strings(rng.uniform(85, 100, n)),
+        'bounce_rate_str': np.where(missing, '43.00%', '0.00%'),
+        'scroll_90_count': (views * rng.uniform(0.3, 0.7, n)).astype(np.int64),
+    }, columns=CONTENT_COLUMNS)
+
+
+def event_frame(rng, rows, base_date=DEFAULT_BASE_DATE):
+    """event_summary 합성 시트 (주차 × 이벤트, 기사 규모에 비례한 이벤트 수)"""
+    weeks = np.arange(latest_week_id(base_date) + 1)
+    scale = rows / REAL_CONTENT_ROWS
+    frames = []
+    for event_name, mean in zip(EVENT_NAMES, (8000, 8800, 30000)):
+        frames.append(pd.DataFrame({
+            'week_id': weeks,
+            'event_count': (rng.normal(mean, mean * 0.1, len(weeks)) * scale).round().astype(np.int64),
+            'event_name': event_name,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def generate_master_sheets(out_dir, rows, seed=0, base_date=DEFAULT_BASE_DATE, chunk_rows=250_000):
+    """out_dir에 두 마스터 시트를 생성하고 (event 경로, content 경로) 반환"""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    event_path = os.path.join(out_dir, EVENT_SUMMARY_PATH)
+    content_path = os.path.join(out_dir, CONTENT_DETAIL_PATH)
+
+    event_frame(rng, rows, base_date).to_csv(event_path, index=False, encoding='utf-8-sig', lineterminator='\r\n')
+
+    # utf-8-sig 코덱은 파일 첫머리에만 BOM을 쓰므로 청크를 같은 핸들에 이어 씀
+    with open(content_path, 'w', encoding='utf-8-sig', newline='') as f:
+        for start in range(0, rows, chunk_rows):
+            n = min(chunk_rows, rows - start)
+            content_chunk(rng, start, n, base_date).to_csv(f, index=False, header=(start == 0), lineterminator='\r\n')
+    return event_path, content_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 마스터 시트 생성")
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument('--rows', type=int, help="content_detail 행 수")
+    size.add_argument('--scale', choices=list(SCALES), help="실제 시트 대비 배율")
+    parser.add_argument('--out', required=True, help="출력 폴더")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = args.rows or SCALES[args.scale]
+    event_path, content_path = generate_master_sheets(args.out, rows, seed=args.seed)
+    print(f"{rows:,}행 생성: {content_path}, {event_path}")
+
+
+if __name__ == '__main__':
+    main()
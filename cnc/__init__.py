@@ -0,0 +1 @@
+"""쿡앤셰프 주간 성과보고서 대시보드의 데이터 처리 모듈 모음"""
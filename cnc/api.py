@@ -0,0 +1,325 @@
+"""주간 집계 JSON 내보내기 (읽기 전용 HTTP 서비스)
+
+뉴스레터/광고 영업 등 다른 팀이 대시보드 화면 대신 기계가 읽을 수 있는 형태로 주간 지표를 가져가도록,
+대시보드와 같은 로드/가공 코드(cnc/shared.py의 감시자와 엔진)를 쓰는 작은 HTTP 서버를 띄웁니다.
+Streamlit 앱을 거치지 않으므로 요청마다 스크립트 전체가 다시 실행되지 않습니다.
+
+    python -m cnc.api --port 8600
+    curl http://localhost:8600/api/weeks/latest/kpis
+
+경로:
+    /api/weeks                        주차 목록 (week_id, 기간)
+    /api/weeks/<주차>/kpis            주간 KPI (PV, UV, 발행기사수, PV/UV) + 최근 12주 추이
+    /api/weeks/<주차>/top?n=10        해당 주 발행 기사 중 조회수 상위 N건 (최대 100)
+    /api/weeks/<주차>/categories      카테고리 × 세부카테고리 집계
+    /api/weeks/<주차>/writers         기자별 집계 (본명 기준, 필명 포함)
+    /api/health                       감시자 상태 (캐시하지 않음)
+    <주차>는 latest, 49, 49주 형식
+
+- 응답 본문은 (경로, 주차, 데이터 버전, 기준일)별로 한 번만 만들어 캐시하므로, 요청은 캐시 조회로 끝납니다.
+  최신 주차들은 서버 시작 시와 데이터가 바뀔 때마다 백그라운드에서 미리 만듭니다.
+- ETag는 (데이터 버전, 기준일)에서, Last-Modified는 원본 파일 수정시각과 기준일 0시 중 늦은 쪽에서 만들며,
+  If-None-Match / If-Modified-Since로 재검증하면 본문 없이 304를 돌려줍니다. 날짜가 바뀌면 파일이 그대로여도
+  주차 구간이 달라지므로 Last-Modified도 새 기준일 0시로 올라갑니다.
+"""
+import argparse
+import hashlib
+import json
+import sys
+import threading
+from datetime import datetime, time
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from cnc import snapshot
+from cnc.cache import VersionedCache
+from cnc.cube import rollup
+from cnc.shared import backend_from_env, shared_watcher
+from cnc.writers import leaderboard
+
+DEFAULT_PORT = 8600
+# top 경로의 n 기본값/상한
+DEFAULT_TOP_N = 10
+MAX_TOP_N = 100
+
+# TOP N 응답에 넣는 기사 필드 (마스터 시트 열 이름 그대로)
+ARTICLE_FIELDS = [
+    'page_path', 'article_title', 'writer_name', 'category_main', 'category_sub', 'publishing_datetime',
+    'total_views', 'total_users', 'likes_count', 'comments_count', 'scroll_90_count', 'avg_engagement_time_sec',
+]
+# 집계 응답의 합계 필드
+MEASURE_FIELDS = ['article_count', 'total_views', 'total_users', 'likes_count', 'comments_count', 'scroll_90_count']
+
+
+def _records(df):
+    """DataFrame -> JSON 레코드 목록 (결측은 null, 날짜는 ISO 8601)"""
+    return json.loads(df.to_json(orient='records', date_format='iso', force_ascii=False))
+
+
+def _with_avg_engagement(df):
+    """engagement_time_sum(체류시간 합계)을 방문자 가중 평균 체류시간(초)으로 변환"""
+    df = df.copy()
+    df['avg_engagement_time_sec'] = (df['engagement_time_sum'] / df['total_users'].where(df['total_users'] > 0)).round(1)
+    return df.drop(columns='engagement_time_sum')
+
+
+# ----------------- 응답 본문 (엔진, 주차 키, n) -> dict -----------------
+def kpis_payload(engine, selected_week, n=None):
+    week_num = int(selected_week[:2])
+    df_weekly = engine.get('weekly', selected_week)
+    # 발행기사수는 주차 큐브의 실제 기사 수 (df_weekly의 발행기사수는 시뮬레이션 값)
+    articles = int(engine.get('cube_week', selected_week)['article_count'].sum())
+    current = df_weekly[df_weekly['week_id'] == week_num]
+    pv = int(current['전체 조회수 (PV)'].iloc[0]) if len(current) else 0
+    uv = int(current['총 방문자수 (UV)'].iloc[0]) if len(current) else 0
+    trend = df_weekly[['week_id', '전체 조회수 (PV)', '총 방문자수 (UV)']].rename(
+        columns={'전체 조회수 (PV)': 'page_views', '총 방문자수 (UV)': 'visitors'})
+    df_daily = engine.get('daily', selected_week)
+    daily = None
+    if not df_daily.attrs.get('simulated', True):
+        daily = _records(df_daily.rename(columns={'날짜': 'date', '총 방문자수 (UV)': 'visitors',
+                                                 '전체 조회수 (PV)': 'page_views'}))
+    return {
+        'page_views': pv,
+        'visitors': uv,
+        'articles': articles,
+        'pv_per_uv': round(pv / uv, 2) if uv else None,
+        'missing_events': list(engine.get('missing_events', selected_week)),
+        'weekly_trend': _records(trend),
+        'daily': daily,
+    }
+
+
+def top_payload(engine, selected_week, n=DEFAULT_TOP_N):
+    df = engine.top_articles(int(selected_week[:2]), n)
+    df = df[[c for c in ARTICLE_FIELDS if c in df.columns]].reset_index(drop=True)
+    df.insert(0, 'rank', range(1, len(df) + 1))
+    return _records(df)
+
+
+def categories_payload(engine, selected_week, n=None):
+    cube_week = engine.get('cube_week', selected_week)
+    df = rollup(cube_week, ['category_main', 'category_sub'])
+    df = df.sort_values(['category_main', 'total_views'], ascending=[True, False], ignore_index=True)
+    return _records(_with_avg_engagement(df[['category_main', 'category_sub'] + MEASURE_FIELDS + ['engagement_time_sum']]))
+
+
+def writers_payload(engine, selected_week, n=None):
+    board = leaderboard(engine.get('writers', selected_week), '본명')
+    board = _with_avg_engagement(board.rename(columns={'본명': 'real_name', '필명': 'pen_names', '순위': 'rank'}))
+    return _records(board[['rank', 'real_name', 'pen_names'] + MEASURE_FIELDS + ['avg_engagement_time_sec']])
+
+
+WEEK_RESOURCES = {
+    'kpis': kpis_payload,
+    'top': top_payload,
+    'categories': categories_payload,
+    'writers': writers_payload,
+}
+
+
+class JsonApi:
+    """감시자의 현재 엔진 위에서 경로별 JSON 응답(본문, ETag, Last-Modified)을 만들고 캐시"""
+
+    def __init__(self, watcher, cache=None):
+        self.watcher = watcher
+        self.cache = cache if cache is not None else VersionedCache(max_entries=1024, ttl=None)
+        self._modified = {}  # (데이터 버전, 기준일) -> Last-Modified (epoch 초)
+        self._warmed = None  # 미리 만든 (데이터 버전, 기준일)
+        self._stop = threading.Event()
+
+    # ----------------- 캐시 키/검증자 -----------------
+    def last_modified(self, engine):
+        """원본 파일 중 가장 늦은 수정시각과 기준일 0시(로컬) 중 늦은 쪽 (epoch 초, 버전/기준일당 1회 계산)
+
+        기준일이 바뀌면 같은 파일에서도 응답(주차 구간)이 달라지므로 기준일을 함께 반영합니다.
+        """
+        key = (engine.version, engine.base_date)
+        if key not in self._modified:
+            mtimes = []
+            for path in (self.watcher.event_path, self.watcher.content_path) + self.watcher.optional_paths:
+                try:
+                    mtimes.append(snapshot.source_signature(path)['mtime_ns'] // 10**9)
+                except (FileNotFoundError, TypeError):
+                    continue
+            if engine.base_date is not None:
+                mtimes.append(int(datetime.combine(engine.base_date, time()).timestamp()))
+            self._modified[key] = max(mtimes, default=0)
+        return self._modified[key]
+
+    def _entry(self, engine, key, make):
+        """(본문 바이트, ETag) - 데이터 버전/기준일이 같으면 캐시에서"""
+        def compute():
+            body = json.dumps(make(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            tag = hashlib.sha1(repr((engine.version, str(engine.base_date)) + key).encode('utf-8')).hexdigest()[:20]
+            return body, f'"{tag}"'
+        return self.cache.get_or_compute(('api',) + key + (engine.version, engine.base_date), compute)
+
+    # ----------------- 경로 처리 -----------------
+    @staticmethod
+    def _week_key(engine, token):
+        """'latest' / '49' / '49주' -> week_map 키 (없으면 None)"""
+        if token == 'latest':
+            return next(iter(engine.week_map), None)
+        digits = token[:-1] if token.endswith('주') else token
+        if not digits.isdigit():
+            return None
+        key = f"{int(digits):02d}주"
+        return key if key in engine.week_map else None
+
+    def resolve(self, engine, path, query):
+        """경로 -> (캐시 키, 본문 생성 함수) 또는 (HTTP 상태, 오류 메시지)"""
+        parts = [p for p in path.split('/') if p]
+        if parts == ['api', 'weeks']:
+            return ('weeks',), lambda: [{'week': k, 'week_id': int(k[:2]), 'period': v} for k, v in engine.week_map.items()]
+        if len(parts) != 4 or parts[:2] != ['api', 'weeks'] or parts[3] not in WEEK_RESOURCES:
+            return HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {path}"
+        selected_week = self._week_key(engine, parts[2])
+        if selected_week is None:
+            return HTTPStatus.NOT_FOUND, f"없는 주차: {parts[2]}"
+
+        resource = parts[3]
+        n = None
+        if resource == 'top':
+            try:
+                n = int(query.get('n', [DEFAULT_TOP_N])[0])
+            except ValueError:
+                return HTTPStatus.BAD_REQUEST, "n은 정수여야 합니다"
+            if not 1 <= n <= MAX_TOP_N:
+                return HTTPStatus.BAD_REQUEST, f"n은 1~{MAX_TOP_N} 범위여야 합니다"
+
+        def make():
+            return {
+                'week': selected_week,
+                'week_id': int(selected_week[:2]),
+                'period': engine.week_map[selected_week],
+                'data_version': engine.version,
+                'data': WEEK_RESOURCES[resource](engine, selected_week, n),
+            }
+        return (resource, selected_week, n), make
+
+    def respond(self, path, query, headers):
+        """요청 -> (상태, 응답 헤더, 본문)"""
+        if path.rstrip('/') == '/api/health':
+            return HTTPStatus.OK, {'Cache-Control': 'no-store'}, self._json(self.watcher.status())
+        engine = self.watcher.get()
+        if engine is None:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {}, self._json({'error': f"데이터 로드 실패: {self.watcher.last_error}"})
+
+        key, make = self.resolve(engine, path, query)
+        if isinstance(key, HTTPStatus):
+            return key, {}, self._json({'error': make})
+        body, etag = self._entry(engine, key, make)
+        modified = self.last_modified(engine)
+        response_headers = {
+            'ETag': etag,
+            'Last-Modified': formatdate(modified, usegmt=True),
+            'Cache-Control': 'no-cache',
+        }
+        if self._not_modified(headers, etag, modified):
+            return HTTPStatus.NOT_MODIFIED, response_headers, b''
+        return HTTPStatus.OK, response_headers, body
+
+    @staticmethod
+    def _not_modified(headers, etag, modified):
+        """재검증 요청이 현재 버전과 같은지 (If-None-Match가 있으면 그것만 봄)"""
+        if_none_match = headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [t.strip() for t in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+        if_modified_since = headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= modified
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def _json(value):
+        return json.dumps(value, ensure_ascii=False, default=str).encode('utf-8')
+
+    # ----------------- 미리 만들기 -----------------
+    def warm(self, weeks=4):
+        """현재 엔진의 최신 weeks개 주차 응답을 모두 만들어 둠 (새로 만든 응답 수 반환)"""
+        engine = self.watcher.get()
+        if engine is None or self._warmed == (engine.version, engine.base_date):
+            return 0
+        paths = ['/api/weeks'] + [f"/api/weeks/{key[:2]}/{resource}"
+                                  for key in list(engine.week_map)[:weeks] for resource in WEEK_RESOURCES]
+        misses = self.cache.misses
+        for path in paths:
+            key, make = self.resolve(engine, path, {})
+            self._entry(engine, key, make)
+        self._warmed = (engine.version, engine.base_date)
+        return self.cache.misses - misses
+
+    def start_warmer(self, weeks=4):
+        """감시자가 엔진을 바꿀 때마다(확인 주기마다 검사) 최신 주차 응답을 다시 만드는 스레드"""
+        def run():
+            while not self._stop.wait(self.watcher.interval):
+                try:
+                    self.warm(weeks)
+                except Exception as e:  # 미리 만들기 실패는 요청 시 다시 계산되므로 기록만
+                    print(f"API 응답 미리 만들기 실패: {type(e).__name__}: {e}", file=sys.stderr)
+        threading.Thread(target=run, name='cnc-api-warmer', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+
+def make_handler(api):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = 'cnc-api'
+
+        def _send(self, with_body):
+            url = urlsplit(self.path)
+            status, headers, body = api.respond(unquote(url.path), parse_qs(url.query), self.headers)
+            self.send_response(status)
+            if status != HTTPStatus.NOT_MODIFIED:
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            if with_body and status != HTTPStatus.NOT_MODIFIED:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            self._send(True)
+
+        def do_HEAD(self):
+            self._send(False)
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주간 집계 JSON 내보내기 서버 (읽기 전용)")
+    parser.add_argument('--host', default='127.0.0.1', help="바인딩 주소 (기본: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    parser.add_argument('--weeks', type=int, default=4, help="미리 만들어 둘 최신 주차 수 (기본: 4)")
+    parser.add_argument('--backend', choices=['csv', 'sqlite', 'stream'], default=None, help="저장소 백엔드 (기본: CNC_BACKEND)")
+    args = parser.parse_args(argv)
+
+    watcher = shared_watcher(backend=args.backend or backend_from_env())
+    if watcher.get() is None:
+        parser.error(f"마스터 시트 로드 실패: {watcher.last_error}")
+    api = JsonApi(watcher)
+    print(f"응답 {api.warm(args.weeks)}개 미리 생성, http://{args.host}:{args.port}/api/weeks 에서 제공")
+    api.start_warmer(args.weeks)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(api))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
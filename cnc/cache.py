@@ -0,0 +1,100 @@
+"""데이터 버전 기반 결과 캐시
+
+st.cache_data는 호출할 때마다 인자(수만 행의 DataFrame)를 해시해 캐시 키를 만들기 때문에,
+데이터가 커질수록 캐시 조회 자체가 느려집니다. 여기서는 호출 측이 (선택 주차, 데이터 버전)
+같은 작은 키를 직접 넘기고, 항목 수/TTL 제한과 적중 통계를 함께 관리합니다.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_nbytes(value):
+    """캐시 항목이 차지하는 대략적인 메모리(바이트)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class VersionedCache:
+    """LRU + TTL 결과 캐시 (스레드 안전, 적중/미스/퇴출/메모리 통계 제공)
+
+    반환값은 복사하지 않고 그대로 공유하므로 호출 측에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_entries=32, ttl=3600, sizeof=estimate_nbytes, max_bytes=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.max_bytes = max_bytes  # 보유 항목 메모리 합계 상한 (None이면 항목 수로만 제한)
+        self._entries = OrderedDict()  # key -> (만료 시각, 바이트, 값)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 반환하고, 없거나 만료되었으면 compute()로 계산해 저장"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            if entry is not None:
+                # TTL 만료
+                del self._entries[key]
+                self._bytes -= entry[1]
+                self.evictions += 1
+            self.misses += 1
+
+        # 계산은 락 밖에서 수행 (다른 키 조회를 막지 않음)
+        value = compute()
+        expires_at = time.monotonic() + self.ttl if self.ttl else float('inf')
+
+        nbytes = self.sizeof(value)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (expires_at, nbytes, value)
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes):
+                _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """적중/미스/퇴출 횟수와 보유 항목 수 및 메모리"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
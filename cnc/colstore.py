@@ -0,0 +1,223 @@
+"""content_detail 수치 열의 메모리 매핑 저장소 (워커 프로세스 간 공유) - 선택 사항
+
+프록시 뒤에 대시보드 프로세스를 여러 개 띄우면 프로세스마다 기사 지표 열을 따로 들고 있습니다.
+수치 열(조회/방문/이벤트/세션/신규방문/좋아요/댓글/스크롤 수, 평균체류시간, 비율, 발행일시)을
+CSV 옆 `<이름>.columns/` 폴더에 열마다 .npy 파일 하나로 내보내고, 각 프로세스는 np.load(mmap_mode='r')로
+복사 없이 열어 DataFrame 열로 씁니다. 파일 내용은 OS 페이지 캐시에 한 벌만 올라가 모든 워커가 공유하므로
+워커를 늘려도 이 열들만큼의 메모리는 더 들지 않습니다.
+
+    content_detail_master_sheet.columns/
+        v1-15395-s1a2b3c4d/             버전 폴더 (형식-행 수-원본 상태 또는 열 내용 crc32)
+            columns.json                열 목록
+            total_views.npy
+            total_sessions.npy          nullable 정수 열은 값(결측 0)과
+            total_sessions.mask.npy     결측 마스크를 따로 저장
+
+- 버전 이름이 데이터로 정해지므로 같은 데이터를 읽은 워커는 같은 폴더를 열고, 처음 본 데이터일 때만
+  내보냅니다. 임시 이름으로 다 쓴 뒤 이름을 바꾸므로 다른 워커는 반쯤 쓴 폴더를 보지 않습니다.
+- 증분 로더(cnc/incremental.py)는 원본 상태(offset까지의 해시)와 행 수로 버전 이름을 정하므로 열 내용을
+  다시 해시하지 않습니다. 다만 새 버전은 열 전체를 다시 내보내므로, 행이 추가될 때마다 (호스트당 한 번)
+  수치 열 크기만큼 디스크에 씁니다. 원본 파싱보다는 훨씬 싸지만 꼬리 크기가 아니라 전체 행 수에 비례합니다.
+- 새 버전을 내보내도 최근 KEEP_VERSIONS개(현재 + 직전) 버전 폴더는 남기고 그보다 오래된 것만 지웁니다.
+  아직 직전 데이터를 읽고 있는 워커가 그 버전을 다시 열거나 새로 뜬 워커가 이어받을 수 있습니다.
+  이미 매핑한 워커는 (POSIX에서) 지워진 파일도 계속 읽습니다.
+- 폴더에 쓸 수 없으면(읽기 전용 NAS) 기존처럼 프로세스 메모리의 열을 그대로 씁니다.
+- 매핑된 열은 읽기 전용입니다. 수정하는 연산은 pandas Copy-on-Write가 먼저 복사합니다.
+
+워커를 여러 개 띄우는 배포에서만 이득이므로 기본은 꺼져 있습니다.
+켜기: CNC_COLUMN_STORE=1
+"""
+import json
+import os
+import shutil
+import threading
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from cnc.schema import COUNT_COLUMNS, FLOAT_COLUMNS, NULLABLE_COUNT_COLUMNS, RATIO_COLUMNS
+
+# 저장 형식이 바뀌면 올려서 기존 버전 폴더를 다시 만듭니다.
+COLUMN_STORE_FORMAT_VERSION = 1
+MANIFEST_NAME = 'columns.json'
+MASK_SUFFIX = '.mask'
+# 남겨 둘 최근 버전 폴더 수 (현재 + 직전)
+KEEP_VERSIONS = 2
+
+COLUMN_STORE_ENV = 'CNC_COLUMN_STORE'
+
+SHARED_COLUMNS = (['publishing_datetime'] + COUNT_COLUMNS + NULLABLE_COUNT_COLUMNS + FLOAT_COLUMNS
+                  + list(RATIO_COLUMNS.values()))
+
+
+def column_store_enabled():
+    """CNC_COLUMN_STORE가 켜져 있는지 (기본 꺼짐)"""
+    return os.environ.get(COLUMN_STORE_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def column_dir(csv_path):
+    """CSV 경로에 대응하는 열 저장소 폴더 경로"""
+    base, _ = os.path.splitext(csv_path)
+    return base + '.columns'
+
+
+def numeric_arrays(df):
+    """공유할 열 -> {파일 이름: ndarray} (nullable 정수 열은 값/마스크 두 배열, 없는 열은 건너뜀)"""
+    arrays = {}
+    for col in SHARED_COLUMNS:
+        if col not in df:
+            continue
+        values = df[col].array
+        if isinstance(values, pd.arrays.IntegerArray):
+            arrays[col] = values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=0)
+            arrays[col + MASK_SUFFIX] = np.asarray(values.isna())
+        else:
+            arr = df[col].to_numpy()
+            if arr.dtype.kind in 'iufbM':
+                arrays[col] = arr
+    return arrays
+
+
+def content_token(df, arrays):
+    """행 수 + 공유 열 내용의 crc32 -> 버전 이름"""
+    crc = 0
+    for name in sorted(arrays):
+        crc = zlib.crc32(name.encode(), crc)
+        crc = zlib.crc32(np.ascontiguousarray(arrays[name]).view(np.uint8), crc)
+    return f"v{COLUMN_STORE_FORMAT_VERSION}-{len(df)}-{crc:08x}"
+
+
+def source_token(df, source):
+    """행 수 + 원본 상태(cnc.incremental.source_state) + 공유 열 dtype -> 버전 이름 (열 내용은 읽지 않음)
+
+    같은 원본 앞부분을 같은 전처리로 읽은 워커는 같은 이름을 얻습니다. dtype을 함께 넣어
+    전처리(스키마)가 바뀐 배포에서는 이전 폴더를 쓰지 않습니다.
+    """
+    dtypes = [(col, str(df[col].dtype)) for col in SHARED_COLUMNS if col in df]
+    crc = zlib.crc32(f"{source['offset']}:{source['prefix_sha1']}:{dtypes}".encode())
+    return f"v{COLUMN_STORE_FORMAT_VERSION}-{len(df)}-s{crc:08x}"
+
+
+class ColumnStore:
+    """수치 열을 버전 폴더의 .npy로 내보내고 메모리 매핑으로 여는 저장소 (스레드 안전)"""
+
+    def __init__(self, root):
+        self.root = root
+        self.persistent = True  # False면 쓸 수 없는 폴더: 더 시도하지 않고 메모리 열 사용
+        self.last_mode = None  # 'mapped' | 'exported' | 'memory'
+        self.version = None
+        self._lock = threading.Lock()
+
+    def _path(self, version, name=''):
+        return os.path.join(self.root, version, name)
+
+    # ----------------- 내보내기 / 열기 -----------------
+    def _export(self, version, arrays):
+        """버전 폴더를 임시 이름으로 쓴 뒤 교체 (다른 워커가 먼저 만들었으면 그것을 씀)"""
+        tmp = os.path.join(self.root, f".{version}.tmp-{os.getpid()}-{threading.get_ident()}")
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            for name, arr in arrays.items():
+                np.save(os.path.join(tmp, name + '.npy'), arr, allow_pickle=False)
+            with open(os.path.join(tmp, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump({'schema': COLUMN_STORE_FORMAT_VERSION, 'files': sorted(arrays)}, f)
+            os.rename(tmp, self._path(version))
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(self._path(version)):
+                raise
+
+    def _open(self, version, rows):
+        """버전 폴더의 배열을 읽기 전용 매핑으로 열기 (없거나 손상되었으면 None)"""
+        try:
+            with open(self._path(version, MANIFEST_NAME), encoding='utf-8') as f:
+                files = json.load(f)['files']
+            arrays = {name: np.load(self._path(version, name + '.npy'), mmap_mode='r', allow_pickle=False)
+                      for name in files}
+        except (OSError, ValueError, KeyError):
+            return None
+        if any(len(arr) != rows for arr in arrays.values()):
+            return None
+        return arrays
+
+    def _prune(self, keep):
+        """현재 버전과 그다음 최근 KEEP_VERSIONS - 1개를 뺀 버전 폴더 삭제 (다른 워커의 임시 폴더는 건드리지 않음)"""
+        others = []
+        for name in os.listdir(self.root):
+            if name == keep or name.startswith('.'):
+                continue
+            try:
+                others.append((os.stat(self._path(name)).st_mtime_ns, name))
+            except OSError:
+                continue
+        for _, name in sorted(others, reverse=True)[KEEP_VERSIONS - 1:]:
+            shutil.rmtree(self._path(name), ignore_errors=True)
+
+    # ----------------- 공유 -----------------
+    def share(self, df, source=None):
+        """df의 수치 열을 저장소의 메모리 매핑 배열로 바꾼 DataFrame (처음 본 데이터면 먼저 내보냄)
+
+        source(증분 로더의 원본 상태)를 넘기면 열 내용 대신 그것으로 버전 이름을 정하므로,
+        이미 내보낸 버전을 여는 워커는 열을 읽지 않습니다. 쓸 수 없는 폴더이면 df를 그대로 반환합니다.
+        """
+        with self._lock:
+            if not self.persistent:
+                self.last_mode = 'memory'
+                return df
+            arrays = None
+            if source:
+                version = source_token(df, source)
+            else:
+                arrays = numeric_arrays(df)
+                if not arrays:
+                    self.last_mode = 'memory'
+                    return df
+                version = content_token(df, arrays)
+            mapped = self._open(version, len(df))
+            mode = 'mapped'
+            if mapped is None:
+                if arrays is None:
+                    arrays = numeric_arrays(df)
+                if not arrays:
+                    self.last_mode = 'memory'
+                    return df
+                try:
+                    os.makedirs(self.root, exist_ok=True)
+                    self._export(version, arrays)
+                    self._prune(version)
+                except OSError:
+                    self.persistent = False
+                    self.last_mode = 'memory'
+                    return df
+                mapped = self._open(version, len(df))
+                mode = 'exported'
+            if mapped is None:
+                self.last_mode = 'memory'
+                return df
+
+            columns = {}
+            for name, arr in mapped.items():
+                if name.endswith(MASK_SUFFIX):
+                    continue
+                if name + MASK_SUFFIX in mapped:
+                    arr = pd.arrays.IntegerArray(arr, mapped[name + MASK_SUFFIX])
+                # assign + copy=False로 넘겨야 매핑 배열을 복사하지 않고 열로 씀 (df[col] = arr는 복사)
+                columns[name] = pd.Series(arr, index=df.index, name=name, copy=False)
+            self.last_mode, self.version = mode, version
+            df = df.assign(**columns)
+        release_arrow_memory()
+        return df
+
+
+def release_arrow_memory():
+    """pyarrow 메모리 풀이 붙잡고 있는 여유 메모리를 OS에 반환
+
+    Parquet 스냅샷을 읽은 버퍼는 열을 매핑 배열로 바꾼 뒤에도 풀(mimalloc/jemalloc)에 남아
+    워커마다 RSS로 잡히므로, 교체 직후 한 번 비웁니다.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return
+    pa.default_memory_pool().release_unused()
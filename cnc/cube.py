@@ -0,0 +1,100 @@
+"""주차 × 카테고리 × 세부카테고리 × 기자 집계 큐브
+
+데이터 버전마다 한 번만 만들어 두고, 카테고리/기자 탭은 원본 기사 행을
+다시 groupby 하지 않고 선택 주차의 큐브 조각만 합산합니다.
+큐브 크기는 (주차 수 × 카테고리 × 기자) 조합 수에 비례하므로 기사 수와 무관합니다.
+"""
+import pandas as pd
+
+from cnc.schema import concat_frames
+from cnc.weeks import assign_week_ids
+
+CUBE_DIMENSIONS = ['week_id', 'category_main', 'category_sub', 'writer_name']
+
+# 큐브 측정값: 이름 -> (원본 컬럼, 집계 함수)
+CUBE_MEASURES = {
+    'article_count': ('page_path', 'size'),
+    'total_views': ('total_views', 'sum'),
+    'total_users': ('total_users', 'sum'),
+    'likes_count': ('likes_count', 'sum'),
+    'comments_count': ('comments_count', 'sum'),
+    'scroll_90_count': ('scroll_90_count', 'sum'),
+    # 평균체류시간 × 방문자수 = 총 체류시간(초). 합산 후 total_users로 나누면 가중 평균
+    'engagement_time_sum': ('engagement_time_sum', 'sum'),
+}
+
+
+def measure_frame(df_content, key, values):
+    """집계 키 열(key: values) + 차원 + 측정값 원본 열로 이루어진 프레임 (groupby 직전 형태)"""
+    df = pd.DataFrame({
+        key: values,
+        # .array: 카테고리 dtype(코드)을 유지한 채 인덱스 정렬 없이 가져옴
+        'category_main': df_content['category_main'].array,
+        'category_sub': df_content['category_sub'].array,
+        'writer_name': df_content['writer_name'].array,
+        'page_path': df_content['page_path'].array,
+    })
+    # 원본은 int32로 축소되어 있으므로 합산 전에 int64로 넓힘 (큐브는 작아서 메모리 부담 없음)
+    for col in ['total_views', 'total_users', 'likes_count', 'comments_count', 'scroll_90_count']:
+        df[col] = pd.to_numeric(df_content[col], errors='coerce').fillna(0).to_numpy(dtype='int64')
+    df['engagement_time_sum'] = (
+        pd.to_numeric(df_content['avg_engagement_time_sec'], errors='coerce').fillna(0).to_numpy() * df['total_users']
+    )
+    return df
+
+
+def build_weekly_cube(df_content, ranges):
+    """기사 행을 발행 주차별로 묶어 큐브 생성"""
+    columns = CUBE_DIMENSIONS + list(CUBE_MEASURES)
+    if df_content.empty or not ranges:
+        return pd.DataFrame(columns=columns)
+
+    df = measure_frame(df_content, 'week_id', assign_week_ids(df_content['publishing_datetime'], ranges))
+    df = df[df['week_id'] >= 0]
+    cube = df.groupby(CUBE_DIMENSIONS, observed=True, sort=True).agg(**CUBE_MEASURES).reset_index()
+    return cube[columns]
+
+
+# ----------------- 발행일 큐브 (청크 스트리밍 로드용, cnc/stream.py) -----------------
+# 주차 구간은 기준일에 따라 바뀌므로 발행일 단위로 접어 두고, 주차 큐브는 조회 시 일 -> 주차로 다시 묶음
+DAILY_CUBE_DIMENSIONS = ['date'] + CUBE_DIMENSIONS[1:]
+
+
+def build_daily_cube(df_content):
+    """기사 행(전체 또는 청크)을 발행일별로 묶은 큐브 (발행일시가 없는 행은 제외)"""
+    columns = DAILY_CUBE_DIMENSIONS + list(CUBE_MEASURES)
+    dates = df_content['publishing_datetime'].dt.normalize().array
+    df = measure_frame(df_content, 'date', dates)
+    df = df[df['date'].notna()]
+    if df.empty:
+        return pd.DataFrame({col: pd.Series(dtype=df[col].dtype) for col in columns})
+    cube = df.groupby(DAILY_CUBE_DIMENSIONS, observed=True, sort=False).agg(**CUBE_MEASURES).reset_index()
+    return cube[columns]
+
+
+def merge_daily_cubes(cubes):
+    """발행일 큐브 조각들을 하나로 합산 (측정값은 모두 합계이므로 다시 더하면 됨)"""
+    return rollup(concat_frames(cubes), DAILY_CUBE_DIMENSIONS)
+
+
+def weekly_from_daily(daily_cube, ranges):
+    """발행일 큐브 -> 주차 큐브 (build_weekly_cube와 같은 형태)"""
+    columns = CUBE_DIMENSIONS + list(CUBE_MEASURES)
+    if daily_cube.empty or not ranges:
+        return pd.DataFrame(columns=columns)
+
+    df = daily_cube.drop(columns='date')
+    df.insert(0, 'week_id', assign_week_ids(daily_cube['date'], ranges))
+    df = df[df['week_id'] >= 0]
+    cube = df.groupby(CUBE_DIMENSIONS, observed=True, sort=True)[list(CUBE_MEASURES)].sum().reset_index()
+    return cube[columns]
+
+
+def slice_week(cube, week_id):
+    """선택 주차의 큐브 조각"""
+    return cube[cube['week_id'] == week_id]
+
+
+def rollup(cube_slice, by):
+    """큐브 조각을 주어진 차원으로 재집계"""
+    return cube_slice.groupby(by, observed=True, sort=False)[list(CUBE_MEASURES)].sum().reset_index()
@@ -0,0 +1,211 @@
+"""일별 지표 (UV/PV 등) 월별 파티션 저장소
+
+파이프라인이 하루에 한 행씩 일별 지표 파일 끝에 추가합니다.
+
+    daily_metrics.csv
+        date, uv, pv[, new_users, sessions, ...]
+        2025-12-08, 1234, 2012
+        2025-12-09, 1301, 2240
+
+CSV 옆의 `daily_metrics/` 폴더에 월마다 `YYYY-MM.parquet` 파티션 하나로 나눠 저장하고,
+주차/임의 기간 조회는 그 기간이 걸친 달의 파티션만 읽습니다. 몇 년 치가 쌓여도 한 주 조회는
+파일 한두 개(각 최대 31행)만 읽습니다.
+
+- 원본 CSV의 어디까지 반영했는지(offset, 크기·수정 시각, 헤더/앞부분 해시)를 `_manifest.json`에 기록해 두고,
+  파일 끝에 새 행이 붙었으면 그 꼬리만 파싱해 해당 달 파티션만 다시 씁니다 (지난 달은 그대로).
+- 앞부분이 바뀌었거나 파일이 줄었으면 전체를 다시 나눠 씁니다.
+- 같은 날짜가 다시 들어오면 나중 행으로 교체합니다.
+- 파티션 폴더에 쓸 수 없으면(읽기 전용 NAS) 나눈 파티션을 메모리에만 두고 같은 방식으로 조회합니다.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from cnc import snapshot
+from cnc.incremental import complete_lines, prefix_hash, resume_point, source_state
+
+# 파티션 형식이 바뀌면 올려서 기존 파티션을 다시 만듭니다.
+DAILY_FORMAT_VERSION = 1
+MANIFEST_NAME = '_manifest.json'
+
+
+def partition_dir(csv_path):
+    """일별 지표 CSV에 대응하는 파티션 폴더 경로"""
+    base, _ = os.path.splitext(csv_path)
+    return base
+
+
+def parse_daily_csv(data):
+    """일별 지표 CSV(바이트) 파싱: date는 날짜, 나머지 열은 숫자 (날짜가 없는 행은 버림)"""
+    df = pd.read_csv(io.BytesIO(data), encoding='utf-8-sig')
+    df['date'] = pd.to_datetime(df['date'], errors='coerce').dt.normalize()
+    df = df.dropna(subset=['date'])
+    for col in df.columns.drop('date'):
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    # 같은 날짜는 나중 행 하나만
+    return df.drop_duplicates('date', keep='last').sort_values('date', ignore_index=True)
+
+
+def month_keys(start, end):
+    """start~end(포함) 기간이 걸친 달 목록 ('YYYY-MM')"""
+    months = pd.period_range(pd.Timestamp(start).to_period('M'), pd.Timestamp(end).to_period('M'), freq='M')
+    return [str(m) for m in months]
+
+
+class DailyMetricsStore:
+    """월별 파티션 폴더 위의 일별 지표 저장소 (스레드 안전)"""
+
+    def __init__(self, root):
+        self.root = root
+        self.persistent = True  # False면 파티션을 메모리에만 보관
+        self.last_mode = None  # 'full' | 'append' | 'unchanged'
+        self.last_months = []  # 마지막 동기화에서 다시 쓴 달
+        self._frames = {}  # 'YYYY-MM' -> (파티션 파일 수정시각 또는 None, DataFrame)
+        self._manifest = None
+        self._hashed = None  # 마지막으로 기록한 위치까지 넣은 hashlib 객체 (다음 동기화 때 꼬리만 더함)
+        self._lock = threading.Lock()
+
+    # ----------------- 파티션 -----------------
+    def _path(self, month):
+        return os.path.join(self.root, f"{month}.parquet")
+
+    def months(self):
+        """저장된 달 목록 (오름차순)"""
+        names = set(self._frames) if not self.persistent else set()
+        if self.persistent and os.path.isdir(self.root):
+            names.update(n[:-len('.parquet')] for n in os.listdir(self.root) if n.endswith('.parquet'))
+        return sorted(names)
+
+    def _partition(self, month):
+        """한 달 파티션 (없으면 None, 파일이 바뀌지 않았으면 읽어 둔 프레임 재사용)"""
+        cached = self._frames.get(month)
+        if cached is not None and cached[0] is None:
+            return cached[1]
+        try:
+            mtime = os.stat(self._path(month)).st_mtime_ns
+        except OSError:
+            return None
+        if cached is None or cached[0] != mtime:
+            cached = self._frames[month] = (mtime, pd.read_parquet(self._path(month)))
+        return cached[1]
+
+    def _write(self, month, df):
+        """한 달 파티션을 임시 파일에 쓴 뒤 교체 (쓸 수 없으면 메모리에만 보관)"""
+        if self.persistent:
+            try:
+                os.makedirs(self.root, exist_ok=True)
+                snapshot.write_parquet(self._path(month), df)
+                self._frames[month] = (os.stat(self._path(month)).st_mtime_ns, df)
+                return
+            except (ImportError, OSError, ValueError):
+                self.persistent = False
+        self._frames[month] = (None, df)
+
+    def append(self, df_new, merge=True):
+        """새 일별 행을 날짜가 속한 달 파티션에만 병합 (같은 날짜는 새 행으로 교체, 다시 쓴 달 목록 반환)
+
+        merge=False면 기존 파티션 내용을 버리고 새 행으로 덮어씁니다.
+        """
+        months = df_new['date'].dt.strftime('%Y-%m')
+        written = []
+        for month, df_month in df_new.groupby(months, sort=True):
+            df_old = self._partition(month) if merge else None
+            if df_old is not None:
+                df_old = df_old[~df_old['date'].isin(df_month['date'])]
+                df_month = pd.concat([df_old, df_month], ignore_index=True)
+            self._write(month, df_month.sort_values('date', ignore_index=True))
+            written.append(month)
+        return written
+
+    def _replace_all(self, df):
+        """전체 다시 쓰기 (원본에 없는 달 파티션은 삭제)"""
+        keep = set(df['date'].dt.strftime('%Y-%m'))
+        for month in self.months():
+            if month not in keep:
+                self._frames.pop(month, None)
+                if self.persistent:
+                    try:
+                        os.remove(self._path(month))
+                    except OSError:
+                        pass
+        return self.append(df, merge=False)
+
+    # ----------------- 원본 CSV 동기화 -----------------
+    def _manifest_path(self):
+        return os.path.join(self.root, MANIFEST_NAME)
+
+    def _read_manifest(self):
+        if not self.persistent:
+            return self._manifest
+        try:
+            with open(self._manifest_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, manifest):
+        self._manifest = manifest
+        if not self.persistent:
+            return
+        try:
+            snapshot.write_json(self._manifest_path(), manifest)
+        except OSError:
+            self.persistent = False
+
+    def sync(self, csv_path):
+        """원본 CSV에서 아직 반영하지 않은 꼬리만 파티션에 반영 (앞부분이 바뀌었으면 전체)"""
+        with self._lock:
+            with open(csv_path, 'rb') as f:
+                size = snapshot.source_signature(csv_path)['size']
+                header = f.readline()
+                manifest = self._read_manifest()
+                valid = manifest if manifest and manifest.get('schema') == DAILY_FORMAT_VERSION else None
+                offset, verified = resume_point(f, size, header, valid)
+
+                if offset is not None:
+                    f.seek(offset)
+                    tail = complete_lines(f.read())
+                    self.last_mode = 'append' if tail else 'unchanged'
+                    self.last_months = self.append(parse_daily_csv(header + tail)) if tail else []
+                    if tail:
+                        # 앞부분 해시(확인 중 계산했거나 지난 동기화에서 이어 온 것)에 꼬리만 더함
+                        # (다른 프로세스가 매니페스트를 바꿨으면 이어 온 해시는 쓰지 않음)
+                        carried = self._hashed
+                        if carried is not None and carried.hexdigest() != valid['prefix_sha1']:
+                            carried = None
+                        hashed = (verified or carried or prefix_hash(f, offset)).copy()
+                        hashed.update(tail)
+                    offset += len(tail)
+                else:
+                    f.seek(0)
+                    data = complete_lines(f.read())
+                    self.last_mode = 'full'
+                    self.last_months = self._replace_all(parse_daily_csv(data))
+                    hashed = hashlib.sha1(data)
+                    offset = len(data)
+
+                if self.last_mode != 'unchanged':
+                    self._hashed = hashed
+                    self._write_manifest({'schema': DAILY_FORMAT_VERSION,
+                                          **source_state(f, header, offset, hashed=hashed)})
+            return self
+
+    # ----------------- 조회 -----------------
+    def read(self, start, end, columns=None):
+        """start~end(포함) 날짜의 일별 행 (그 기간이 걸친 달 파티션만 읽음, 날짜 오름차순)"""
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        with self._lock:
+            frames = [df for df in (self._partition(m) for m in month_keys(start, end)) if df is not None]
+        if not frames:
+            return pd.DataFrame({'date': pd.Series(dtype='datetime64[ns]')})
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        dates = df['date'].to_numpy(dtype='datetime64[ns]')
+        lo = np.searchsorted(dates, start.to_datetime64(), side='left')
+        hi = np.searchsorted(dates, end.to_datetime64(), side='right')
+        df = df.iloc[lo:hi]
+        return df if columns is None else df[['date'] + [c for c in columns if c in df.columns]]
@@ -0,0 +1,412 @@
+"""주간 보고서 데이터 엔진 (Streamlit 없이 사용 가능)
+
+대시보드, 정적 보고서 생성기(cnc/report.py) 등이 같은 가공 로직을 공유합니다.
+엔진은 로드된 마스터 시트와 데이터 버전을 들고 있으며, 주차별 가공 항목을
+(항목, 주차, 데이터 버전) 키로, 완성된 차트를 (차트 id, 주차, 데이터 버전) 키로 캐시합니다.
+"""
+import threading
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from cnc import figures
+from cnc.cache import VersionedCache
+from cnc.cube import build_weekly_cube, slice_week
+from cnc.events import REQUIRED_EVENTS, EventMatrix
+from cnc.formatting import mmss
+from cnc.loader import (CONTENT_DETAIL_PATH, DAILY_METRICS_PATH, EVENT_SUMMARY_PATH, HOURLY_VIEWS_PATH, PEN_NAMES_PATH,
+                        TRAFFIC_HITS_PATH, data_version, read_daily_metrics, read_master_sheets, read_pen_names,
+                        read_traffic, read_view_curves)
+from cnc.search import TitleIndex, query_terms
+from cnc.weeks import WeekIndex, generate_week_map, week_ranges
+from cnc.writers import writer_table
+
+
+class ReportEngine:
+    """로드된 마스터 시트 위에서 주차별 보고서 데이터를 만드는 엔진"""
+
+    def __init__(self, df_event, df_content, version=None, base_date=None, cache=None, figure_cache=None,
+                 view_curves=None, daily_metrics=None, traffic=None, pen_names=None):
+        self.df_event = df_event
+        self.df_content = df_content
+        self.version = version
+        self.base_date = base_date
+        self.week_map = generate_week_map(df_event, base_date)
+        self.week_ranges = week_ranges(df_event, base_date)
+        self.cache = cache if cache is not None else VersionedCache(max_entries=64, ttl=None)
+        self.figure_cache = figure_cache if figure_cache is not None else figures.figure_cache()
+        self.view_curves = view_curves  # 기사별 시간대 누적 조회수 (cnc/timeseries.py, 없으면 None)
+        self.daily_metrics = daily_metrics  # 일별 지표 월별 파티션 (cnc/daily.py, 없으면 None)
+        self.traffic = traffic  # 유입경로 채널별 합계 표 (cnc/traffic.py, 없으면 None)
+        self.pen_names = pen_names  # 기자 필명-본명 매핑 (cnc/writers.py, 없으면 None)
+
+        self._lock = threading.Lock()
+        self._week_index = None
+        self._cube = None
+        self._event_matrix = None
+        self._title_index = None
+
+    # ----------------- 파생 인덱스 (최초 사용 시 1회 생성) -----------------
+    @property
+    def week_index(self):
+        """발행일시 주차 경계 인덱스 (프레임 복사 없이 주차 행 슬라이스)"""
+        with self._lock:
+            if self._week_index is None:
+                self._week_index = WeekIndex(self.df_content, self.week_ranges)
+            return self._week_index
+
+    @property
+    def cube(self):
+        """주차 × 카테고리 × 기자 집계 큐브"""
+        with self._lock:
+            if self._cube is None:
+                self._cube = build_weekly_cube(self.df_content, self.week_ranges)
+            return self._cube
+
+    @property
+    def event_matrix(self):
+        """주차 × 이벤트 밀집 행렬 (event_summary 피벗)"""
+        with self._lock:
+            if self._event_matrix is None:
+                self._event_matrix = EventMatrix(self.df_event)
+            return self._event_matrix
+
+    @property
+    def title_index(self):
+        """기사 제목 바이그램 역색인 (cnc/search.py)"""
+        with self._lock:
+            if self._title_index is None:
+                self._title_index = TitleIndex.build(self.df_content['article_title'])
+            return self._title_index
+
+    def prepare(self, previous=None):
+        """파생 인덱스를 미리 모두 만들어 둠 (백그라운드 교체 전, 요청 경로 밖에서 호출)
+
+        previous(직전 데이터 버전의 엔진)를 넘기면 제목 색인은 새로 추가된 행만 색인합니다.
+        """
+        if previous is not None and previous._title_index is not None and previous.df_content is not None:
+            with self._lock:
+                self._title_index = previous._title_index.update(
+                    previous.df_content['article_title'], self.df_content['article_title'])
+        self.week_index
+        self.cube
+        self.event_matrix
+        self.title_index
+        return self
+
+    # ----------------- 주차별 기사 조회 (저장소 백엔드가 재정의, cnc/store.py) -----------------
+    def has_content(self):
+        return not self.df_content.empty
+
+    def top_articles(self, week_id, n):
+        """해당 주차 발행 기사 중 전체 조회수 상위 n건 (동점이면 발행순)"""
+        return self.week_index.rows(week_id).nlargest(n, 'total_views')
+
+    def cube_week(self, week_id):
+        """해당 주차의 카테고리 × 기자 집계 큐브 조각"""
+        return slice_week(self.cube, week_id)
+
+    def search_articles(self, query, n):
+        """제목에 검색어의 모든 단어가 들어간 기사 중 전체 조회수 상위 n건 (동점이면 발행순)"""
+        rows = self.title_index.search(query, self.df_content['article_title'],
+                                       self.df_content['total_views'].to_numpy(), n)
+        return self.df_content.iloc[rows]
+
+    def daily_range(self, start, end, columns=None):
+        """start~end(포함) 날짜의 일별 지표 (그 기간이 걸친 달 파티션만 읽음, 일별 지표가 없으면 None)"""
+        if self.daily_metrics is None:
+            return None
+        return self.daily_metrics.read(start, end, columns)
+
+    # ----------------- 가공 데이터 조회 -----------------
+    def get(self, name, selected_week):
+        """선택 주차의 가공 데이터 한 항목 (캐시 공유, 반환값은 수정하지 말 것)"""
+        # 같은 데이터 버전이라도 기준일이 바뀌면 주차 구간이 달라지므로 키에 포함
+        return self.cache.get_or_compute(
+            (name, selected_week, self.version, self.base_date),
+            lambda: FILTERED_DATA_BUILDERS[name](self, selected_week)
+        )
+
+    def search(self, query, n=50):
+        """제목 검색 결과 (보고서 컬럼명, 캐시 공유, 반환값은 수정하지 말 것)"""
+        return self.cache.get_or_compute(
+            ('search', ' '.join(query_terms(query)), n, self.version),
+            lambda: build_search_results(self, query, n)
+        )
+
+    def figure(self, chart_id, selected_week, make):
+        """선택 주차의 차트 (그림 캐시 공유, 없으면 make()로 생성, 반환값은 수정하지 말 것)"""
+        return self.figure_cache.get_or_compute(
+            (chart_id, selected_week, self.version, self.base_date), make
+        )
+
+
+def load_engine(event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, base_date=None, cache=None,
+                backend='csv', db_path=None, loader=None, figure_cache=None, hourly_path=HOURLY_VIEWS_PATH,
+                daily_path=DAILY_METRICS_PATH, traffic_path=TRAFFIC_HITS_PATH, pen_names_path=PEN_NAMES_PATH):
+    """마스터 시트를 읽어 엔진 생성
+
+    backend='sqlite'이면 마스터 시트를 내장 DB 파일에 적재해 두고 주차별 조회를 쿼리로 처리합니다.
+    loader(AppendOnlyCsvLoader)를 넘기면 content_detail은 지난번 이후 추가된 행만 읽습니다.
+    hourly_path의 시간대 조회수 스냅샷이 있으면 Top10 시간대 추이에 실제 값을 사용합니다.
+    daily_path의 일별 지표가 있으면 새 행을 월별 파티션에 반영하고 주간 일별 차트에 실제 값을 사용합니다.
+    traffic_path의 유입경로 원본이 있으면 새 행만 채널별 합계 표로 집계해 접근경로 분석에 사용합니다.
+    pen_names_path의 필명-본명 매핑이 있으면 기자별 분석에 본명/필명을 함께 표시합니다.
+    backend='stream'이면 content_detail을 청크로 읽어 보관 기간 안의 발행일 큐브/주별 TOP K/최근 행만 남깁니다 (cnc/stream.py).
+    """
+    version = data_version(event_path, content_path, hourly_path, daily_path, traffic_path, pen_names_path)
+    view_curves = read_view_curves(hourly_path)
+    daily_metrics = read_daily_metrics(daily_path)
+    traffic = read_traffic(traffic_path)
+    pen_names = read_pen_names(pen_names_path)
+    if backend == 'sqlite':
+        from cnc.store import load_sqlite_engine
+        return load_sqlite_engine(event_path, content_path, db_path, base_date=base_date, cache=cache, version=version,
+                                  figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                                  traffic=traffic, pen_names=pen_names)
+    if backend == 'stream':
+        from cnc.stream import load_streaming_engine
+        return load_streaming_engine(event_path, content_path, base_date=base_date, cache=cache, version=version,
+                                     figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                                     traffic=traffic, pen_names=pen_names)
+    df_event, df_content = read_master_sheets(event_path, content_path, loader=loader)
+    return ReportEngine(df_event, df_content, version=version, base_date=base_date, cache=cache,
+                        figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                        traffic=traffic, pen_names=pen_names)
+
+
+# ----------------------------------------------------
+# 1. 주별 데이터 (df_weekly) 생성 (핵심 매칭)
+# ----------------------------------------------------
+def build_weekly_data(engine, selected_week):
+    week_num = int(selected_week[:2])
+    if engine.df_event.empty:
+        return pd.DataFrame(columns=['week_id', '전체 조회수 (PV)', '총 방문자수 (UV)', '발행기사수', '주차'])
+
+    # 1-1. 선택 주차부터 최신 12주 구간 (주차 × 이벤트 행렬 슬라이스)
+    # 1-2. UV/PV (시트에 없는 이벤트는 0, 누락 여부는 'missing_events' 항목으로 표시)
+    df_weekly = engine.event_matrix.window(week_num, 12, list(REQUIRED_EVENTS)).rename(columns=REQUIRED_EVENTS)
+    for col in REQUIRED_EVENTS.values():
+        df_weekly[col] = df_weekly[col].round().astype('int64')
+
+    # 1-3. 발행기사수 시뮬레이션 (마스터 시트에 발행기사수 컬럼이 없음)
+    # 발행기사수 = PV의 약 1~2% 수준으로 임의 시뮬레이션
+    np.random.seed(week_num)
+    df_weekly['발행기사수'] = (df_weekly['전체 조회수 (PV)'] * np.random.uniform(0.01, 0.02, len(df_weekly))).astype(int)
+
+    # 1-4. 표시용 최종 정리 (week_id 내림차순)
+    df_weekly['주차'] = df_weekly['week_id'].astype(int).astype(str).str.zfill(2) + '주'
+    return df_weekly
+
+
+def build_missing_events(engine, selected_week):
+    """주별 성과 요약에 필요한데 event_summary에 없는 이벤트 이름 목록"""
+    return engine.event_matrix.missing(REQUIRED_EVENTS)
+
+
+# ----------------------------------------------------
+# 2. 일별 데이터 (df_daily) 생성 (일별 지표 파일이 없으면 시뮬레이션)
+# ----------------------------------------------------
+# 일별 지표 파일 열 -> 보고서 컬럼명
+DAILY_COLUMNS = {
+    'uv': '총 방문자수 (UV)',
+    'pv': '전체 조회수 (PV)',
+}
+
+
+def build_daily_data(engine, selected_week):
+    week_num = int(selected_week[:2])
+    if engine.daily_metrics is not None and week_num in engine.week_ranges:
+        # 선택 주차 기간이 걸친 달 파티션만 읽고, 지표가 없는 날은 빈 값(NaN)으로 표시
+        start, end = engine.week_ranges[week_num]
+        df_days = engine.daily_range(start, end, list(DAILY_COLUMNS)).set_index('date')
+        dates = pd.date_range(start, end)
+        df_daily = df_days.reindex(dates).reindex(columns=list(DAILY_COLUMNS)).rename(columns=DAILY_COLUMNS)
+        df_daily.insert(0, '날짜', dates.strftime('%Y-%m-%d'))
+        df_daily.attrs['simulated'] = False
+        return df_daily.reset_index(drop=True)
+
+    np.random.seed(week_num)
+    dates = pd.date_range(end=engine.week_map[selected_week].split(' ~ ')[1].replace('.', '-'), periods=7)
+    df_daily = pd.DataFrame({
+        '날짜': dates.strftime('%Y-%m-%d'),
+        '총 방문자수 (UV)': np.random.randint(1000, 1500, 7),
+        '전체 조회수 (PV)': np.random.randint(1500, 2500, 7)
+    })
+    df_daily.attrs['simulated'] = True
+    return df_daily
+
+
+# ----------------------------------------------------
+# 3. 유입경로 데이터 (df_traffic_current/last) (유입경로 원본이 없으면 시뮬레이션)
+# ----------------------------------------------------
+def build_traffic_data(engine, selected_week):
+    week_num = int(selected_week[:2])
+    if engine.traffic is not None and week_num in engine.week_ranges:
+        # 채널 × 날짜 합계 표에서 선택 주차/직전주 기간만 합산
+        start, end = (pd.Timestamp(d) for d in engine.week_ranges[week_num])
+        last_start, last_end = start - pd.Timedelta(days=7), end - pd.Timedelta(days=7)
+        df_traffic_curr = engine.traffic.channel_views(start, end)
+        df_traffic_last = engine.traffic.channel_views(last_start, last_end)
+        df_traffic_curr.attrs['simulated'] = False
+        return df_traffic_curr, df_traffic_last
+
+    df_weekly = engine.get('weekly', selected_week)
+    sources = ['네이버', '직접', '구글', '페이스북', '다음', '기타']
+
+    # 이번주/지난주 트래픽 변화 시뮬레이션
+    np.random.seed(week_num)
+    # PV 계산 시 안전 장치 추가
+    current_pv_series = df_weekly[df_weekly['week_id'] == week_num]['전체 조회수 (PV)']
+    current_pv = current_pv_series.iloc[0] if not current_pv_series.empty else 15000
+
+    # 이번 주
+    traffic_current = np.random.multinomial(int(current_pv), [0.35, 0.15, 0.15, 0.10, 0.05, 0.20])
+    df_traffic_curr = pd.DataFrame({'유입경로': sources, '조회수': traffic_current})
+
+    # 지난 주
+    last_week_pv_series = df_weekly[df_weekly['week_id'] == week_num - 1]['전체 조회수 (PV)']
+    last_week_pv = last_week_pv_series.iloc[0] if not last_week_pv_series.empty else current_pv * 0.9
+    np.random.seed(week_num + 1)
+    traffic_last = np.random.multinomial(int(last_week_pv), [0.33, 0.17, 0.14, 0.11, 0.05, 0.20])
+    df_traffic_last = pd.DataFrame({'유입경로': sources, '조회수': traffic_last})
+
+    df_traffic_curr.attrs['simulated'] = True
+    return df_traffic_curr, df_traffic_last
+
+
+# ----------------------------------------------------
+# 4. 인기 기사 TOP 10 (df_top10) 생성 (핵심 매칭)
+# ----------------------------------------------------
+# 발행 후 누적 조회수를 표시할 경과시간
+TREND_HOURS = [12, 24, 48]
+
+# 마스터 시트 열 -> 보고서 컬럼명
+ARTICLE_COLUMNS = {
+    'total_views': '전체조회수',
+    'total_users': '전체방문자수',
+    'likes_count': '좋아요',
+    'comments_count': '댓글',
+    'scroll_90_count': '스크롤90%',
+    'article_title': '제목',
+    'writer_name': '작성자',
+    'category_main': '카테고리',
+    'category_sub': '세부카테고리',
+    'publishing_datetime': '발행일시'
+}
+
+
+def build_top10_data(engine, selected_week):
+    week_num = int(selected_week[:2])
+    if not engine.has_content():
+        return pd.DataFrame()
+
+    # 4-1. 선택 주차에 발행된 기사 중 TOP 10 (정렬된 발행일시 인덱스의 연속 구간 또는 DB 쿼리)
+    # 4-2. 해당 행만 보고서 컬럼명으로 변환
+    df_top10 = engine.top_articles(week_num, 10).fillna(0).rename(columns=ARTICLE_COLUMNS)
+
+    # 4-3. 순위 부여 (해당 주 발행 기사가 10건 미만일 수 있음)
+    df_top10['순위'] = range(1, len(df_top10) + 1)
+
+    # 4-4. 비율(0~1) -> 퍼센트 값 (표시 형식은 렌더링 시 지정)
+    df_top10['신규방문자비율'] = df_top10['new_user_ratio'] * 100
+    df_top10['이탈률'] = df_top10['bounce_rate'] * 100
+
+    # 4-5. '평균체류시간' 계산 (초 -> M:SS 형식)
+    df_top10['평균체류시간'] = mmss(df_top10['avg_engagement_time_sec'])
+
+    # 4-6. '12시간', '24시간', '48시간' 발행 후 누적 조회수
+    if engine.view_curves is not None:
+        # 시간대 조회수 스냅샷의 실제 값 (아직 도달 전/수집 전이면 빈 값)
+        at_hours = engine.view_curves.views_at(df_top10['page_path'], df_top10['발행일시'], TREND_HOURS)
+        for i, hours in enumerate(TREND_HOURS):
+            df_top10[f'{hours}시간'] = pd.array(np.round(at_hours[:, i]), dtype='Int64')
+    else:
+        # 스냅샷 파일이 없으면 기존 Streamlit 시뮬레이션 로직 재현
+        df_top10['12시간'] = (df_top10['전체조회수'] * 0.4).astype(int)
+        df_top10['24시간'] = (df_top10['전체조회수'] * 0.7).astype(int)
+        df_top10['48시간'] = df_top10['전체조회수']
+
+    return df_top10
+
+
+def build_top10_curves_data(engine, selected_week):
+    """TOP 10 기사의 발행 후 0~48시간 누적 조회수 곡선 (긴 형식, 스냅샷 파일이 없으면 None)"""
+    df_top10 = engine.get('top10', selected_week)
+    if engine.view_curves is None or df_top10.empty:
+        return None
+    df_curves = engine.view_curves.curves(df_top10['page_path'], df_top10['발행일시'], max(TREND_HOURS))
+    labels = df_top10['순위'].astype(str).to_numpy() + '. ' + df_top10['제목'].astype(str).str.slice(0, 15).to_numpy()
+    df_curves.insert(0, '기사', labels[df_curves.pop('article').to_numpy()])
+    return df_curves.dropna(subset=['누적조회수'])
+
+
+def build_top5_sources_data(engine, selected_week):
+    """TOP 5 기사별 유입경로 조회수 (긴 형식: 기사제목, 유입경로, 조회수)"""
+    top5 = engine.get('top10', selected_week).head(5)
+    if top5.empty:
+        return pd.DataFrame(columns=['기사제목', '유입경로', '조회수'])
+    short_titles = top5['제목'].astype(str).map(lambda t: (t[:12] + '..') if len(t) > 12 else t)
+
+    if engine.traffic is not None:
+        # 채널 × 기사 합계 표에서 TOP 5 기사 행만 조회
+        df_pages = engine.traffic.page_channels(top5['page_path'])
+        df_bar = pd.DataFrame({
+            '기사제목': df_pages['page_path'].map(dict(zip(top5['page_path'].astype(str), short_titles))),
+            '유입경로': df_pages['channel'],
+            '조회수': df_pages['views'],
+        })
+        df_bar.attrs['simulated'] = False
+        return df_bar.reset_index(drop=True)
+
+    # 유입경로 원본이 없으면 전체조회수 기준 시뮬레이션 (프로세스마다 달라지는 hash() 대신 고정 시드)
+    data_bar = []
+    for idx, short_title, total in zip(top5.index, short_titles, top5['전체조회수']):
+        for ch in ['네이버', '구글', 'SNS', '기타']:
+            np.random.seed(idx + zlib.crc32(ch.encode()) % 100 + int(total % 100))
+            data_bar.append({'기사제목': short_title, '유입경로': ch, '조회수': int(total * np.random.rand() * 0.4)})
+    df_bar = pd.DataFrame(data_bar, columns=['기사제목', '유입경로', '조회수'])
+    df_bar.attrs['simulated'] = True
+    return df_bar
+
+
+# ----------------------------------------------------
+# 5. 카테고리/기자 집계 (주차 큐브의 선택 주차 조각)
+# ----------------------------------------------------
+def build_cube_week_data(engine, selected_week):
+    return engine.cube_week(int(selected_week[:2]))
+
+
+def build_writers_data(engine, selected_week):
+    """선택 주차 (본명, 필명)별 기자 집계표 (7번/8번 탭 공용)"""
+    df_writers = writer_table(engine.get('cube_week', selected_week), engine.pen_names)
+    df_writers.attrs['pen_names'] = engine.pen_names is not None
+    return df_writers
+
+
+# ----------------------------------------------------
+# 6. 기사 제목 검색 (전체 기간, 주차와 무관)
+# ----------------------------------------------------
+def build_search_results(engine, query, n):
+    if not engine.has_content() or not query_terms(query):
+        return pd.DataFrame(columns=['순위'] + list(ARTICLE_COLUMNS.values()) + ['평균체류시간'])
+
+    # 제목 바이그램 색인(또는 DB 전문 검색)으로 찾은 기사 중 전체 조회수 상위 n건
+    df_found = engine.search_articles(query, n).fillna(0).rename(columns=ARTICLE_COLUMNS)
+    df_found['순위'] = range(1, len(df_found) + 1)
+    df_found['평균체류시간'] = mmss(df_found['avg_engagement_time_sec'])
+    return df_found
+
+
+FILTERED_DATA_BUILDERS = {
+    'weekly': build_weekly_data,
+    'missing_events': build_missing_events,
+    'daily': build_daily_data,
+    'traffic': build_traffic_data,
+    'top10': build_top10_data,
+    'top10_curves': build_top10_curves_data,
+    'top5_sources': build_top5_sources_data,
+    'cube_week': build_cube_week_data,
+    'writers': build_writers_data,
+}
@@ -0,0 +1,65 @@
+"""event_summary 마스터 시트의 주차 × 이벤트 밀집 행렬
+
+event_summary는 (week_id, event_count, event_name) 긴 형식이라, 주별 PV/UV가 필요할 때마다
+이벤트 이름으로 거르고 병합해야 했습니다. 데이터 버전마다 한 번 week_id × event_name
+2차원 배열로 피벗해 두고, 이벤트별 시계열과 최근 N주 구간은 배열 슬라이스로 답합니다.
+
+같은 (week_id, event_name) 행이 여러 번 있으면 합산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+# 주별 성과 요약에 필요한 이벤트 (없으면 해당 지표가 0으로 표시됨)
+REQUIRED_EVENTS = {
+    'page_view': '전체 조회수 (PV)',
+    'session_start': '총 방문자수 (UV)',
+}
+
+
+class EventMatrix:
+    """week_id(오름차순) × event_name 이벤트 수 행렬"""
+
+    def __init__(self, df_event):
+        valid = df_event[df_event['week_id'] >= 0] if not df_event.empty else df_event
+        weeks = pd.to_numeric(valid['week_id']).to_numpy(dtype=np.int64) if len(valid) else np.array([], dtype=np.int64)
+        names = valid['event_name'].astype(str).to_numpy() if len(valid) else np.array([], dtype=object)
+        counts = pd.to_numeric(valid['event_count'], errors='coerce').fillna(0).to_numpy(dtype=np.float64) if len(valid) else np.array([])
+
+        self.weeks, week_pos = np.unique(weeks, return_inverse=True)
+        self.events, event_pos = np.unique(names, return_inverse=True)
+        self.values = np.zeros((len(self.weeks), len(self.events)))
+        np.add.at(self.values, (week_pos, event_pos), counts)
+        self._event_col = {str(name): i for i, name in enumerate(self.events)}
+
+    def has_event(self, event_name):
+        return event_name in self._event_col
+
+    def missing(self, event_names=REQUIRED_EVENTS):
+        """시트에 한 행도 없는 이벤트 이름 목록"""
+        return [name for name in event_names if not self.has_event(name)]
+
+    def series(self, event_name):
+        """이벤트의 주차별 수 (week_id 인덱스, 시트에 없는 이벤트는 KeyError)"""
+        if not self.has_event(event_name):
+            raise KeyError(f"event_summary에 '{event_name}' 이벤트가 없습니다.")
+        return pd.Series(self.values[:, self._event_col[event_name]], index=pd.Index(self.weeks, name='week_id'),
+                         name=event_name)
+
+    def window(self, week_id, n_weeks, event_names):
+        """week_id부터 과거로 n_weeks개 주차의 이벤트 수 (week_id 내림차순, 없는 이벤트는 0)
+
+        week_id가 시트에 없으면 가장 최근 주차를 기준으로 합니다.
+        """
+        if len(self.weeks) == 0:
+            return pd.DataFrame(columns=['week_id'] + list(event_names))
+
+        pos = int(np.searchsorted(self.weeks, week_id))
+        if pos >= len(self.weeks) or self.weeks[pos] != week_id:
+            pos = len(self.weeks) - 1
+        rows = slice(max(0, pos - n_weeks + 1), pos + 1)
+
+        data = {'week_id': self.weeks[rows][::-1]}
+        for name in event_names:
+            col = self._event_col.get(name)
+            data[name] = self.values[rows, col][::-1] if col is not None else np.zeros(rows.stop - rows.start)
+        return pd.DataFrame(data)
@@ -0,0 +1,137 @@
+"""보고서 차트(plotly Figure) 생성
+
+plotly(특히 plotly.express는 수백 개 하위 모듈)는 가져오는 데만 수백 ms가 걸리므로 모듈 맨 위가 아니라
+각 차트 함수 안에서 가져옵니다. 차트 섹션이 실제로 그려질 때(그림 캐시에 없을 때) 처음 한 번만
+비용이 들고, 차트를 쓰지 않는 프로세스(JSON API, 첫 화면의 제목/주차 선택)는 plotly를 읽지 않습니다.
+"""
+import sys
+
+import numpy as np
+
+from cnc.cache import VersionedCache
+from cnc.theme import CHART_PALETTE, COLOR_GREY, COLOR_NAVY, COLOR_RED
+
+# 그림 캐시 메모리 상한 (figure_nbytes 추정치 합계 기준)
+FIGURE_CACHE_MAX_BYTES = 32 * 2**20
+# 트레이스에서 행 수만큼 커지는 데이터 배열 속성
+TRACE_ARRAY_KEYS = ('x', 'y', 'z', 'values', 'labels', 'parents', 'ids', 'text', 'hovertext', 'customdata')
+# 레이아웃/트레이스 스타일 등 데이터 배열 외의 대략적인 고정 크기
+FIGURE_BASE_BYTES = 8 * 1024
+TRACE_BASE_BYTES = 2 * 1024
+
+
+# ----------------- 그림 캐시 -----------------
+def _array_nbytes(value):
+    if value is None or isinstance(value, str):
+        return 0
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return int(value.nbytes)
+    # 문자열/객체 배열은 원소 크기 합 (튜플, 리스트, object ndarray)
+    return sum(sys.getsizeof(v) for v in np.ravel(value))
+
+
+def figure_nbytes(fig):
+    """figure 메모리 크기 추정 (트레이스 데이터 배열 크기 합 + 고정분, 직렬화하지 않음)"""
+    total = FIGURE_BASE_BYTES
+    for trace in fig.data:
+        total += TRACE_BASE_BYTES
+        for key in TRACE_ARRAY_KEYS:
+            if key in trace:
+                total += _array_nbytes(trace[key])
+    return total
+
+
+def figure_cache(max_bytes=FIGURE_CACHE_MAX_BYTES):
+    """완성된 Figure를 (차트 id, 주차, 데이터 버전, 기준일) 키로 보관하는 LRU 캐시
+
+    재실행마다 px/go로 Figure를 다시 만들고 검증하는 비용을 없앱니다. Figure 객체 그대로
+    보관해야 st.plotly_chart가 dict spec을 다시 검증하지 않습니다. 반환값은 수정하지 말 것.
+    """
+    return VersionedCache(max_entries=512, ttl=None, sizeof=figure_nbytes, max_bytes=max_bytes)
+
+
+# ----------------- 차트 -----------------
+
+
+def create_donut_chart_with_val(df, names, values, title):
+    import plotly.express as px
+
+    fig = px.pie(df, names=names, values=values, hole=0.5, color_discrete_sequence=CHART_PALETTE)
+    fig.update_traces(
+        textinfo='label+percent+value',
+        textposition='outside',
+        texttemplate='%{label}<br>%{value:,}건<br>(%{percent})'
+    )
+    fig.update_layout(
+        title=dict(text=title, x=0.5, font=dict(size=16)),
+        showlegend=False,
+        margin=dict(t=40, b=20, l=40, r=40),
+    )
+    return fig
+
+
+def daily_visitors_bar(df_daily):
+    """주간 일별 방문자 및 조회수 (묶음 막대)"""
+    import plotly.express as px
+
+    df_melt = df_daily.melt(id_vars='날짜', var_name='구분', value_name='수치')
+    fig = px.bar(df_melt, x='날짜', y='수치', color='구분', barmode='group',
+                 color_discrete_map={'총 방문자수 (UV)': COLOR_GREY, '전체 조회수 (PV)': COLOR_NAVY})
+    fig.update_layout(legend=dict(orientation="v", y=1, x=1.02), plot_bgcolor='white', margin=dict(t=0))
+    return fig
+
+
+def weekly_traffic_combo(df_weekly):
+    """주별 UV/PV 막대 + 발행기사수 꺾은선 (보조축)"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=df_weekly['주차'], y=df_weekly['총 방문자수 (UV)'], name='UV', marker_color=COLOR_GREY))
+    fig.add_trace(go.Bar(x=df_weekly['주차'], y=df_weekly['전체 조회수 (PV)'], name='PV', marker_color=COLOR_NAVY))
+    fig.add_trace(go.Scatter(x=df_weekly['주차'], y=df_weekly['발행기사수'], name='발행기사수',
+                             yaxis='y2', mode='lines+markers', line=dict(color=COLOR_RED, width=3)))
+    fig.update_layout(
+        yaxis=dict(title='수치(건)'),
+        yaxis2=dict(overlaying='y', side='right', title='발행기사수'),
+        legend=dict(orientation="v", y=1, x=1.05),
+        plot_bgcolor='white', barmode='group', margin=dict(t=0)
+    )
+    return fig
+
+
+def article_source_bar(df_bar):
+    """기사별 유입경로 조회수 (가로 누적 막대)"""
+    import plotly.express as px
+
+    fig = px.bar(df_bar, y='기사제목', x='조회수', color='유입경로',
+                 orientation='h', text_auto=',', color_discrete_sequence=CHART_PALETTE)
+    fig.update_layout(
+        plot_bgcolor='white',
+        yaxis={'categoryorder': 'total ascending'},
+        legend=dict(orientation="h", y=-0.2)
+    )
+    return fig
+
+
+def category_count_bar(df, x, color, showlegend=True):
+    """카테고리별 기사 수 막대"""
+    import plotly.express as px
+
+    fig = px.bar(df, x=x, y='기사수', text_auto=True, color=color, color_discrete_sequence=CHART_PALETTE)
+    fig.update_layout(showlegend=showlegend, plot_bgcolor='white')
+    return fig
+
+
+def view_curves_line(df_curves):
+    """기사별 발행 후 경과시간별 누적 조회수 (꺾은선)"""
+    import plotly.express as px
+
+    fig = px.line(df_curves, x='경과시간', y='누적조회수', color='기사', color_discrete_sequence=CHART_PALETTE)
+    fig.update_layout(
+        xaxis=dict(title='발행 후 경과시간(시간)', dtick=6),
+        yaxis=dict(title='누적 조회수'),
+        plot_bgcolor='white',
+        legend=dict(orientation="v", y=1, x=1.02),
+        margin=dict(t=10),
+    )
+    return fig
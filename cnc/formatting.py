@@ -0,0 +1,65 @@
+"""표 표시 형식 (숫자/비율/체류시간)
+
+표의 값은 숫자 그대로 두고, 대시보드에서는 렌더링 시점에 st.column_config로 형식을
+지정합니다. 셀마다 파이썬으로 문자열을 만들지 않으며 그리드의 숫자 정렬도 유지됩니다.
+정적 보고서처럼 문자열이 꼭 필요한 경우에만 format_frame으로 열 단위 변환합니다.
+
+형식 이름:
+    'int'      천 단위 콤마 정수        12,345
+    'pct'      소수 1자리 퍼센트        35.2%
+    'pct2'     소수 2자리 퍼센트        91.50%
+    'pct_int'  정수 퍼센트              40%
+    'pp'       부호 있는 퍼센트포인트   +1.3%p
+    'duration' 초 -> MM:SS             02:45
+"""
+import pandas as pd
+
+# 형식 이름 -> st.column_config.NumberColumn format
+NUMBER_FORMATS = {
+    'int': 'localized',
+    'pct': '%.1f%%',
+    'pct2': '%.2f%%',
+    'pct_int': '%d%%',
+    'pp': '%+.1f%%p',
+}
+
+
+def _numeric(series):
+    return pd.to_numeric(series, errors='coerce').fillna(0)
+
+
+def mmss(seconds):
+    """초 -> 'MM:SS' 문자열 (0 패딩이므로 문자열 정렬 = 시간 정렬)"""
+    total = _numeric(seconds).round().astype('int64')
+    return (total // 60).astype(str).str.zfill(2) + ':' + (total % 60).astype(str).str.zfill(2)
+
+
+# 형식 이름 -> 열 단위 문자열 변환 (정적 출력용)
+STRING_FORMATTERS = {
+    # 결측(아직 집계 전 등)은 빈 칸
+    'int': lambda s: pd.to_numeric(s, errors='coerce').map(lambda v: '' if pd.isna(v) else f'{round(v):,}'),
+    'pct': lambda s: _numeric(s).map('{:.1f}%'.format),
+    'pct2': lambda s: _numeric(s).map('{:.2f}%'.format),
+    'pct_int': lambda s: _numeric(s).round().astype('int64').astype(str) + '%',
+    'pp': lambda s: _numeric(s).map('{:+.1f}%p'.format),
+    'duration': mmss,
+}
+
+
+def column_config(formats):
+    """{열 이름: 형식 이름} -> st.dataframe(column_config=...) 인자"""
+    import streamlit as st
+
+    return {
+        col: st.column_config.NumberColumn(format=NUMBER_FORMATS[fmt])
+        for col, fmt in formats.items() if fmt in NUMBER_FORMATS
+    }
+
+
+def format_frame(df, formats):
+    """{열 이름: 형식 이름}에 따라 해당 열만 문자열로 바꾼 사본 (정적 출력용)"""
+    out = df.copy()
+    for col, fmt in formats.items():
+        if col in out.columns:
+            out[col] = STRING_FORMATTERS[fmt](out[col])
+    return out
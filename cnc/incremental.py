@@ -0,0 +1,212 @@
+"""append-only 마스터 시트를 위한 증분 로더
+
+파이프라인은 content_detail 마스터 시트 끝에 새 기사 행만 추가합니다.
+마지막으로 읽은 바이트 위치(offset)와 행 수를 기억해 두고, 다음 갱신 때는
+그 뒤에 붙은 꼬리 부분만 파싱하여 키(page_path) 기준으로 병합(upsert)합니다.
+
+파일 크기와 수정 시각이 기록과 같으면 다시 읽지 않습니다. 둘 중 하나라도 바뀌었으면
+offset 앞부분 전체의 해시를 기록과 비교하고, 헤더나 앞쪽 행이 바뀌었거나(같은 크기로 덮어쓴 경우 포함)
+파일이 줄어들었으면 전체를 다시 읽습니다. 해시는 파싱보다 수십 배 빠르지만 파일 크기에 비례합니다.
+"""
+import hashlib
+import io
+import os
+import threading
+
+import pandas as pd
+
+from cnc import snapshot
+from cnc.schema import concat_frames
+
+# 앞부분 해시를 계산할 때 한 번에 읽는 크기
+HASH_BLOCK_BYTES = 1 << 20
+
+
+def _digest(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def complete_lines(data):
+    """줄바꿈으로 끝나는 완결된 행까지만 잘라냄 (쓰는 중인 마지막 행 제외)"""
+    return data[:data.rfind(b'\n') + 1]
+
+
+def extend_hash(f, hashed, start, end):
+    """앞 start 바이트를 넣은 hashlib 객체에 파일의 [start, end) 바이트를 더한 새 객체 (hashed는 그대로)"""
+    h = hashed.copy()
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        block = f.read(min(HASH_BLOCK_BYTES, remaining))
+        if not block:
+            break
+        h.update(block)
+        remaining -= len(block)
+    return h
+
+
+def prefix_hash(f, offset):
+    """파일 앞 offset 바이트(헤더 포함) 전체를 넣은 hashlib 객체"""
+    return extend_hash(f, hashlib.sha1(), 0, offset)
+
+
+def prefix_digest(f, offset):
+    """파일 앞 offset 바이트(헤더 포함) 전체의 해시"""
+    return prefix_hash(f, offset).hexdigest()
+
+
+# source_state가 기록하는 키 (스냅샷/파티션 메타에 그대로 저장)
+SOURCE_STATE_KEYS = ('offset', 'size', 'mtime_ns', 'header_sha1', 'prefix_sha1')
+
+
+def source_state(f, header, offset, hashed=None):
+    """offset까지 반영했다는 기록 (파일 크기/수정 시각, 헤더와 앞부분 해시 포함, 메타 파일에 저장)
+
+    hashed: 앞 offset 바이트를 이미 넣은 hashlib 객체가 있으면 파일을 다시 읽지 않음
+    """
+    stat = os.fstat(f.fileno())
+    digest = hashed.hexdigest() if hashed is not None else prefix_digest(f, offset)
+    return {'offset': offset, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+            'header_sha1': _digest(header), 'prefix_sha1': digest}
+
+
+def resume_point(f, size, header, state):
+    """appended_offset과 같되 (offset, 확인하며 계산한 앞부분 hashlib 객체) 반환
+
+    크기와 수정 시각이 기록 그대로여서 해시하지 않았으면 hashlib 객체는 None입니다. 호출 측은 이 객체에
+    새 꼬리만 더해(extend_hash) 다음 source_state(hashed=)에 넘기면 앞부분을 다시 읽지 않습니다.
+    """
+    if not state or any(key not in state for key in SOURCE_STATE_KEYS):
+        return None, None
+    if state['offset'] > size or state['header_sha1'] != _digest(header):
+        return None, None
+    if size == state['size'] and os.fstat(f.fileno()).st_mtime_ns == state['mtime_ns']:
+        return state['offset'], None
+    hashed = prefix_hash(f, state['offset'])
+    if hashed.hexdigest() != state['prefix_sha1']:
+        return None, None
+    return state['offset'], hashed
+
+
+def appended_offset(f, size, header, state):
+    """state 이후 파일 끝에만 행이 추가되었으면 이어 읽을 offset, 아니면(처음/앞부분 변경/축소) None
+
+    크기와 수정 시각이 기록 그대로면 읽지 않고 통과하고, 아니면 offset 앞부분 전체를 해시해 비교합니다.
+    """
+    return resume_point(f, size, header, state)[0]
+
+
+class AppendOnlyCsvLoader:
+    """바이트 offset 기반으로 새 꼬리만 읽어 병합하는 CSV 로더 (스레드 안전)"""
+
+    def __init__(self, path, preprocess, key='page_path', order_by=None,
+                 schema_version=snapshot.SNAPSHOT_FORMAT_VERSION, column_store=None):
+        self.path = path
+        self.preprocess = preprocess
+        self.key = key
+        self.order_by = order_by
+        self.schema_version = schema_version
+        # 수치 열을 워커 간 공유 메모리 매핑으로 바꿀 저장소 (cnc/colstore.py, 없으면 프로세스 메모리)
+        self.column_store = column_store
+
+        self.df = None
+        self.source = None  # 마지막으로 반영한 위치와 해시 (source_state)
+        self._hashed = None  # source['offset']까지 넣은 hashlib 객체 (꼬리만 더해 다음 기록에 사용)
+        self.last_mode = None  # 'snapshot' | 'full' | 'append' | 'unchanged'
+        self.last_added = 0
+        self._lock = threading.Lock()
+
+    # ----------------- 상태 -----------------
+    @property
+    def rows(self):
+        return 0 if self.df is None else len(self.df)
+
+    @property
+    def offset(self):
+        return self.source['offset'] if self.source else 0
+
+    def state(self):
+        """스냅샷 메타에 함께 저장하는 증분 상태"""
+        return dict(self.source or {})
+
+    # ----------------- 로드 -----------------
+    def refresh(self):
+        """파일의 현재 상태를 반영한 DataFrame 반환"""
+        with self._lock:
+            with open(self.path, 'rb') as f:
+                signature = snapshot.source_signature(self.path)
+                header = f.readline()
+                cold = self.df is None
+                if cold:
+                    offset = self._restore_snapshot(f, signature['size'], header)
+                else:
+                    offset = appended_offset(f, signature['size'], header, self.source)
+
+                if offset is None:
+                    self._full_reload(f)
+                elif not self._append_tail(f, header):
+                    # 내용은 그대로이고 수정 시각만 바뀐 경우 다음 확인에서 다시 해시하지 않도록 기록 갱신
+                    stat = os.fstat(f.fileno())
+                    self.source.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                    if not cold:
+                        self.last_mode, self.last_added = 'unchanged', 0
+
+            # 스냅샷은 전체 재로드/콜드 스타트 때만 다시 씀 (프로세스 내 갱신은 꼬리 파싱 비용만 듦)
+            if self.last_mode == 'full' or (cold and self.last_mode == 'append'):
+                snapshot.write_snapshot(self.path, self.df, signature, self.schema_version, extra=self.state())
+            if self.column_store is not None and self.last_mode != 'unchanged':
+                self.df = self.column_store.share(self.df, source=self.source)
+            return self.df
+
+    def _restore_snapshot(self, f, size, header):
+        """스냅샷 메타의 offset/해시가 현재 파일과 맞으면 스냅샷을 기준점으로 사용 -> 이어 읽을 offset"""
+        meta = snapshot.read_snapshot_meta(self.path)
+        if not meta or meta.get('schema') != self.schema_version:
+            return None
+        offset = appended_offset(f, size, header, meta)
+        if offset is None:
+            return None
+
+        parquet_path, _ = snapshot.snapshot_paths(self.path)
+        try:
+            self.df = pd.read_parquet(parquet_path)
+        except (ImportError, OSError, ValueError):
+            return None
+        self.source = {key: meta[key] for key in SOURCE_STATE_KEYS}
+        self._hashed = None
+        self.last_mode = 'snapshot'
+        self.last_added = 0
+        return offset
+
+    def _full_reload(self, f):
+        f.seek(0)
+        data = complete_lines(f.read())
+        self.df = self.preprocess(pd.read_csv(io.BytesIO(data), encoding='utf-8-sig'))
+        self._hashed = hashlib.sha1(data)
+        self.source = source_state(f, data[:data.find(b'\n') + 1], len(data), hashed=self._hashed)
+        self.last_mode = 'full'
+        self.last_added = len(self.df)
+
+    def _append_tail(self, f, header):
+        """offset 뒤에 붙은 완결된 행을 병합 (새 행이 없으면 False)"""
+        f.seek(self.offset)
+        tail = complete_lines(f.read())
+        if not tail:
+            return False
+
+        df_new = self.preprocess(pd.read_csv(io.BytesIO(header + tail), encoding='utf-8-sig'))
+        # 같은 키가 다시 들어오면 새 행으로 교체 (upsert)
+        df_old = self.df[~self.df[self.key].isin(df_new[self.key])]
+        self.df = concat_frames([df_old, df_new])
+        # 새 행은 대부분 최신 발행분이라 정렬이 유지되며, 깨졌을 때만 다시 정렬
+        if self.order_by and not self.df[self.order_by].is_monotonic_increasing:
+            self.df = self.df.sort_values(self.order_by, kind='stable', na_position='last', ignore_index=True)
+
+        # 앞부분 해시에 꼬리만 더함 (앞부분은 appended_offset에서 확인했으므로 다시 읽지 않음)
+        hashed = (self._hashed or prefix_hash(f, self.offset)).copy()
+        hashed.update(tail)
+        self.source = source_state(f, header, self.offset + len(tail), hashed=hashed)
+        self._hashed = hashed
+        self.last_mode = 'append'
+        self.last_added = len(df_new)
+        return True
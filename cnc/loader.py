@@ -0,0 +1,149 @@
+"""마스터 시트 파일 로드 및 전처리"""
+import os
+import threading
+
+import pandas as pd
+
+from cnc import snapshot
+from cnc.colstore import ColumnStore, column_dir, column_store_enabled
+from cnc.daily import DailyMetricsStore, partition_dir
+from cnc.incremental import AppendOnlyCsvLoader
+from cnc.schema import normalize_content
+from cnc.timeseries import ViewCurveStore, parse_hourly_csv
+from cnc.traffic import TrafficAggregates
+from cnc.writers import PenNameMap, parse_pen_name_csv
+
+# --- 파일 경로 설정 (NAS 환경을 위해 상대 경로 사용) ---
+# 마스터 시트 파일들이 대시보드 스크립트와 동일한 폴더에 있다고 가정합니다.
+EVENT_SUMMARY_PATH = 'event_summary_master_sheet.csv'
+CONTENT_DETAIL_PATH = 'content_detail_master_sheet.csv'
+# 기사별 시간대 누적 조회수 스냅샷 (선택 사항, 없으면 Top10 시간대 추이는 시뮬레이션, cnc/timeseries.py)
+HOURLY_VIEWS_PATH = 'article_hourly_views.csv'
+# 일별 UV/PV 등 지표 (선택 사항, 없으면 주간 일별 차트는 시뮬레이션, cnc/daily.py)
+DAILY_METRICS_PATH = 'daily_metrics.csv'
+# 조회/세션 단위 유입경로 원본 (선택 사항, 없으면 접근경로 분석은 시뮬레이션, cnc/traffic.py)
+TRAFFIC_HITS_PATH = 'traffic_hits.csv'
+# 기자 필명-본명 매핑 (선택 사항, 없으면 바이라인을 본명이자 필명으로 표시, cnc/writers.py)
+PEN_NAMES_PATH = 'pen_names.csv'
+
+# 일별 지표 저장소/유입경로 합계는 경로당 프로세스에 하나만 두고, 엔진을 다시 만들 때마다 sync()로
+# 새 꼬리만 반영합니다 (읽어 둔 파티션, 합계 표, 앞부분 해시를 재빌드 사이에 유지).
+_stores_lock = threading.Lock()
+_daily_stores = {}
+_traffic_aggregates = {}
+
+
+def parse_event_csv(path):
+    """event_summary 마스터 시트 파싱"""
+    # **UTF-8 BOM 인코딩으로 로드**
+    df_event = pd.read_csv(path, encoding='utf-8-sig')
+
+    # week_id를 정수형으로 변환 (숫자만 남김)
+    df_event['week_id'] = pd.to_numeric(df_event['week_id'], errors='coerce').fillna(-1).astype(int)
+    return df_event
+
+
+def preprocess_content(df_content):
+    """content_detail 원본 행(전체 또는 증분 꼬리)에 공통 전처리 적용"""
+    # content_detail: 발행일시를 datetime으로 변환
+    df_content['publishing_datetime'] = pd.to_datetime(df_content['publishing_datetime'], errors='coerce')
+
+    # 카테고리/축소 정수/비율(float32) 등 메모리 스키마로 변환 (cnc/schema.py)
+    df_content = normalize_content(df_content)
+
+    # 주차 구간 이진 탐색(cnc.weeks.WeekIndex)을 위해 발행일시 오름차순으로 유지
+    return df_content.sort_values('publishing_datetime', kind='stable', na_position='last', ignore_index=True)
+
+
+def parse_content_csv(path):
+    """content_detail 마스터 시트 파싱"""
+    return preprocess_content(pd.read_csv(path, encoding='utf-8-sig'))
+
+
+def content_loader(content_path=CONTENT_DETAIL_PATH):
+    """content_detail용 증분(append-only) 로더 생성"""
+    # CNC_COLUMN_STORE가 켜져 있으면 수치 열을 워커 간 공유 메모리 매핑으로 (cnc/colstore.py)
+    column_store = ColumnStore(column_dir(content_path)) if column_store_enabled() else None
+    return AppendOnlyCsvLoader(content_path, preprocess_content, key='page_path', order_by='publishing_datetime',
+                               column_store=column_store)
+
+
+def data_version(event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, *optional_paths):
+    """두 마스터 시트(+ 선택 파일)의 크기/수정시각으로 만든 데이터 버전 토큰
+
+    선택 파일(optional_paths)은 없어도 되며, 생기거나 사라지면 버전이 바뀝니다.
+    """
+    parts = []
+    for path in (event_path, content_path):
+        sig = snapshot.source_signature(path)
+        parts.append(f"{sig['size']}-{sig['mtime_ns']}")
+    for path in optional_paths:
+        if path is None:
+            continue
+        try:
+            sig = snapshot.source_signature(path)
+            parts.append(f"{sig['size']}-{sig['mtime_ns']}")
+        except FileNotFoundError:
+            parts.append('none')
+    return '_'.join(parts)
+
+
+def read_master_sheets(event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, loader=None):
+    """두 마스터 시트를 (스냅샷이 최신이면 스냅샷에서) 로드
+
+    loader(AppendOnlyCsvLoader)를 넘기면 content_detail은 지난번 이후 추가된 행만 읽습니다.
+    CNC_COLUMN_STORE가 켜져 있으면 content_detail의 수치 열은 CSV 옆 `.columns/` 폴더의 메모리 매핑 배열로
+    바꿔 워커끼리 공유합니다.
+    """
+    df_event = snapshot.load_with_snapshot(event_path, parse_event_csv)
+    if loader is not None:
+        df_content = loader.refresh()
+    else:
+        df_content = snapshot.load_with_snapshot(content_path, parse_content_csv)
+        if column_store_enabled():
+            df_content = ColumnStore(column_dir(content_path)).share(df_content)
+    return df_event, df_content
+
+
+def read_view_curves(hourly_path=HOURLY_VIEWS_PATH):
+    """시간대 조회수 스냅샷 -> ViewCurveStore (파일이 없으면 None)"""
+    if not hourly_path or not os.path.exists(hourly_path):
+        return None
+    return ViewCurveStore(snapshot.load_with_snapshot(hourly_path, parse_hourly_csv))
+
+
+def daily_store(daily_path=DAILY_METRICS_PATH):
+    """일별 지표 파티션 저장소 (경로당 1개, 마지막으로 반영한 위치 유지)"""
+    with _stores_lock:
+        if daily_path not in _daily_stores:
+            _daily_stores[daily_path] = DailyMetricsStore(partition_dir(daily_path))
+        return _daily_stores[daily_path]
+
+
+def traffic_aggregates(traffic_path=TRAFFIC_HITS_PATH):
+    """유입경로 합계 표 (경로당 1개, 마지막으로 반영한 위치 유지)"""
+    with _stores_lock:
+        if traffic_path not in _traffic_aggregates:
+            _traffic_aggregates[traffic_path] = TrafficAggregates(traffic_path)
+        return _traffic_aggregates[traffic_path]
+
+
+def read_daily_metrics(daily_path=DAILY_METRICS_PATH):
+    """일별 지표 CSV의 새 행을 월별 파티션에 반영한 DailyMetricsStore (파일이 없으면 None)"""
+    if not daily_path or not os.path.exists(daily_path):
+        return None
+    return daily_store(daily_path).sync(daily_path)
+
+
+def read_traffic(traffic_path=TRAFFIC_HITS_PATH):
+    """유입경로 원본의 새 행을 스트리밍 집계한 TrafficAggregates (파일이 없으면 None)"""
+    if not traffic_path or not os.path.exists(traffic_path):
+        return None
+    return traffic_aggregates(traffic_path).sync()
+
+
+def read_pen_names(pen_names_path=PEN_NAMES_PATH):
+    """필명-본명 매핑 -> PenNameMap (파일이 없으면 None)"""
+    if not pen_names_path or not os.path.exists(pen_names_path):
+        return None
+    return PenNameMap(parse_pen_name_csv(pen_names_path))
@@ -0,0 +1,151 @@
+"""단계별 실행 시간/메모리 계측 (opt-in)
+
+대시보드 URL에 ?profile=1 을 붙이거나 환경 변수 CNC_PROFILE=1 로 켭니다.
+꺼져 있으면 stage()는 아무 일도 하지 않습니다.
+
+메모리는 tracemalloc의 단계별 최대 할당량(시작 시점 대비 증가분)입니다. tracemalloc은
+프로세스 전체에 걸리므로 여러 세션이 동시에 실행 중이면 다른 세션의 할당도 섞일 수 있고,
+켜져 있는 동안은 전체 실행이 다소 느려집니다.
+
+누적된 로그 집계:
+    python -m cnc.profiling profile_log.jsonl
+"""
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+PROFILE_ENV = 'CNC_PROFILE'
+PROFILE_LOG_ENV = 'CNC_PROFILE_LOG'
+DEFAULT_PROFILE_LOG = 'profile_log.jsonl'
+
+_log_lock = threading.Lock()
+
+
+def profiling_requested(query_params=None):
+    """쿼리 파라미터(profile=1) 또는 환경 변수(CNC_PROFILE=1)로 계측이 요청되었는지"""
+    if os.environ.get(PROFILE_ENV, '') not in ('', '0'):
+        return True
+    return query_params is not None and query_params.get('profile') == '1'
+
+
+def profile_log_path():
+    return os.environ.get(PROFILE_LOG_ENV, DEFAULT_PROFILE_LOG)
+
+
+class StageProfiler:
+    """한 번의 실행(스크립트 전체 또는 fragment 재실행)에서 단계별 시간/최대 할당 기록"""
+
+    def __init__(self, enabled=False, kind='script', context=None):
+        self.enabled = enabled
+        self.kind = kind
+        self.context = dict(context or {})
+        self.records = []  # {'stage', 'depth', 'seconds', 'peak_mb'}
+        self.finished = False
+        self._stack = []  # [이름, 시작 시각, 시작 시 할당량, 관측한 최대 할당량]
+        self._started = time.perf_counter()
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        """with profiler.stage('이름'): 블록의 벽시계 시간과 최대 할당량 기록 (중첩 가능)"""
+        if not self.enabled:
+            yield
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            # 안쪽 단계가 peak를 초기화하므로 바깥 단계의 최대값은 따로 누적
+            self._stack[-1][3] = max(self._stack[-1][3], peak)
+        tracemalloc.reset_peak()
+        entry = [name, time.perf_counter(), current, current]
+        self._stack.append(entry)
+        record = {'stage': name, 'depth': len(self._stack) - 1, 'seconds': None, 'peak_mb': None}
+        self.records.append(record)
+        try:
+            yield
+        finally:
+            entry[3] = max(entry[3], tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][3] = max(self._stack[-1][3], entry[3])
+            record['seconds'] = time.perf_counter() - entry[1]
+            record['peak_mb'] = (entry[3] - entry[2]) / 2**20
+
+    def rerun(self, kind='fragment'):
+        """같은 설정으로 새 실행 기록 시작 (fragment 단독 재실행용)"""
+        return StageProfiler(self.enabled, kind=kind, context=self.context)
+
+    def total_seconds(self):
+        return time.perf_counter() - self._started
+
+    def finish(self, log_path=None):
+        """실행 기록을 로그 파일(JSON Lines)에 한 줄로 추가"""
+        if self.finished:
+            return
+        self.finished = True
+        if not self.enabled:
+            return
+
+        entry = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'kind': self.kind,
+            **self.context,
+            'total_seconds': round(self.total_seconds(), 4),
+            'stages': [
+                {'stage': r['stage'], 'depth': r['depth'],
+                 'seconds': round(r['seconds'] or 0.0, 4), 'peak_mb': round(r['peak_mb'] or 0.0, 2)}
+                for r in self.records
+            ],
+        }
+        try:
+            with _log_lock, open(log_path or profile_log_path(), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError:
+            pass  # 로그를 못 써도 대시보드 동작에는 영향 없음
+
+
+# ----------------- 로그 집계 -----------------
+def aggregate_log(path):
+    """로그 파일 -> {단계: {'count', 'median_sec', 'p95_sec', 'max_sec', 'max_peak_mb'}}"""
+    seconds, peaks = {}, {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for stage in json.loads(line)['stages']:
+                seconds.setdefault(stage['stage'], []).append(stage['seconds'])
+                peaks.setdefault(stage['stage'], []).append(stage['peak_mb'])
+
+    summary = {}
+    for name, values in seconds.items():
+        ordered = sorted(values)
+        summary[name] = {
+            'count': len(values),
+            'median_sec': round(statistics.median(ordered), 4),
+            'p95_sec': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+            'max_sec': round(ordered[-1], 4),
+            'max_peak_mb': round(max(peaks[name]), 2),
+        }
+    return summary
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else profile_log_path()
+    summary = aggregate_log(path)
+    print(f"{'단계':<28}{'횟수':>6}{'중앙값':>10}{'p95':>10}{'최대':>10}{'최대 할당':>12}")
+    for name, s in sorted(summary.items(), key=lambda item: -item[1]['median_sec']):
+        print(f"{name:<28}{s['count']:>6}{s['median_sec']:>9.3f}s{s['p95_sec']:>9.3f}s"
+              f"{s['max_sec']:>9.3f}s{s['max_peak_mb']:>10.1f}MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""주간 보고서 정적 HTML 일괄 생성 (Streamlit 없이 실행)
+
+대시보드와 같은 엔진(cnc/engine.py)과 섹션 구성(cnc/sections.py)으로 8개 섹션 전체를
+한 장의 HTML로 렌더링합니다. 여러 주차는 프로세스 풀로 나누어 병렬 생성합니다.
+
+사용 예:
+    python -m cnc.report --weeks 49 48 --out reports
+    python -m cnc.report --all --jobs 8 --out reports
+    python -m cnc.report --all --images      # kaleido가 있으면 차트를 PNG로 저장해 <img>로 삽입
+    python -m cnc.report --weeks 49 --pdf    # weasyprint(+kaleido)가 있으면 PDF도 생성
+"""
+import argparse
+import html
+import importlib.util
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from cnc.engine import load_engine
+from cnc.formatting import format_frame
+from cnc.loader import CONTENT_DETAIL_PATH, EVENT_SUMMARY_PATH
+from cnc.sections import SECTIONS, build_section, kpi_card_html, section_header_html
+from cnc.theme import CSS
+
+# 정적 보고서 전용 스타일 (Streamlit 레이아웃 요소 대체)
+REPORT_CSS = """
+<style>
+.block-container { margin: 0 auto; }
+.report-columns { display: grid; gap: 24px; align-items: start; }
+.report-section + .report-section { break-before: page; }
+.note { padding: 12px 16px; border-radius: 6px; margin: 10px 0; }
+.note-info { background-color: #e3f2fd; color: #0d47a1; }
+.note-warning { background-color: #fff8e1; color: #8d6e00; }
+table.report-table { border-collapse: collapse; width: 100%; margin: 10px 0 20px; font-size: 0.95rem; }
+table.report-table th { background-color: #1a237e; color: #fff; font-weight: 600; padding: 8px; }
+table.report-table td { border: 1px solid #cfd8dc; padding: 6px 8px; }
+table.report-table tr:nth-child(even) td { background-color: #f7f9fa; }
+.report-figure img { width: 100%; }
+</style>
+"""
+
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+
+def _inline_markdown(text):
+    """**굵게** 정도만 지원하는 간단한 마크다운 -> HTML"""
+    return _BOLD.sub(r'<strong>\1</strong>', html.escape(text))
+
+
+def _column_template(widths):
+    if isinstance(widths, int):
+        return f"repeat({widths}, 1fr)"
+    return ' '.join(f"{w}fr" for w in widths)
+
+
+def blocks_to_html(blocks, image_dir=None, image_prefix=''):
+    """레이아웃 블록 목록 -> HTML 조각 (image_dir가 있으면 차트를 PNG로 저장해 삽입)"""
+    parts = []
+    for block in blocks:
+        kind = block[0]
+        if kind == 'header':
+            parts.append(section_header_html(block[1], block[2]))
+        elif kind == 'chart_header':
+            parts.append(f'<div class="chart-header">{block[1]}</div>')
+        elif kind == 'note':
+            parts.append(f'<div class="note note-{block[1]}">{_inline_markdown(block[2])}</div>')
+        elif kind == 'text':
+            parts.append(f'<p>{_inline_markdown(block[1])}</p>')
+        elif kind == 'kpis':
+            cards = ''.join(kpi_card_html(label, val, unit) for label, val, unit in block[1])
+            parts.append(f'<div class="report-columns" style="grid-template-columns: {_column_template(len(block[1]))}">{cards}</div>')
+        elif kind == 'figure':
+            chart_id, fig = block[1], block[2]
+            if image_dir:
+                file_name = f"{image_prefix}{chart_id}.png"
+                fig.write_image(os.path.join(image_dir, file_name), width=900, height=500, scale=2)
+                parts.append(f'<div class="report-figure"><img src="{html.escape(os.path.basename(image_dir))}/{file_name}" alt="{chart_id}"></div>')
+            else:
+                parts.append(f'<div class="report-figure">{fig.to_html(full_html=False, include_plotlyjs=False, div_id=chart_id)}</div>')
+        elif kind == 'table':
+            _, df, formats, _height = block
+            parts.append(format_frame(df, formats).to_html(index=False, classes='report-table', na_rep=''))
+        elif kind == 'columns':
+            cols = ''.join(f'<div>{blocks_to_html(sub, image_dir, image_prefix)}</div>' for sub in block[2])
+            parts.append(f'<div class="report-columns" style="grid-template-columns: {_column_template(block[1])}">{cols}</div>')
+        elif kind == 'spacer':
+            parts.append('<br>')
+        elif kind == 'divider':
+            parts.append('<hr>')
+    return '\n'.join(parts)
+
+
+def render_report_html(engine, selected_week, image_dir=None, plotlyjs='cdn'):
+    """선택 주차의 8개 섹션 전체 보고서 HTML 문서"""
+    sections_html = []
+    for section in SECTIONS:
+        body = blocks_to_html(build_section(section, engine, selected_week), image_dir, f"{selected_week[:2]}_")
+        sections_html.append(f'<section class="report-section" id="{section.key}">{body}</section>')
+
+    if image_dir:
+        script = ''
+    elif plotlyjs == 'inline':
+        from plotly.offline import get_plotlyjs
+        script = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+    else:
+        from plotly.offline import get_plotlyjs_version
+        script = f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>쿡앤셰프 주간 성과보고서 - {selected_week}</title>
+{script}
+{CSS}
+{REPORT_CSS}
+</head>
+<body>
+<div class="block-container">
+<div class="report-title">📰 쿡앤셰프 주간 성과보고서</div>
+<p><strong>조회 기간:</strong> {selected_week} ({engine.week_map[selected_week]})</p>
+<div class='update-time'>데이터 최종 집계 시간 : {now_str}</div>
+{''.join(sections_html)}
+</div>
+</body>
+</html>
+"""
+
+
+# ----------------- 주차별 생성 작업 (프로세스 풀 워커) -----------------
+_ENGINE = None
+
+
+def _init_worker(event_path, content_path, base_date, backend, db_path):
+    """워커 프로세스당 한 번 마스터 시트를 로드 (스냅샷이 있으면 스냅샷에서, sqlite면 DB 연결만)"""
+    global _ENGINE
+    _ENGINE = load_engine(event_path, content_path, base_date=base_date, backend=backend, db_path=db_path)
+
+
+def _render_week(selected_week, out_dir, images, pdf, plotlyjs):
+    started = time.perf_counter()
+    week_tag = selected_week[:2]
+    html_path = os.path.join(out_dir, f"weekly_report_{week_tag}.html")
+
+    image_dir = None
+    if images or pdf:
+        image_dir = os.path.join(out_dir, f"weekly_report_{week_tag}_files")
+        os.makedirs(image_dir, exist_ok=True)
+
+    document = render_report_html(_ENGINE, selected_week, image_dir, plotlyjs)
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(document)
+
+    outputs = [html_path]
+    if pdf:
+        from weasyprint import HTML
+        pdf_path = os.path.join(out_dir, f"weekly_report_{week_tag}.pdf")
+        HTML(html_path).write_pdf(pdf_path)
+        outputs.append(pdf_path)
+    return selected_week, outputs, time.perf_counter() - started
+
+
+def _resolve_weeks(week_map, requested, all_weeks):
+    if all_weeks:
+        return list(week_map)
+    weeks = []
+    for w in requested:
+        key = f"{int(str(w).rstrip('주')):02d}주"
+        if key not in week_map:
+            raise SystemExit(f"존재하지 않는 주차입니다: {w} (가능한 주차: {', '.join(week_map)})")
+        weeks.append(key)
+    return weeks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿡앤셰프 주간 성과보고서 정적 HTML 일괄 생성")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--weeks', nargs='+', help="생성할 week_id 목록 (예: 49 48). 생략 시 최신 주차")
+    target.add_argument('--all', action='store_true', help="모든 주차 생성")
+    parser.add_argument('--out', default='reports', help="출력 폴더 (기본: reports)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="병렬 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--event-path', default=EVENT_SUMMARY_PATH)
+    parser.add_argument('--content-path', default=CONTENT_DETAIL_PATH)
+    parser.add_argument('--base-date', type=lambda s: datetime.strptime(s, '%Y-%m-%d').date(),
+                        help="주차 기간 계산 기준일 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument('--images', action='store_true', help="차트를 PNG로 저장해 삽입 (kaleido 필요)")
+    parser.add_argument('--pdf', action='store_true', help="PDF도 생성 (weasyprint, kaleido 필요)")
+    parser.add_argument('--plotlyjs', choices=['cdn', 'inline'], default='cdn', help="plotly.js 포함 방식 (기본: cdn)")
+    parser.add_argument('--backend', choices=['csv', 'sqlite', 'stream'], default=os.environ.get('CNC_BACKEND', 'csv'),
+                        help="데이터 백엔드 (기본: csv, sqlite는 cnc/store.py)")
+    parser.add_argument('--db', default=None, help="sqlite 백엔드 DB 파일 경로 (기본: CNC_DB_PATH 또는 master_sheets.sqlite)")
+    args = parser.parse_args(argv)
+
+    if (args.images or args.pdf) and importlib.util.find_spec('kaleido') is None:
+        parser.error("차트 이미지 출력에는 kaleido 패키지가 필요합니다 (pip install kaleido)")
+    if args.pdf and importlib.util.find_spec('weasyprint') is None:
+        parser.error("PDF 출력에는 weasyprint 패키지가 필요합니다 (pip install weasyprint)")
+
+    engine = load_engine(args.event_path, args.content_path, base_date=args.base_date,
+                         backend=args.backend, db_path=args.db)
+    if not engine.week_map:
+        parser.error("유효한 주차 데이터(week_id >= 0)가 없습니다. 마스터 시트 파일을 확인해주세요.")
+    weeks = _resolve_weeks(engine.week_map, args.weeks or [next(iter(engine.week_map))], args.all)
+    os.makedirs(args.out, exist_ok=True)
+
+    started = time.perf_counter()
+    jobs = max(1, min(args.jobs, len(weeks)))
+    task_args = (args.out, args.images, args.pdf, args.plotlyjs)
+    if jobs == 1:
+        global _ENGINE
+        _ENGINE = engine
+        results = [_render_week(week, *task_args) for week in weeks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(args.event_path, args.content_path, args.base_date,
+                                           args.backend, args.db)) as pool:
+            futures = [pool.submit(_render_week, week, *task_args) for week in weeks]
+            results = [future.result() for future in as_completed(futures)]
+
+    for week, outputs, elapsed in sorted(results):
+        print(f"{week}: {', '.join(outputs)} ({elapsed:.2f}s)")
+    print(f"{len(results)}개 주차 생성 완료 ({jobs}개 프로세스, {time.perf_counter() - started:.2f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
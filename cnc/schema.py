@@ -0,0 +1,82 @@
+"""content_detail 마스터 시트의 메모리 스키마
+
+CSV를 그대로 읽으면 기자/카테고리 같은 반복 문자열이 행마다 파이썬 문자열로, 비율은
+'91.50%' 문자열로, 모든 수치는 int64/float64로 올라옵니다. 로드 직후 한 번만 정규화해
+Streamlit 워커마다 상주하는 메모리를 줄이고, 카테고리 코드 위에서 groupby 하도록 합니다.
+
+    반복 문자열 (기자, 카테고리)     category
+    제목, 경로                       pyarrow 문자열
+    조회/방문/좋아요 등 건수         int32 (결측 0)
+    세션/신규방문자 수 (결측 있음)   Int32 (nullable)
+    비율 문자열 '91.50%'             float32 비율 0.915 (열 이름에서 _str 제거)
+    평균체류시간(초)                 float32
+"""
+import pandas as pd
+
+CATEGORY_COLUMNS = ['writer_name', 'category_main', 'category_sub']
+STRING_COLUMNS = ['page_path', 'article_title']
+COUNT_COLUMNS = ['total_views', 'total_users', 'total_events', 'likes_count', 'comments_count', 'scroll_90_count']
+NULLABLE_COUNT_COLUMNS = ['total_sessions', 'new_users_count']
+FLOAT_COLUMNS = ['avg_engagement_time_sec']
+# 원본 퍼센트 문자열 열 -> 비율(0~1) 열
+RATIO_COLUMNS = {
+    'new_user_ratio_str': 'new_user_ratio',
+    'bounce_rate_str': 'bounce_rate',
+}
+
+
+def percent_to_fraction(series):
+    """'91.50%' 형태의 문자열 -> float32 비율 (0.915), 해석할 수 없으면 NaN"""
+    values = series.astype(str).str.rstrip('%')
+    return (pd.to_numeric(values, errors='coerce') / 100).astype('float32')
+
+
+def compact_strings(series):
+    """pyarrow 기반 문자열 dtype으로 변환 (이미 그렇거나 pyarrow가 없으면 그대로)"""
+    if getattr(series.dtype, 'storage', None) == 'pyarrow':
+        return series
+    try:
+        return series.astype('string[pyarrow]')
+    except ImportError:
+        return series
+
+
+def normalize_content(df_content):
+    """content_detail 프레임의 열 dtype을 메모리 스키마로 변환 (없는 열은 건너뜀)"""
+    for col in CATEGORY_COLUMNS:
+        if col in df_content:
+            df_content[col] = df_content[col].astype('category')
+    for col in STRING_COLUMNS:
+        if col in df_content:
+            df_content[col] = compact_strings(df_content[col])
+    for col in COUNT_COLUMNS:
+        if col in df_content:
+            df_content[col] = pd.to_numeric(df_content[col], errors='coerce').fillna(0).astype('int32')
+    for col in NULLABLE_COUNT_COLUMNS:
+        if col in df_content:
+            df_content[col] = pd.to_numeric(df_content[col], errors='coerce').round().astype('Int32')
+    # 이미 비율로 변환된 열(DB 등에서 다시 읽은 경우)도 float32로 맞춤
+    for col in FLOAT_COLUMNS + list(RATIO_COLUMNS.values()):
+        if col in df_content:
+            df_content[col] = pd.to_numeric(df_content[col], errors='coerce').astype('float32')
+    for src, dst in RATIO_COLUMNS.items():
+        if src in df_content:
+            df_content[dst] = percent_to_fraction(df_content.pop(src))
+    return df_content
+
+
+def concat_frames(frames):
+    """카테고리 열을 유지한 채 행 결합 (카테고리 목록이 다르면 합집합으로 맞춤)
+
+    pd.concat은 카테고리 목록이 다른 category 열을 object로 풀어 버립니다.
+    """
+    frames = [df for df in frames if len(df)] or frames[:1]
+    if len(frames) > 1:
+        for col in frames[0].columns:
+            if not all(isinstance(df[col].dtype, pd.CategoricalDtype) for df in frames if col in df):
+                continue
+            categories = frames[0][col].cat.categories
+            for df in frames[1:]:
+                categories = categories.union(df[col].cat.categories)
+            frames = [df.assign(**{col: df[col].cat.set_categories(categories)}) for df in frames]
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,207 @@
+"""기사 제목 전문 검색 (문자 바이그램 역색인)
+
+한국어 제목은 형태소 분석기 없이도 연속한 두 글자(바이그램) 단위로 색인하면 부분 문자열
+검색을 할 수 있습니다. 제목마다 '글자 + 다음 글자' 쌍(마지막 글자는 끝 표시와 짝)을 뽑아
+바이그램 -> 행 위치 목록(CSR 배열)으로 만들어 두고, 검색어의 바이그램 목록을 교집합한 뒤
+후보 행만 실제 제목과 대조합니다. 한 글자 검색어는 그 글자로 시작하는 바이그램 구간의 합집합입니다.
+
+- 대소문자/연속 공백은 무시 (소문자, 공백 1칸으로 정규화)
+- 검색어는 공백으로 나눈 각 단어를 모두 포함하는 제목 (AND)
+- 색인은 불변 객체이며, 행이 끝에 추가되면 추가분만 새 조각으로 색인한 새 색인을 만듭니다.
+  조각이 많아지면 전체를 다시 만듭니다.
+"""
+import numpy as np
+
+# 추가분 조각이 이 개수를 넘으면 전체 재색인
+MAX_SEGMENTS = 8
+
+
+def normalize_titles(titles):
+    """제목 Series -> 소문자, 연속 공백 1칸, 앞뒤 공백 제거 (결측은 빈 문자열)"""
+    return titles.fillna('').astype(str).str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def query_terms(query):
+    """검색어 -> 정규화된 단어 목록 (중복 제거, 긴 단어 먼저)"""
+    terms = dict.fromkeys(' '.join(str(query).lower().split()).split(' '))
+    return sorted((t for t in terms if t), key=len, reverse=True)
+
+
+def _intersect(rows, other, size):
+    """정렬된 행 위치 rows 중 other에도 있는 것 (정렬 없이 크기 size의 표시 배열 사용)"""
+    present = np.zeros(size, dtype=bool)
+    present[other] = True
+    return rows[present[rows]]
+
+
+class _Segment:
+    """연속한 행 구간 [start, start + rows) 하나의 바이그램 CSR 색인"""
+
+    def __init__(self, titles, start):
+        self.start = start
+        self.rows = len(titles)
+        normalized = normalize_titles(titles)
+        lengths = normalized.str.len().to_numpy(dtype=np.int64)
+
+        # 전체 제목을 이어 붙인 코드포인트 배열 -> 조각 내 글자 id (끝 표시 = n_chars)
+        text = ''.join(normalized.tolist())
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        present = np.zeros(0x110000, dtype=bool)
+        present[codepoints] = True
+        self.chars = np.flatnonzero(present).astype(np.uint32)
+        char_ids = (np.cumsum(present, dtype=np.int64) - 1)[codepoints]
+        self.n_chars = len(self.chars)
+        width = self.n_chars + 1
+
+        # 제목마다 글자 id 뒤에 끝 표시를 끼워 넣어 (글자, 다음 글자 또는 끝) 쌍 생성
+        ends = np.cumsum(lengths)
+        padded = np.insert(char_ids, ends, self.n_chars)
+        row_ids = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths + 1)
+        firsts = np.ones(len(padded), dtype=bool)
+        firsts[ends + np.arange(len(ends))] = False  # 끝 표시 위치는 쌍의 첫 글자가 아님
+        pairs = firsts[:-1]
+        grams = padded[:-1][pairs] * width + padded[1:][pairs]
+        rows = row_ids[:-1][pairs]
+
+        # (바이그램, 행)을 한 정수로 묶어 정렬 -> 중복 제거 -> 바이그램별 행 목록(CSR)
+        shift = int(len(lengths)).bit_length()
+        if width * width <= 1 << (63 - shift):
+            keys = np.sort((grams << shift) | rows)
+            grams, rows = keys >> shift, keys & ((1 << shift) - 1)
+        else:
+            order = np.lexsort((rows, grams))
+            grams, rows = grams[order], rows[order]
+        keep = np.ones(len(grams), dtype=bool)
+        keep[1:] = (grams[1:] != grams[:-1]) | (rows[1:] != rows[:-1])
+        grams, rows = grams[keep], rows[keep]
+        starts = np.flatnonzero(np.r_[True, grams[1:] != grams[:-1]]) if len(grams) else np.array([], dtype=np.int64)
+        self.grams = grams[starts]
+        self.offsets = np.append(starts, len(grams)).astype(np.int64)
+        self.postings = rows.astype(np.int32 if self.rows < 2**31 else np.int64)
+
+    def _char_ids(self, term):
+        codepoints = np.frombuffer(term.encode('utf-32-le'), dtype=np.uint32)
+        pos = np.searchsorted(self.chars, codepoints)
+        pos = np.minimum(pos, max(self.n_chars - 1, 0))
+        if self.n_chars == 0 or not np.array_equal(self.chars[pos], codepoints):
+            return None  # 조각에 없는 글자 포함
+        return pos.astype(np.int64)
+
+    def _posting(self, lo, hi):
+        """바이그램 id [lo, hi) 구간 행 위치 (조각 내)"""
+        a, b = np.searchsorted(self.grams, [lo, hi])
+        return self.postings[self.offsets[a]:self.offsets[b]]
+
+    def candidates(self, term):
+        """단어의 바이그램을 모두 포함하는 행 위치 (조각 내, 정렬됨) - 한 글자면 정확한 결과"""
+        ids = self._char_ids(term)
+        if ids is None:
+            return np.array([], dtype=np.int64)
+        width = self.n_chars + 1
+        if len(ids) == 1:
+            # 그 글자로 시작하는 바이그램 전체의 합집합 (정렬된 중복 없는 행 위치)
+            mask = np.zeros(self.rows, dtype=bool)
+            mask[self._posting(ids[0] * width, (ids[0] + 1) * width)] = True
+            return np.flatnonzero(mask)
+        grams = np.unique(ids[:-1] * width + ids[1:])
+        postings = sorted((self._posting(g, g + 1) for g in grams), key=len)
+        rows = postings[0].astype(np.int64)
+        for posting in postings[1:]:
+            if not len(rows):
+                break
+            rows = _intersect(rows, posting, self.rows)
+        return rows
+
+
+class TitleIndex:
+    """기사 제목 바이그램 역색인 (행 위치 = 색인할 때 넘긴 제목 Series의 위치)"""
+
+    def __init__(self, segments=()):
+        self.segments = list(segments)
+
+    @classmethod
+    def build(cls, titles):
+        return cls([_Segment(titles, 0)])
+
+    @property
+    def rows(self):
+        return sum(segment.rows for segment in self.segments)
+
+    def extend(self, titles):
+        """titles(기존 행 뒤에 추가된 제목)만 색인한 조각을 붙인 새 색인"""
+        if not len(titles):
+            return self
+        segments = self.segments + [_Segment(titles, self.rows)]
+        if len(segments) > MAX_SEGMENTS:
+            return None
+        return TitleIndex(segments)
+
+    def update(self, old_titles, titles):
+        """새 제목 Series에 맞는 색인 (앞부분이 old_titles와 같으면 추가분만 색인)"""
+        n_old = self.rows
+        if old_titles is not None and len(old_titles) == n_old and len(titles) >= n_old:
+            if titles is old_titles or titles.iloc[:n_old].reset_index(drop=True).equals(
+                    old_titles.reset_index(drop=True)):
+                extended = self.extend(titles.iloc[n_old:])
+                if extended is not None:
+                    return extended
+        return TitleIndex.build(titles)
+
+    def candidates(self, terms):
+        """모든 단어의 바이그램을 포함하는 행 위치 (오름차순, 두 글자 이하 단어는 정확한 결과)"""
+        found = []
+        for segment in self.segments:
+            rows = None
+            for term in terms:
+                cand = segment.candidates(term)
+                rows = cand if rows is None else _intersect(rows, cand, segment.rows)
+                if not len(rows):
+                    break
+            if len(rows):
+                found.append(rows + segment.start)
+        return np.concatenate(found) if found else np.array([], dtype=np.int64)
+
+    def search(self, query, titles, views=None, limit=None):
+        """검색어의 모든 단어를 포함하는 행 위치
+
+        titles는 색인할 때와 같은 제목 Series입니다. views와 limit을 주면 조회수 내림차순(동점이면
+        행 순서) 상위 limit개만 반환하며, 후보를 순위대로 조금씩 제목과 대조해 필요한 만큼만 확인합니다.
+        """
+        terms = query_terms(query)
+        rows = self.candidates(terms) if terms else np.array([], dtype=np.int64)
+        # 바이그램 교집합은 후보이므로 세 글자 이상 단어는 실제 제목과 대조
+        # (단어에는 공백이 없으므로 공백 정규화 없이 소문자 제목과 비교해도 같음)
+        long_terms = [t for t in terms if len(t) > 2]
+        if views is None or limit is None:
+            rows = rows if views is None else rank_rows(rows, views, len(rows))
+            rows = rows[_verify(titles, rows, long_terms)] if long_terms else rows
+            return rows[:limit] if limit is not None else rows
+        if not long_terms:
+            return rank_rows(rows, views, limit)
+
+        matched, checked, k = [], 0, max(64, 4 * limit)
+        while checked < len(rows) and sum(map(len, matched)) < limit:
+            ranked = rank_rows(rows, views, k)
+            block = ranked[checked:]
+            matched.append(block[_verify(titles, block, long_terms)])
+            checked, k = len(ranked), k * 4
+        return np.concatenate(matched)[:limit] if matched else rows[:0]
+
+
+def _verify(titles, rows, terms):
+    """rows 위치의 제목(소문자)이 모든 단어를 포함하는지 여부 (bool 배열)"""
+    lowered = [str(t).lower() if t is not None else '' for t in titles.iloc[rows].tolist()]
+    return np.fromiter((all(term in t for term in terms) for t in lowered), dtype=bool, count=len(lowered))
+
+
+def rank_rows(rows, views, n):
+    """행 위치를 조회수 내림차순(동점이면 행 순서)으로 정렬해 상위 n개"""
+    if not len(rows):
+        return rows
+    neg_views = -np.asarray(views)[rows].astype(np.int64)
+    if n < len(rows):
+        # n번째 조회수 이상인 후보만 남긴 뒤 정렬 (동점은 모두 남겨 행 순서로 결정)
+        keep = neg_views <= np.partition(neg_views, n - 1)[n - 1]
+        rows, neg_views = rows[keep], neg_views[keep]
+    order = np.lexsort((rows, neg_views))
+    return rows[order[:n]]
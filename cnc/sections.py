@@ -0,0 +1,369 @@
+"""보고서 8개 섹션의 구성 (레이아웃 블록 목록)
+
+각 섹션은 필요한 가공 데이터 항목(deps, cnc.engine.FILTERED_DATA_BUILDERS의 키)과
+블록 목록을 만드는 build 함수를 선언합니다. 블록은 (종류, ...) 튜플이며,
+대시보드(Streamlit)와 정적 HTML 보고서(cnc/report.py)가 각자 같은 블록을 그립니다.
+
+블록 종류:
+    ('header', 제목, 설명)          섹션 타이틀
+    ('chart_header', 텍스트)        차트 소제목
+    ('note', 'info'|'warning', 텍스트)
+    ('text', 마크다운)              굵은 글씨 라벨 등
+    ('kpis', [(라벨, 값, 단위), ...])
+    ('figure', 차트 id, Figure)     build 직후에는 Figure 생성 함수 (resolve_figures가 채움)
+    ('table', DataFrame, {열: 형식}, 높이)
+    ('columns', 열 너비, [블록 목록, ...])
+    ('spacer',) / ('divider',)
+"""
+import html
+from collections import namedtuple
+from contextlib import nullcontext
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from cnc import figures
+from cnc.cube import rollup
+from cnc.writers import leaderboard
+
+
+# ----------------- 블록 헬퍼 -----------------
+def header(title, desc=None):
+    return ('header', title, desc)
+
+
+def chart_header(text):
+    return ('chart_header', text)
+
+
+def note(level, text):
+    return ('note', level, text)
+
+
+def text(markdown):
+    return ('text', markdown)
+
+
+def figure(chart_id, make, *args, **kwargs):
+    """차트 블록 (Figure는 그림 캐시에 없을 때만 make(*args, **kwargs)로 생성, resolve_figures 참고)"""
+    return ('figure', chart_id, partial(make, *args, **kwargs))
+
+
+def table(df, formats=None, height=None):
+    return ('table', df, formats or {}, height)
+
+
+def columns(*cols, widths=None):
+    return ('columns', widths or len(cols), list(cols))
+
+
+SPACER = ('spacer',)
+DIVIDER = ('divider',)
+
+
+def section_header_html(title, desc=None):
+    desc_html = f'\n        <div class="section-desc">{html.escape(desc)}</div>' if desc else ''
+    return f"""
+    <div class="section-header-container">
+        <div class="section-header">{html.escape(title)}</div>{desc_html}
+    </div>
+    """
+
+
+def kpi_card_html(label, val, unit):
+    val_fmt = f"{val:,}" if isinstance(val, (int, float, np.number)) and val > 100 else val
+    return f"""
+            <div class="kpi-container">
+                <div class="kpi-label">{label}</div>
+                <div class="kpi-value">{val_fmt}<span class="kpi-unit">{unit}</span></div>
+            </div>
+            """
+
+
+# ----------------- 1. 성과 요약 -----------------
+def summary_section(df_weekly, df_daily, missing_events):
+    # KPI 계산 (최신 주차 데이터 사용)
+    current_week_data = df_weekly.iloc[0] if not df_weekly.empty else {'발행기사수': 0, '전체 조회수 (PV)': 0, '총 방문자수 (UV)': 0}
+
+    pv_uv_ratio = round(current_week_data['전체 조회수 (PV)']/current_week_data['총 방문자수 (UV)'], 1) if current_week_data['총 방문자수 (UV)'] > 0 else 0
+
+    kpis = [
+        ("주간 전체발행기사수", current_week_data['발행기사수'], "건"),
+        ("주간 전체 조회수(PV)", current_week_data['전체 조회수 (PV)'], "건"),
+        ("주간 총 방문자수 (UV)", current_week_data['총 방문자수 (UV)'], "명"),
+        ("방문자당 페이지뷰 (PV/UV)", pv_uv_ratio, "건"),
+        ("신규 방문자 비율 (%)", 55.4, "%"), # ⚠️ 데이터 누락: 시뮬레이션 값 유지
+        ("검색 유입 비율 (%)", 62.1, "%") # ⚠️ 데이터 누락: 시뮬레이션 값 유지
+    ]
+
+    blocks = [header("1. 주간 전체 성과 요약", "주요 KPI 및 트래픽/발행량 추이")]
+    if missing_events:
+        blocks.append(note('warning', f"⚠️ event_summary 마스터 시트에 **{', '.join(missing_events)}** 이벤트가 없어 "
+                                      "해당 지표(PV/UV)와 이를 기반으로 한 발행기사수가 0으로 표시됩니다."))
+    if df_daily.attrs.get('simulated', True):
+        blocks.append(note('info', "⚠️ 데이터셋에 일별 데이터가 없어 '일별 방문자 및 조회수'는 임의의 값으로 시뮬레이션합니다. (API 연동 또는 일별 CSV 추가 필요)"))
+    return blocks + [
+        ('kpis', kpis),
+        SPACER,
+        columns(
+            # 일별 지표 파일(daily_metrics.csv)이 없으면 df_daily는 시뮬레이션 값입니다.
+            [chart_header("📊 주간 일별 방문자 및 조회수"),
+             figure('daily_visitors', figures.daily_visitors_bar, df_daily)],
+            [chart_header("📈 3달간 주별 방문자 및 조회수 (발행기사 꺾은선)"),
+             figure('weekly_traffic', figures.weekly_traffic_combo, df_weekly)],
+        ),
+    ]
+
+
+# ----------------- 2. 접근 경로 -----------------
+def traffic_section(traffic):
+    # 유입경로 원본(traffic_hits.csv)이 없으면 df_traffic_curr / df_traffic_last는 시뮬레이션 값입니다.
+    df_traffic_curr, df_traffic_last = traffic
+    blocks = [header("2. 주간 접근 경로 분석", "채널별 비중 비교 및 상위 유입경로 상세 분석")]
+    if df_traffic_curr.attrs.get('simulated', True):
+        blocks.append(note('info', "⚠️ 데이터셋에 유입경로(소스/채널) 데이터가 없어 '접근 경로 분석'은 임의의 값으로 시뮬레이션합니다. (유입경로별 CSV 추가 필요)"))
+    blocks += [
+        columns(
+            [chart_header("주간 유입경로별 조회수 비중"),
+             figure('traffic_curr_donut', figures.create_donut_chart_with_val, df_traffic_curr, '유입경로', '조회수', '')],
+            [chart_header("직전주 유입경로별 조회수 비중"),
+             figure('traffic_last_donut', figures.create_donut_chart_with_val, df_traffic_last, '유입경로', '조회수', '')],
+        ),
+        SPACER,
+    ]
+
+    # 2.3 비중 변화
+    df_m = pd.merge(df_traffic_curr, df_traffic_last, on='유입경로', suffixes=('_이번주', '_지난주'))
+    df_m['조회수_이번주_총합'] = df_m['조회수_이번주'].sum()
+    df_m['조회수_지난주_총합'] = df_m['조회수_지난주'].sum()
+    df_m['이번주 비중'] = (df_m['조회수_이번주'] / df_m['조회수_이번주_총합'] * 100).round(1)
+    df_m['지난주 비중'] = (df_m['조회수_지난주'] / df_m['조회수_지난주_총합'] * 100).round(1)
+    df_m['비중 변화'] = (df_m['이번주 비중'] - df_m['지난주 비중']).round(1)
+
+    display_df = df_m[['유입경로', '이번주 비중', '지난주 비중', '비중 변화']]
+    blocks += [
+        chart_header("주요 유입경로 비중 변화"),
+        table(display_df, {'이번주 비중': 'pct', '지난주 비중': 'pct', '비중 변화': 'pp'}),
+    ]
+
+    # 2.4 상위 4개 경로 상세 (카드형 분리)
+    top4_df = df_traffic_curr.nlargest(4, '조회수')
+    cards = []
+    for row in top4_df.itertuples():
+        # ⚠️ 이 부분의 상세 지표는 유입경로별 상세 데이터가 없으므로 임의의 값으로 시뮬레이션합니다.
+        ch_data = {
+            '구분': ['조회수(PV)', '방문자수(UV)', '평균체류시간', '신규사용자'],
+            '수치': [
+                f"{row.조회수:,}",
+                f"{int(row.조회수*0.65):,}",
+                "02:45",
+                "58.2%"
+            ]
+        }
+        cards.append([text(f"**{row.유입경로}**"), table(pd.DataFrame(ch_data))])
+    blocks += [
+        chart_header("상위 4개 주요 유입경로 상세분석"),
+        columns(*cards, widths=4),
+    ]
+    return blocks
+
+
+# ----------------- 3. 방문자 특성 -----------------
+def demographics_section():
+    blocks = [
+        header("3. 주간 전체 방문자 특성 분석", "주간 vs 직전주 비교 및 변화 추이"),
+        note('warning', "⚠️ 데이터셋에 지역별, 연령별, 성별 등 **인구통계학적 데이터**가 누락되어 있어 해당 탭은 **시뮬레이션 값**으로만 작동합니다. (사용자 특성 CSV 추가 필요)"),
+    ]
+
+    # ⚠️ 시뮬레이션 데이터 유지 (UI/프레임 유지를 위해)
+    demo_cats = ['지역별(경기 통합)', '연령별', '성별']
+    data_curr = [
+        pd.DataFrame({'구분': ['서울', '경기/인천', '부산', '기타'], '비율': [40, 30, 10, 20]}),
+        pd.DataFrame({'구분': ['25-34', '35-44', '45-54', '55+'], '비율': [20, 30, 30, 20]}),
+        pd.DataFrame({'구분': ['여성', '남성'], '비율': [58, 42]})
+    ]
+    data_last = [
+        pd.DataFrame({'구분': ['서울', '경기/인천', '부산', '기타'], '비율': [38, 32, 12, 18]}),
+        pd.DataFrame({'구분': ['25-34', '35-44', '45-54', '55+'], '비율': [22, 28, 32, 18]}),
+        pd.DataFrame({'구분': ['여성', '남성'], '비율': [55, 45]})
+    ]
+
+    for i in range(3):
+        df_change = pd.merge(data_curr[i], data_last[i], on='구분', suffixes=('_이번', '_지난'))
+        df_change['변화(%p)'] = df_change['비율_이번'] - df_change['비율_지난']
+        df_disp = df_change.rename(columns={'비율_이번': '이번주(%)', '비율_지난': '지난주(%)'})
+
+        blocks += [
+            chart_header(f"{demo_cats[i]} 분석"),
+            columns(
+                [text("**이번주**"),
+                 figure(f"d1_{i}_curr_donut", figures.create_donut_chart_with_val, data_curr[i], '구분', '비율', '')],
+                [text("**지난주 (비교)**"),
+                 figure(f"d2_{i}_last_donut", figures.create_donut_chart_with_val, data_last[i], '구분', '비율', '')],
+            ),
+            table(df_disp[['구분', '이번주(%)', '지난주(%)', '변화(%p)']],
+                  {'이번주(%)': 'pct_int', '지난주(%)': 'pct_int', '변화(%p)': 'pp'}),
+            DIVIDER,
+        ]
+    return blocks
+
+
+# ----------------- 4. Top 10 상세 -----------------
+def top10_detail_section(df_top10):
+    # df_top10은 마스터 시트 데이터로 대체되었습니다.
+    cols_page4 = [
+        '순위', '카테고리', '세부카테고리', '제목', '작성자', '발행일시',
+        '전체조회수', '전체방문자수', '좋아요', '댓글', '평균체류시간',
+        '스크롤90%', '신규방문자비율', '이탈률'
+    ]
+    return [
+        header("4. 최근 7일 조회수 TOP 10 기사 분석", "데이터 최종집계시간 기준 상세 지표"),
+        table(df_top10[cols_page4], {**{c: 'int' for c in ['전체조회수', '전체방문자수', '좋아요', '댓글', '스크롤90%']},
+                                     '신규방문자비율': 'pct2', '이탈률': 'pct2'}, height=600),
+    ]
+
+
+# ----------------- 5. Top 10 추이 -----------------
+def top10_trend_section(df_top10, df_curves, df_sources):
+    cols_page5 = ['순위', '제목', '작성자', '발행일시', '전체조회수', '12시간', '24시간', '48시간']
+
+    blocks = [header("5. TOP 10 기사 시간대별 조회수 추이", "발행 후 시간 경과에 따른 조회수 변화")]
+    if df_curves is None:
+        blocks.append(note('info', "⚠️ 시간대별 조회수 스냅샷(article_hourly_views.csv)이 없어 12/24/48시간 조회수는 "
+                                   "전체조회수 기준 **시뮬레이션 값**입니다."))
+    blocks.append(table(df_top10[cols_page5], {c: 'int' for c in ['전체조회수', '12시간', '24시간', '48시간']}))
+    if df_curves is not None and not df_curves.empty:
+        blocks += [
+            chart_header("TOP 10 기사 발행 후 48시간 누적 조회수 곡선"),
+            figure('top10_view_curves', figures.view_curves_line, df_curves),
+        ]
+    blocks.append(chart_header("최근 7일 조회수 TOP 5 기사의 접근경로 분석"))
+    if df_sources.attrs.get('simulated', True):
+        blocks.append(note('info', "⚠️ 유입경로 원본(traffic_hits.csv)이 없어 TOP 5 기사의 접근경로는 **시뮬레이션 값**입니다."))
+    return blocks + [figure('top5_sources', figures.article_source_bar, df_sources)]
+
+
+# ----------------- 6. 카테고리 -----------------
+def category_section(cube_week):
+    # 주차 큐브에서 선택 주차 조각만 재집계 (해당 주 발행 기사 전체 기준)
+    cat_main = rollup(cube_week, ['category_main']).rename(columns={
+        'category_main': '카테고리', 'article_count': '기사수', 'total_views': '전체조회수'
+    })[['카테고리', '기사수', '전체조회수']]
+
+    # 계산 (표시 형식은 렌더링 시 지정)
+    cat_main['비중'] = cat_main['기사수'] / cat_main['기사수'].sum() * 100
+    cat_main['기사1건당평균'] = (cat_main['전체조회수'] / cat_main['기사수']).astype(int)
+
+    # 세부 카테고리
+    cat_sub = rollup(cube_week, ['category_main', 'category_sub']).rename(columns={
+        'category_main': '카테고리', 'category_sub': '세부카테고리', 'article_count': '기사수', 'total_views': '전체조회수'
+    })[['카테고리', '세부카테고리', '기사수', '전체조회수']]
+    total_articles = cat_sub['기사수'].sum()
+    cat_sub['비중(전체대비)'] = cat_sub['기사수'] / total_articles * 100
+    cat_sub['기사1건당평균'] = (cat_sub['전체조회수'] / cat_sub['기사수']).astype(int)
+
+    return [
+        header("6. 카테고리별 분석", "메인 카테고리 및 세부 카테고리 실적"),
+        chart_header("1. 지난 7일간 발행된 카테고리별 기사 수 (메인)"),
+        figure('category_main', figures.category_count_bar, cat_main, '카테고리', '카테고리', showlegend=False),
+        table(cat_main, {'비중': 'pct', '기사1건당평균': 'int', '전체조회수': 'int'}),
+        DIVIDER,
+        chart_header("2. 지난 7일간 발행된 세부 카테고리별 기사 수"),
+        figure('category_sub', figures.category_count_bar, cat_sub, '세부카테고리', '카테고리'),
+        table(cat_sub, {'비중(전체대비)': 'pct', '기사1건당평균': 'int', '전체조회수': 'int'}),
+    ]
+
+
+# ----------------- 7. 기자 (본명) -----------------
+# 기자 순위표 컬럼 (leaderboard 결과 -> 표시 이름)
+WRITER_BOARD_COLUMNS = {
+    'article_count': '발행기사 수', 'total_views': '전체 조회 수', '평균조회수': '기사 1건 당 평균 조회 수',
+    'likes_count': '좋아요 개수', 'comments_count': '댓글 개수',
+}
+WRITER_BOARD_FORMATS = {c: 'int' for c in ['전체 조회 수', '기사 1건 당 평균 조회 수', '좋아요 개수', '댓글 개수']}
+
+
+def writer_section(df_writers):
+    # (본명, 필명)별 기자 집계표를 본명 기준으로 합산 (해당 주 발행 기사 전체 기준)
+    board = leaderboard(df_writers, '본명').rename(columns=WRITER_BOARD_COLUMNS)
+    disp_w = board[['순위', '본명', '필명'] + list(WRITER_BOARD_COLUMNS.values())]
+    return [
+        header("7. 이번주 기자별 분석 (본명 기준)"),
+        table(disp_w, WRITER_BOARD_FORMATS),
+    ]
+
+
+# ----------------- 8. 기자 (필명) -----------------
+def pen_name_section(df_writers):
+    # 같은 집계표를 필명 기준으로 합산 (필명이 여러 기자에게 쓰였으면 본명을 이어 붙임)
+    board = leaderboard(df_writers, '필명').rename(columns=WRITER_BOARD_COLUMNS)
+    df_pen_disp = board[['순위', '필명', '본명'] + list(WRITER_BOARD_COLUMNS.values())]
+
+    blocks = [header("8. 이번주 기자별 분석 (필명 기준)")]
+    if not df_writers.attrs.get('pen_names', False):
+        blocks.append(note('warning', "⚠️ 필명-본명 매핑 파일(pen_names.csv)이 없어 기사 바이라인을 필명이자 본명으로 표시합니다. "
+                                      "(필명-본명 매핑 CSV 추가 필요)"))
+    return blocks + [table(df_pen_disp, WRITER_BOARD_FORMATS)]
+
+
+# ----------------- 기사 검색 (주차와 무관, 대시보드 전용) -----------------
+def search_section(query, df_found):
+    if df_found.empty:
+        return [note('info', f"'{query}' 제목 검색 결과가 없습니다.")]
+    cols = ['순위', '제목', '작성자', '카테고리', '세부카테고리', '발행일시',
+            '전체조회수', '전체방문자수', '좋아요', '댓글', '평균체류시간']
+    return [
+        text(f"**'{query}'** 제목 검색 결과 (전체 조회수 상위 {len(df_found)}건)"),
+        table(df_found[cols], {c: 'int' for c in ['전체조회수', '전체방문자수', '좋아요', '댓글']}),
+    ]
+
+
+# ----------------- 섹션 레지스트리 -----------------
+Section = namedtuple('Section', ['key', 'label', 'deps', 'build'])
+
+SECTIONS = [
+    Section('summary', "1.성과요약", ('weekly', 'daily', 'missing_events'), summary_section),
+    Section('traffic', "2.접근경로", ('traffic',), traffic_section),
+    Section('demographics', "3.방문자특성", (), demographics_section),
+    Section('top10_detail', "4.Top10상세", ('top10',), top10_detail_section),
+    Section('top10_trend', "5.Top10추이", ('top10', 'top10_curves', 'top5_sources'), top10_trend_section),
+    Section('category', "6.카테고리", ('cube_week',), category_section),
+    Section('writer', "7.기자(본명)", ('writers',), writer_section),
+    Section('pen_name', "8.기자(필명)", ('writers',), pen_name_section),
+]
+
+
+def resolve_figures(blocks, engine, selected_week):
+    """블록의 차트 생성 함수를 엔진 그림 캐시의 Figure로 교체 (같은 주차/데이터 버전이면 재사용)"""
+    resolved = []
+    for block in blocks:
+        if block[0] == 'figure' and callable(block[2]):
+            block = ('figure', block[1], engine.figure(block[1], selected_week, block[2]))
+        elif block[0] == 'columns':
+            block = ('columns', block[1], [resolve_figures(sub, engine, selected_week) for sub in block[2]])
+        resolved.append(block)
+    return resolved
+
+
+def iter_figures(blocks):
+    """블록 목록(열 안쪽 포함)의 ('figure', 차트 id, Figure) 블록"""
+    for block in blocks:
+        if block[0] == 'figure':
+            yield block
+        elif block[0] == 'columns':
+            for sub in block[2]:
+                yield from iter_figures(sub)
+
+
+def build_section(section, engine, selected_week, profiler=None):
+    """섹션이 선언한 데이터 항목만 엔진에서 가져와 블록 목록 생성
+
+    profiler(cnc.profiling.StageProfiler)를 주면 '<섹션>/data', '<섹션>/build' 단계로 기록합니다.
+    """
+    stage = profiler.stage if profiler is not None else (lambda name: nullcontext())
+    with stage(f"{section.key}/data"):
+        data = [engine.get(dep, selected_week) for dep in section.deps]
+    with stage(f"{section.key}/build"):
+        # 차트는 그림 캐시(주차, 차트 id, 데이터 버전)에 있으면 다시 만들지 않음
+        return resolve_figures(section.build(*data), engine, selected_week)
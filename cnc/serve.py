@@ -0,0 +1,47 @@
+"""대시보드 실행기 (서버 시작 시 데이터셋 예열)
+
+`streamlit run cnc_dashboard_0.5.py` 대신 사용하면, Streamlit 서버를 띄우기 전에 같은
+프로세스에서 마스터 시트 로드, 주차 목록(WEEK_MAP)/인덱스 생성, 최신 주차 가공 항목/차트 계산을
+끝내 둡니다 (cnc/shared.py). 월요일 아침 첫 접속자도 콜드 로드를 기다리지 않습니다.
+
+사용 예:
+    python -m cnc.serve
+    python -m cnc.serve --weeks 2 -- --server.port 8502 --server.headless true
+"""
+import argparse
+import os
+import sys
+import time
+
+from cnc.shared import prewarm
+
+DEFAULT_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cnc_dashboard_0.5.py')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="데이터셋을 예열한 뒤 대시보드 서버 시작",
+                                     epilog="'--' 뒤의 인자는 그대로 streamlit run에 전달됩니다.")
+    parser.add_argument('--script', default=DEFAULT_SCRIPT, help="대시보드 스크립트 경로")
+    parser.add_argument('--weeks', type=int, default=1, help="가공 항목/차트를 미리 계산할 최신 주차 수 (기본: 1)")
+    parser.add_argument('--backend', choices=['csv', 'sqlite', 'stream'], default=None, help="저장소 백엔드 (기본: CNC_BACKEND)")
+    parser.add_argument('streamlit_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        # 대시보드 스크립트도 같은 백엔드의 공용 감시자를 찾도록 환경 변수로 전달
+        os.environ['CNC_BACKEND'] = args.backend
+
+    started = time.perf_counter()
+    n_weeks, n_items, n_charts = prewarm(args.weeks, backend=args.backend)
+    print(f"데이터셋 예열 완료: {n_weeks}개 주차, 가공 항목 {n_items}개, 차트 {n_charts}개 "
+          f"({time.perf_counter() - started:.1f}초)")
+
+    # 같은 프로세스에서 Streamlit 서버 실행 (예열한 모듈 상태를 세션이 그대로 공유)
+    from streamlit.web import cli as stcli
+    extra = args.streamlit_args[1:] if args.streamlit_args[:1] == ['--'] else args.streamlit_args
+    sys.argv = ['streamlit', 'run', args.script] + extra
+    return stcli.main()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""서버 프로세스 공용 데이터셋 (읽기 전용)
+
+st.cache_data는 호출할 때마다 pickle된 DataFrame의 복사본을 돌려주므로, 동시에 접속한 세션
+수만큼 기사 프레임이 중복으로 상주합니다. 여기서는 마스터 시트 감시자(cnc/watcher.py)와
+그 엔진, 증분 로더, 결과/차트 캐시를 파이썬 모듈 수준에 프로세스당 하나씩만 두고 모든 세션이
+복사 없이 같은 객체를 참조합니다. Streamlit 스크립트는 매 실행마다 다시 실행되지만 이 모듈은
+sys.modules에 남아 있으므로, 실행기(cnc/serve.py)가 서버 시작 전에 미리 만들어 둔 데이터셋을
+첫 세션이 그대로 이어받습니다.
+
+공유 프레임과 가공 결과는 읽기 전용으로 다룹니다. 파생 프레임에 쓰더라도 원본이 바뀌지 않도록
+pandas 2.x에서도 copy-on-write를 켭니다 (pandas 3부터는 기본 동작).
+"""
+import os
+import threading
+
+import pandas as pd
+
+from cnc import figures
+from cnc.cache import VersionedCache
+from cnc.engine import FILTERED_DATA_BUILDERS, load_engine
+from cnc.loader import (CONTENT_DETAIL_PATH, DAILY_METRICS_PATH, EVENT_SUMMARY_PATH, HOURLY_VIEWS_PATH, PEN_NAMES_PATH,
+                        TRAFFIC_HITS_PATH, content_loader)
+from cnc.sections import SECTIONS, build_section, iter_figures
+from cnc.watcher import DatasetWatcher
+
+# 저장소 백엔드: 기본은 CSV(메모리), CNC_BACKEND=sqlite 이면 내장 DB에 적재 후 주차별 쿼리 (cnc/store.py),
+# CNC_BACKEND=stream 이면 content_detail을 청크로 읽어 집계/최근 행만 보관 (cnc/stream.py)
+BACKEND_ENV = 'CNC_BACKEND'
+# 마스터 시트 변경 확인 주기(초)
+WATCH_INTERVAL_ENV = 'CNC_WATCH_INTERVAL'
+
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+_lock = threading.Lock()
+_result_cache = None
+_figure_cache = None
+_loaders = {}
+_watchers = {}
+
+
+def backend_from_env():
+    return os.environ.get(BACKEND_ENV, 'csv')
+
+
+def watch_interval_from_env():
+    return float(os.environ.get(WATCH_INTERVAL_ENV, '30'))
+
+
+def result_cache():
+    """주차별 가공 결과 캐시 (프로세스당 1개, (항목, 주차, 데이터 버전, 기준일)을 키로 사용)"""
+    global _result_cache
+    with _lock:
+        if _result_cache is None:
+            _result_cache = VersionedCache(max_entries=64, ttl=60 * 60)
+        return _result_cache
+
+
+def figure_cache():
+    """차트 캐시 (프로세스당 1개, (차트 id, 주차, 데이터 버전, 기준일)을 키로 사용, cnc/figures.py)"""
+    global _figure_cache
+    with _lock:
+        if _figure_cache is None:
+            _figure_cache = figures.figure_cache()
+        return _figure_cache
+
+
+def shared_loader(content_path=CONTENT_DETAIL_PATH):
+    """content_detail 증분 로더 (경로당 1개, 마지막으로 읽은 offset 유지)"""
+    with _lock:
+        if content_path not in _loaders:
+            _loaders[content_path] = content_loader(content_path)
+        return _loaders[content_path]
+
+
+def shared_watcher(event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, backend=None, interval=None,
+                   hourly_path=HOURLY_VIEWS_PATH, daily_path=DAILY_METRICS_PATH, traffic_path=TRAFFIC_HITS_PATH,
+                   pen_names_path=PEN_NAMES_PATH):
+    """마스터 시트 감시자 (경로/백엔드당 1개, 처음 호출한 스레드에서 첫 로드)
+
+    NAS 파일이 갱신되면 백그라운드 스레드가 새 데이터를 읽고(스냅샷/증분 로더 사용) 주차 인덱스,
+    집계 큐브, 제목 색인까지 만든 뒤 엔진을 통째로 교체합니다. 사용자 요청은 재로드를 기다리지 않습니다.
+    """
+    backend = backend or backend_from_env()
+    # 선택 원본 파일 (없어도 되며, 생기거나 바뀌면 엔진을 다시 만듦)
+    optional_paths = (hourly_path, daily_path, traffic_path, pen_names_path)
+    key = (event_path, content_path, backend) + optional_paths
+    with _lock:
+        watcher = _watchers.get(key)
+        if watcher is not None:
+            return watcher
+    loader = shared_loader(content_path) if backend == 'csv' else None
+    cache, fig_cache = result_cache(), figure_cache()
+
+    def build(base_date, previous):
+        return load_engine(event_path, content_path, base_date=base_date, cache=cache,
+                           backend=backend, loader=loader, figure_cache=fig_cache,
+                           hourly_path=hourly_path, daily_path=daily_path, traffic_path=traffic_path,
+                           pen_names_path=pen_names_path).prepare(previous)
+
+    with _lock:
+        # 동시에 처음 호출되어도 첫 로드는 한 번만
+        watcher = _watchers.get(key)
+        if watcher is None:
+            interval = interval if interval is not None else watch_interval_from_env()
+            watcher = _watchers[key] = DatasetWatcher(event_path, content_path, build, interval=interval,
+                                                      optional_paths=optional_paths).start()
+        return watcher
+
+
+def prewarm(weeks=1, event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, backend=None):
+    """데이터셋 첫 로드 + 최신 weeks개 주차의 가공 항목과 차트를 미리 계산 (주차 수, 항목 수, 차트 수 반환)"""
+    watcher = shared_watcher(event_path, content_path, backend)
+    engine = watcher.get()
+    if engine is None:
+        raise RuntimeError(f"마스터 시트 로드 실패: {watcher.last_error}")
+    warmed = list(engine.week_map)[:weeks]
+    n_charts = 0
+    for selected_week in warmed:
+        for name in FILTERED_DATA_BUILDERS:
+            engine.get(name, selected_week)
+        for section in SECTIONS:
+            n_charts += sum(1 for _ in iter_figures(build_section(section, engine, selected_week)))
+    return len(warmed), len(warmed) * len(FILTERED_DATA_BUILDERS), n_charts
@@ -0,0 +1,110 @@
+"""마스터 시트 CSV의 열 지향(Parquet) 스냅샷 관리
+
+CSV 옆에 `<이름>.parquet` 과 `<이름>.snapshot.json` 을 함께 저장하고,
+원본 CSV의 크기/수정시각이 메타 정보와 일치할 때만 스냅샷을 사용합니다.
+NAS 파일이 갱신되면 서명이 달라지므로 자동으로 CSV를 다시 파싱합니다.
+"""
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+# 전처리 로직이 바뀌면 올려서 기존 스냅샷을 무효화합니다.
+SNAPSHOT_FORMAT_VERSION = 3
+
+
+def source_signature(path):
+    """원본 파일의 크기와 수정시각(ns)으로 서명 생성 (파일이 없으면 FileNotFoundError)"""
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def snapshot_paths(csv_path):
+    """CSV 경로에 대응하는 (parquet 경로, 메타 json 경로)"""
+    base, _ = os.path.splitext(csv_path)
+    return base + '.parquet', base + '.snapshot.json'
+
+
+def replace_atomically(path, write):
+    """write(임시 경로)로 같은 폴더의 고유 임시 파일에 쓴 뒤 path로 교체 (실패하면 임시 파일 삭제)
+
+    여러 워커/스레드가 같은 파일을 동시에 저장해도 임시 파일이 겹치지 않습니다.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.tmp-', dir=os.path.dirname(os.path.abspath(path)))
+    os.close(fd)
+    os.chmod(tmp_path, 0o644)  # mkstemp는 소유자 전용(0600)으로 만듦
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_parquet(path, df):
+    """DataFrame을 parquet로 원자적으로 저장"""
+    replace_atomically(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+
+def write_json(path, obj):
+    """JSON을 원자적으로 저장"""
+    def write(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f)
+    replace_atomically(path, write)
+
+
+def read_snapshot_meta(csv_path):
+    """스냅샷 메타 정보를 읽음 (없거나 손상되었으면 None)"""
+    _, meta_path = snapshot_paths(csv_path)
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_snapshot(csv_path, signature, schema_version=SNAPSHOT_FORMAT_VERSION):
+    """서명이 일치하는 스냅샷이 있으면 DataFrame, 아니면 None"""
+    meta = read_snapshot_meta(csv_path)
+    if not meta or meta.get('schema') != schema_version or meta.get('source') != signature:
+        return None
+
+    parquet_path, _ = snapshot_paths(csv_path)
+    try:
+        return pd.read_parquet(parquet_path)
+    except (ImportError, OSError, ValueError):
+        # pyarrow 미설치 또는 파일 손상: CSV 경로로 대체
+        return None
+
+
+def write_snapshot(csv_path, df, signature, schema_version=SNAPSHOT_FORMAT_VERSION, extra=None):
+    """스냅샷을 임시 파일에 쓴 뒤 교체하여 원자적으로 저장 (실패 시 False)"""
+    parquet_path, meta_path = snapshot_paths(csv_path)
+    meta = {'schema': schema_version, 'source': signature, 'rows': int(len(df))}
+    if extra:
+        meta.update(extra)
+
+    try:
+        write_parquet(parquet_path, df)
+        write_json(meta_path, meta)
+        return True
+    except (ImportError, OSError, ValueError):
+        # 읽기 전용 NAS 경로이거나 pyarrow가 없는 환경: 스냅샷 없이 진행
+        return False
+
+
+def load_with_snapshot(csv_path, parse_csv, schema_version=SNAPSHOT_FORMAT_VERSION):
+    """스냅샷이 최신이면 스냅샷에서, 아니면 CSV를 파싱하고 스냅샷을 갱신"""
+    signature = source_signature(csv_path)
+    df = read_snapshot(csv_path, signature, schema_version)
+    if df is not None:
+        return df
+
+    df = parse_csv(csv_path)
+    write_snapshot(csv_path, df, signature, schema_version)
+    return df
@@ -0,0 +1,314 @@
+"""내장 분석 저장소 (SQLite) 백엔드 - 선택 사항
+
+마스터 시트를 로컬 SQLite 파일에 적재해 두고, 주차별 TOP 10과 카테고리/기자 집계를
+선택 주차의 행만 읽는 쿼리로 처리합니다. 프로세스마다 전체 기사 프레임을 들고 있을 필요가
+없어 여러 해 분량의 아카이브도 다룰 수 있습니다. 기본값은 기존 CSV(메모리) 경로이며,
+CNC_BACKEND=sqlite 또는 `python -m cnc.report --backend sqlite` 로 켭니다.
+
+DB 파일은 데이터 버전(원본 크기/수정시각)이 바뀔 때만 임시 파일에 새로 만든 뒤 교체하므로,
+교체 중에도 이미 열린 연결은 이전 파일을 끝까지 읽습니다. 임시 파일 이름은 적재마다 고유하므로
+여러 워커가 동시에 다시 적재해도 서로의 파일을 지우지 않습니다 (마지막으로 교체한 것이 남음).
+
+사용 예:
+    python -m cnc.store                       # 마스터 시트 -> master_sheets.sqlite 적재
+    python -m cnc.store --db /data/cnc.sqlite
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from contextlib import closing
+from datetime import datetime
+
+import pandas as pd
+
+from cnc.cube import CUBE_DIMENSIONS, CUBE_MEASURES
+from cnc.engine import ReportEngine
+from cnc.loader import CONTENT_DETAIL_PATH, EVENT_SUMMARY_PATH, data_version, read_master_sheets
+from cnc.schema import CATEGORY_COLUMNS
+from cnc.search import query_terms
+from cnc.weeks import week_bounds
+
+DEFAULT_DB_PATH = 'master_sheets.sqlite'
+# 테이블 구성이 바뀌면 올려서 기존 DB 파일을 다시 적재
+STORE_SCHEMA_VERSION = 2
+DB_PATH_ENV = 'CNC_DB_PATH'
+
+# 쿼리 조건/정렬에 쓰는 열 인덱스
+CONTENT_INDEXES = {
+    'idx_content_page_path': 'CREATE UNIQUE INDEX idx_content_page_path ON content(page_path)',
+    'idx_content_published': 'CREATE INDEX idx_content_published ON content(publishing_datetime)',
+    'idx_content_writer': 'CREATE INDEX idx_content_writer ON content(writer_name)',
+    'idx_content_category': 'CREATE INDEX idx_content_category ON content(category_main)',
+}
+
+# 제목 전문 검색용 트라이그램 색인 (SQLite 3.34+ FTS5, 없으면 LIKE 전체 검색)
+TITLE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE title_fts USING fts5(article_title, tokenize='trigram', content='content', content_rowid='rowid')",
+    "INSERT INTO title_fts(title_fts) VALUES ('rebuild')",
+]
+
+# 발행일시는 'YYYY-MM-DD HH:MM:SS' 문자열로 저장 (사전순 = 시간순)
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_ingest_lock = threading.Lock()
+
+
+def db_path_from_env():
+    return os.environ.get(DB_PATH_ENV, DEFAULT_DB_PATH)
+
+
+class SqliteStore:
+    """마스터 시트 SQLite 파일 (조회마다 읽기 전용 연결을 새로 열어 스레드 간 공유 없음)"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._meta = {}
+        self._meta_key = None
+
+    def _connect(self):
+        return sqlite3.connect(f"file:{os.path.abspath(self.db_path)}?mode=ro", uri=True)
+
+    # ----------------- 메타 -----------------
+    def meta(self):
+        """적재 메타 정보 (파일이 없거나 적재 전이면 빈 dict, 파일이 교체될 때만 다시 읽음)"""
+        try:
+            stat = os.stat(self.db_path)
+        except FileNotFoundError:
+            return {}
+        key = (stat.st_ino, stat.st_mtime_ns)
+        if key != self._meta_key:
+            try:
+                with closing(self._connect()) as con:
+                    self._meta = {k: json.loads(v) for k, v in con.execute("SELECT key, value FROM meta")}
+            except sqlite3.Error:
+                self._meta = {}
+            self._meta_key = key
+        return self._meta
+
+    def version(self):
+        return self.meta().get('version')
+
+    # ----------------- 적재 -----------------
+    def ingest(self, df_event, df_content, version):
+        """두 마스터 시트를 새 DB 파일로 적재한 뒤 원자적으로 교체"""
+        # 같은 폴더의 고유 임시 파일 (다른 워커의 적재와 겹치지 않게, 교체는 같은 파일 시스템 안에서)
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.db_path) + '.tmp-',
+                                        dir=os.path.dirname(os.path.abspath(self.db_path)))
+        os.close(fd)
+        os.chmod(tmp_path, 0o644)  # mkstemp는 소유자 전용(0600)으로 만듦
+        try:
+            self._write_db(tmp_path, df_event, df_content, version)
+            os.replace(tmp_path, self.db_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _write_db(tmp_path, df_event, df_content, version):
+        """빈 임시 파일에 테이블/색인/메타 적재"""
+        content = df_content.copy()
+        for col in CATEGORY_COLUMNS:
+            if col in content:
+                content[col] = content[col].astype(object)
+        content['publishing_datetime'] = content['publishing_datetime'].dt.strftime(DATETIME_FORMAT)
+
+        with closing(sqlite3.connect(tmp_path)) as con:
+            # 정렬된 프레임 순서대로 넣으므로 rowid - 1 = 메모리 경로의 행 위치
+            content.to_sql('content', con, index=False, chunksize=50_000)
+            df_event.to_sql('events', con, index=False)
+            for ddl in CONTENT_INDEXES.values():
+                con.execute(ddl)
+            try:
+                for ddl in TITLE_FTS_DDL:
+                    con.execute(ddl)
+                title_fts = True
+            except sqlite3.OperationalError:
+                title_fts = False
+            con.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            meta = {
+                'version': version,
+                'schema': STORE_SCHEMA_VERSION,
+                'title_fts': title_fts,
+                'columns': list(df_content.columns),
+                # 조회 결과를 메모리 경로와 같은 dtype(전체 카테고리 목록 포함)으로 되돌리기 위한 정보
+                'dtypes': {col: str(dtype) for col, dtype in df_content.dtypes.items()},
+                'categories': {col: df_content[col].cat.categories.tolist()
+                               for col in df_content.columns if isinstance(df_content[col].dtype, pd.CategoricalDtype)},
+                'rows': int(len(df_content)),
+                'created': datetime.now().isoformat(timespec='seconds'),
+            }
+            con.executemany("INSERT INTO meta VALUES (?, ?)", [(k, json.dumps(v)) for k, v in meta.items()])
+            con.commit()
+
+    def ensure(self, event_path, content_path, version=None):
+        """DB가 현재 마스터 시트 버전이 아니면 다시 적재 (적재 시에만 시트 전체를 메모리에 올림)"""
+        version = version or data_version(event_path, content_path)
+        with _ingest_lock:
+            if self.version() != version or self.meta().get('schema') != STORE_SCHEMA_VERSION:
+                df_event, df_content = read_master_sheets(event_path, content_path)
+                self.ingest(df_event, df_content, version)
+        return version
+
+    # ----------------- 조회 -----------------
+    def read_events(self):
+        with closing(self._connect()) as con:
+            return pd.read_sql_query("SELECT * FROM events", con)
+
+    def has_content(self):
+        with closing(self._connect()) as con:
+            return con.execute("SELECT EXISTS (SELECT 1 FROM content)").fetchone()[0] == 1
+
+    def _restore_dtypes(self, df, meta):
+        """조회 결과 열을 적재 당시 dtype으로 복원 (빈 결과도 같은 dtype)"""
+        for col in df.columns:
+            if col in meta['categories']:
+                df[col] = pd.Categorical(df[col], categories=meta['categories'][col])
+            elif col == 'publishing_datetime':
+                df[col] = pd.to_datetime(df[col], format=DATETIME_FORMAT).astype(meta['dtypes'][col])
+            elif col in meta['dtypes']:
+                df[col] = df[col].astype(meta['dtypes'][col])
+        return df
+
+    def _content_frame(self, sql, params):
+        """content 행 조회 -> 메모리 경로와 같은 열 순서/dtype/행 위치 인덱스의 DataFrame"""
+        meta = self.meta()
+        select = ', '.join(f'"{c}"' for c in meta['columns'])
+        with closing(self._connect()) as con:
+            df = pd.read_sql_query(sql.format(columns=select), con, params=params, index_col='_pos')
+        df.index = df.index.astype('int64')
+        df.index.name = None
+        return self._restore_dtypes(df, meta)
+
+    def top_articles(self, start, end, n):
+        """[start, end) 발행 기사 중 전체 조회수 상위 n건 (동점이면 발행순)"""
+        return self._content_frame(
+            "SELECT rowid - 1 AS _pos, {columns} FROM content "
+            "WHERE publishing_datetime >= ? AND publishing_datetime < ? "
+            "ORDER BY total_views DESC, rowid LIMIT ?",
+            (start, end, n),
+        )
+
+    def search_titles(self, query, n):
+        """제목에 검색어의 모든 단어가 들어간 기사 중 전체 조회수 상위 n건 (동점이면 발행순)
+
+        세 글자 이상 단어는 트라이그램 색인으로 후보를 좁힌 뒤 LIKE로 확인합니다.
+        """
+        conditions, params = [], []
+        for term in query_terms(query):
+            if self.meta().get('title_fts') and len(term) >= 3:
+                conditions.append("rowid IN (SELECT rowid FROM title_fts WHERE title_fts MATCH ?)")
+                params.append('"' + term.replace('"', '""') + '"')
+            conditions.append("article_title LIKE ? ESCAPE '\\'")
+            params.append('%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%')
+        return self._content_frame(
+            "SELECT rowid - 1 AS _pos, {columns} FROM content "
+            f"WHERE {' AND '.join(conditions) or '0'} "
+            "ORDER BY total_views DESC, rowid LIMIT ?",
+            (*params, n),
+        )
+
+    def cube_slice(self, start, end):
+        """[start, end) 발행 기사의 카테고리 × 세부카테고리 × 기자 집계"""
+        dims = CUBE_DIMENSIONS[1:]
+        measures = {
+            'article_count': 'COUNT(*)',
+            'total_views': 'SUM(total_views)',
+            'total_users': 'SUM(total_users)',
+            'likes_count': 'SUM(likes_count)',
+            'comments_count': 'SUM(comments_count)',
+            'scroll_90_count': 'SUM(scroll_90_count)',
+            'engagement_time_sum': 'SUM(COALESCE(avg_engagement_time_sec, 0) * total_users)',
+        }
+        select = ', '.join(dims + [f'{expr} AS {name}' for name, expr in measures.items()])
+        not_null = ' AND '.join(f'{d} IS NOT NULL' for d in dims)
+        with closing(self._connect()) as con:
+            cube = pd.read_sql_query(
+                f"SELECT {select} FROM content "
+                f"WHERE publishing_datetime >= ? AND publishing_datetime < ? AND {not_null} "
+                f"GROUP BY {', '.join(dims)} ORDER BY {', '.join(dims)}",
+                con, params=(start, end),
+            )
+        categories = self.meta()['categories']
+        for col in dims:
+            cube[col] = pd.Categorical(cube[col], categories=categories[col])
+        for name in measures:
+            cube[name] = cube[name].astype('float64' if name == 'engagement_time_sum' else 'int64')
+        return cube
+
+
+class SqliteReportEngine(ReportEngine):
+    """SQLite 저장소 위의 보고서 엔진 (기사 행은 주차별 쿼리로만 읽음)"""
+
+    def __init__(self, store, version=None, base_date=None, cache=None, figure_cache=None, view_curves=None,
+                 daily_metrics=None, traffic=None, pen_names=None):
+        super().__init__(store.read_events(), None, version=version, base_date=base_date, cache=cache,
+                         figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                         traffic=traffic, pen_names=pen_names)
+        self.store = store
+        ids, starts, ends = week_bounds(self.week_ranges)
+        self._bounds = {
+            int(w): (pd.Timestamp(s).strftime(DATETIME_FORMAT), pd.Timestamp(e).strftime(DATETIME_FORMAT))
+            for w, s, e in zip(ids, starts, ends)
+        }
+
+    def prepare(self, previous=None):
+        # 기사 행과 제목 색인은 DB에 있으므로 이벤트 행렬만 미리 만듦
+        self.event_matrix
+        return self
+
+    def has_content(self):
+        return self.store.has_content()
+
+    def top_articles(self, week_id, n):
+        if week_id not in self._bounds:
+            return self.store.top_articles('', '', 0)
+        return self.store.top_articles(*self._bounds[week_id], n)
+
+    def search_articles(self, query, n):
+        return self.store.search_titles(query, n)
+
+    def cube_week(self, week_id):
+        start, end = self._bounds.get(week_id, ('', ''))
+        cube = self.store.cube_slice(start, end)
+        cube.insert(0, 'week_id', pd.Series(week_id, index=cube.index, dtype='int64'))
+        return cube[CUBE_DIMENSIONS + list(CUBE_MEASURES)]
+
+
+def load_sqlite_engine(event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, db_path=None,
+                       base_date=None, cache=None, version=None, figure_cache=None, view_curves=None,
+                       daily_metrics=None, traffic=None, pen_names=None):
+    """DB를 현재 마스터 시트 버전으로 맞춘 뒤 SQLite 엔진 생성
+
+    version은 엔진(결과 캐시) 버전이며, 시간대 조회수 스냅샷 등 DB에 넣지 않는 파일 버전을 포함할 수
+    있으므로 DB 적재 여부는 두 마스터 시트 버전만으로 판단합니다.
+    """
+    store = SqliteStore(db_path or db_path_from_env())
+    sheets_version = store.ensure(event_path, content_path)
+    return SqliteReportEngine(store, version=version or sheets_version, base_date=base_date, cache=cache,
+                              figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                              traffic=traffic, pen_names=pen_names)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마스터 시트를 SQLite 저장소에 적재")
+    parser.add_argument('--db', default=db_path_from_env(), help=f"DB 파일 경로 (기본: {DEFAULT_DB_PATH})")
+    parser.add_argument('--event-path', default=EVENT_SUMMARY_PATH)
+    parser.add_argument('--content-path', default=CONTENT_DETAIL_PATH)
+    args = parser.parse_args(argv)
+
+    store = SqliteStore(args.db)
+    before = store.version()
+    version = store.ensure(args.event_path, args.content_path)
+    meta = store.meta()
+    state = '최신 상태' if before == version else '적재 완료'
+    print(f"{args.db}: {state} (버전 {version}, 기사 {meta['rows']:,}행)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""대용량 content_detail 마스터 시트의 청크 스트리밍 로드 (청크 작업 메모리 + 보관 기간 상한) - 선택 사항
+
+여러 해 치를 채워 넣어 content_detail이 수 GB가 되면 워커마다 pd.read_csv로 통째로 읽을 수 없습니다.
+스트리밍 모드는 파일을 청크 단위로, 보고서가 쓰는 열만(usecols) 명시한 dtype으로 읽어 청크마다 바로 접고
+가장 최근 발행일부터 W주(보관 기간) 안의 세 가지만 남깁니다.
+
+    발행일 큐브      발행일 × 카테고리 × 세부카테고리 × 기자 합계 (카테고리/기자 탭, cnc/cube.py)
+    주별 TOP K       월~일 주(1월 1일에서 끊음)마다 조회수 상위 K건
+    최근 원본 행      가장 최근 발행일부터 N일 이내 기사 전체
+
+보고서 주차는 기준일과 무관하게 항상 월~일(0주차는 1월 1일~첫 일요일)이므로, 주차 TOP 10은 그 주 묶음의
+TOP K 후보 안에 모두 있습니다. 주차 큐브는 조회 시 발행일 큐브를 현재 주차 구간으로 다시 묶습니다.
+
+두 설정이 메모리를 묶습니다.
+
+    CNC_STREAM_MEMORY_MB    청크 하나를 파싱·전처리·접는 작업 메모리 (청크 행 수를 여기에 맞춤)
+    CNC_STREAM_RETAIN_WEEKS 접어서 남기는 상태: 보관 기간 밖의 발행일은 청크마다 버림
+
+    발행일 큐브      최대 7W일 × 그날의 (카테고리, 세부카테고리, 기자) 조합 수
+    주별 TOP K       최대 (W + 1) × K행 (연초 주는 두 묶음)
+    최근 원본 행      최근 N일 기사 수 (발행량에 비례)
+
+즉 최대 메모리는 원본 파일 크기(쌓인 햇수)와 무관하고 보관 기간과 발행량으로 정해집니다.
+
+- 최근 N일 밖의 주차는 TOP K건까지만 조회됩니다 (K 기본값은 JSON API의 최대 n).
+- 보관 기간 밖의 주차는 비어 있습니다 (기본 60주: 올해 주차 전체를 덮음).
+- 제목 검색은 보관한 행(최근 N일 + 주별 TOP K) 안에서만 찾습니다.
+- 접은 결과는 CSV 옆 `<이름>.stream/`에 저장해 두고, 원본과 설정이 같으면 다른 워커나 재시작 때 다시 읽지 않습니다.
+
+켜기: CNC_BACKEND=stream (또는 --backend stream)
+설정: CNC_STREAM_MEMORY_MB (청크 작업 메모리, 기본 256), CNC_STREAM_RETAIN_WEEKS (보관 주 수, 기본 60),
+      CNC_STREAM_RECENT_DAYS (기본 35), CNC_STREAM_TOP_K (기본 100)
+
+사용 예:
+    python -m cnc.stream                          # 미리 접어 두고 최대 메모리/보관 행 수 출력
+    python -m cnc.stream --memory-mb 128 --recent-days 28 --retain-weeks 53
+"""
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from cnc import snapshot
+from cnc.cube import build_daily_cube, merge_daily_cubes, weekly_from_daily
+from cnc.engine import ReportEngine
+from cnc.loader import CONTENT_DETAIL_PATH, EVENT_SUMMARY_PATH, parse_event_csv, preprocess_content
+from cnc.schema import concat_frames
+
+# 접는 방식이 바뀌면 올려서 저장해 둔 결과를 다시 만듭니다.
+STREAM_FORMAT_VERSION = 2
+
+MEMORY_ENV = 'CNC_STREAM_MEMORY_MB'
+RECENT_DAYS_ENV = 'CNC_STREAM_RECENT_DAYS'
+TOP_K_ENV = 'CNC_STREAM_TOP_K'
+RETAIN_WEEKS_ENV = 'CNC_STREAM_RETAIN_WEEKS'
+DEFAULT_MEMORY_MB = 256
+DEFAULT_RECENT_DAYS = 35
+DEFAULT_TOP_K = 100
+DEFAULT_RETAIN_WEEKS = 60
+
+# 보고서가 쓰는 열과 읽기 dtype (total_events/total_sessions/new_users_count는 보고서에 쓰이지 않아 읽지 않음)
+# 건수는 빈 칸이 있을 수 있어 float64로 읽고 preprocess_content에서 int32로 줄임
+STREAM_DTYPES = {
+    'page_path': 'str',
+    'article_title': 'str',
+    'writer_name': 'category',
+    'category_main': 'category',
+    'category_sub': 'category',
+    'publishing_datetime': 'str',
+    'total_views': 'float64',
+    'total_users': 'float64',
+    'likes_count': 'float64',
+    'comments_count': 'float64',
+    'scroll_90_count': 'float64',
+    'avg_engagement_time_sec': 'float64',
+    'new_user_ratio_str': 'str',
+    'bounce_rate_str': 'str',
+}
+
+# 청크 행 수 추정: 앞부분 표본을 전처리한 프레임의 행당 크기 × 배수 (파싱 버퍼, 전처리/정렬 사본, 접기 중간값)
+SAMPLE_ROWS = 2_000
+CHUNK_OVERHEAD = 10
+MIN_CHUNK_ROWS = 5_000
+
+ROW_COLUMN = '_row'  # 원본 파일의 행 번호 (조회수가 같을 때 인메모리 경로와 같은 순서로 자르기 위함)
+
+StreamedContent = namedtuple('StreamedContent', ['daily_cube', 'rows', 'meta'])
+
+
+def settings_from_env():
+    return {
+        'memory_mb': int(os.environ.get(MEMORY_ENV, DEFAULT_MEMORY_MB)),
+        'recent_days': int(os.environ.get(RECENT_DAYS_ENV, DEFAULT_RECENT_DAYS)),
+        'top_k': int(os.environ.get(TOP_K_ENV, DEFAULT_TOP_K)),
+        'retain_weeks': int(os.environ.get(RETAIN_WEEKS_ENV, DEFAULT_RETAIN_WEEKS)),
+    }
+
+
+def stream_dir(csv_path):
+    """CSV 경로에 대응하는 스트리밍 결과 폴더 경로"""
+    base, _ = os.path.splitext(csv_path)
+    return base + '.stream'
+
+
+# ----------------- 청크 읽기 -----------------
+def read_content_csv(path, **kwargs):
+    """보고서가 쓰는 열만 명시한 dtype으로 읽는 read_csv (chunksize를 넘기면 청크 반복자)"""
+    return pd.read_csv(path, encoding='utf-8-sig', usecols=lambda col: col in STREAM_DTYPES,
+                       dtype=STREAM_DTYPES, **kwargs)
+
+
+def chunk_rows_for(path, memory_mb):
+    """메모리 상한(MB)에 맞는 청크 행 수 (앞부분 표본 행의 전처리 후 크기로 추정)"""
+    sample = preprocess_content(read_content_csv(path, nrows=SAMPLE_ROWS))
+    per_row = sample.memory_usage(deep=True).sum() / max(len(sample), 1)
+    return max(MIN_CHUNK_ROWS, int(memory_mb * 2**20 / (per_row * CHUNK_OVERHEAD)))
+
+
+def week_bucket(times):
+    """발행일시 -> TOP K 묶음 시작일 (그 주 월요일, 1월 1일이 낀 주는 1월 1일에서 끊음)
+
+    보고서 주차(월~일, 0주차는 1월 1일~첫 일요일)는 항상 이 묶음 몇 개를 합친 구간입니다.
+    """
+    day = times.dt.normalize()
+    monday = day - pd.to_timedelta(day.dt.weekday, unit='D')
+    new_year = day - pd.to_timedelta(day.dt.dayofyear - 1, unit='D')
+    return monday.where(monday >= new_year, new_year)
+
+
+def top_per_week(df, k):
+    """TOP K 묶음(week_bucket)마다 조회수 상위 k행 (동점이면 발행시각, 원본 행 순서)"""
+    ordered = df.assign(_bucket=week_bucket(df['publishing_datetime']))
+    ordered = ordered.sort_values(['_bucket', 'total_views', 'publishing_datetime', ROW_COLUMN],
+                                  ascending=[True, False, True, True], kind='stable')
+    return ordered.groupby('_bucket', sort=False).head(k).drop(columns='_bucket')
+
+
+class ContentFolder:
+    """content_detail 청크를 발행일 큐브 / 주별 TOP K / 최근 N일 행으로 접는 누적기 (보관 기간 밖은 버림)"""
+
+    def __init__(self, recent_days=DEFAULT_RECENT_DAYS, top_k=DEFAULT_TOP_K, retain_weeks=DEFAULT_RETAIN_WEEKS):
+        self.recent_days = recent_days
+        self.top_k = top_k
+        self.retain_weeks = retain_weeks
+        self.rows_read = 0
+        self.latest = None  # 지금까지 본 가장 최근 발행일
+        self.daily_cube = None
+        self.top = None
+        self.recent = None
+        self._empty = None
+
+    def fold(self, chunk):
+        chunk[ROW_COLUMN] = np.arange(self.rows_read, self.rows_read + len(chunk), dtype=np.int64)
+        self.rows_read += len(chunk)
+        df = preprocess_content(chunk)
+        if self._empty is None:
+            self._empty = df.iloc[:0]
+
+        dated = df[df['publishing_datetime'].notna()]
+        if not dated.empty:
+            latest = dated['publishing_datetime'].max().normalize()
+            self.latest = latest if self.latest is None else max(self.latest, latest)
+        if self.latest is None:
+            return
+        # 보관 기간: 가장 최근 발행일이 속한 주의 월요일부터 retain_weeks주 전까지 (이보다 오래된 발행일은 버림)
+        horizon = self.latest - pd.Timedelta(days=self.latest.weekday() + 7 * (self.retain_weeks - 1))
+        dated = dated[dated['publishing_datetime'] >= horizon]
+
+        cube = build_daily_cube(dated)
+        if self.daily_cube is not None:
+            kept = self.daily_cube[self.daily_cube['date'] >= horizon]
+            cube = merge_daily_cubes([kept, cube])
+        self.daily_cube = cube
+
+        top = self.top[self.top['publishing_datetime'] >= horizon] if self.top is not None else None
+        self.top = top_per_week(dated if top is None else concat_frames([top, dated]), self.top_k)
+
+        cutoff = self.latest - pd.Timedelta(days=self.recent_days - 1)
+        recent = dated[dated['publishing_datetime'] >= cutoff]
+        if self.recent is not None:
+            recent = concat_frames([self.recent[self.recent['publishing_datetime'] >= cutoff], recent])
+        self.recent = recent
+
+    def result(self):
+        """(발행일 큐브, 보관 행) - 보관 행은 발행일시 오름차순 (cnc.weeks.WeekIndex 전제)"""
+        parts = [df for df in (self.recent, self.top) if df is not None]
+        if not parts:
+            rows = self._empty.drop(columns=ROW_COLUMN) if self._empty is not None else pd.DataFrame()
+            return build_daily_cube(rows) if self.daily_cube is None else self.daily_cube, rows
+        rows = concat_frames(parts).drop_duplicates(ROW_COLUMN)
+        rows = rows.sort_values(['publishing_datetime', ROW_COLUMN], kind='stable', ignore_index=True)
+        return self.daily_cube.reset_index(drop=True), rows.drop(columns=ROW_COLUMN)
+
+
+def stream_content(path, memory_mb=DEFAULT_MEMORY_MB, recent_days=DEFAULT_RECENT_DAYS, top_k=DEFAULT_TOP_K,
+                   retain_weeks=DEFAULT_RETAIN_WEEKS):
+    """content_detail을 청크로 읽으며 접은 결과 (StreamedContent)"""
+    chunk_rows = chunk_rows_for(path, memory_mb)
+    folder = ContentFolder(recent_days, top_k, retain_weeks)
+    with read_content_csv(path, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            folder.fold(chunk)
+    daily_cube, rows = folder.result()
+    meta = {'chunk_rows': chunk_rows, 'rows_read': folder.rows_read, 'rows_kept': int(len(rows)),
+            'cube_rows': int(len(daily_cube))}
+    return StreamedContent(daily_cube, rows, meta)
+
+
+# ----------------- 저장 / 재사용 -----------------
+def _paths(csv_path):
+    root = stream_dir(csv_path)
+    return root, os.path.join(root, 'days.parquet'), os.path.join(root, 'rows.parquet'), os.path.join(root, 'meta.json')
+
+
+def load_streamed(csv_path, memory_mb=DEFAULT_MEMORY_MB, recent_days=DEFAULT_RECENT_DAYS, top_k=DEFAULT_TOP_K,
+                  retain_weeks=DEFAULT_RETAIN_WEEKS):
+    """저장해 둔 결과가 원본/설정과 맞으면 그것을, 아니면 스트리밍으로 접고 저장 (쓸 수 없으면 메모리에만)"""
+    root, days_path, rows_path, meta_path = _paths(csv_path)
+    signature = snapshot.source_signature(csv_path)
+    # 메모리 상한은 청크 크기만 바꾸고 결과는 같으므로 키에서 제외
+    settings = {'recent_days': recent_days, 'top_k': top_k, 'retain_weeks': retain_weeks}
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if (meta.get('schema') == STREAM_FORMAT_VERSION and meta.get('source') == signature
+                and meta.get('settings') == settings):
+            return StreamedContent(pd.read_parquet(days_path), pd.read_parquet(rows_path), meta)
+    except (ImportError, OSError, ValueError):
+        pass
+
+    streamed = stream_content(csv_path, memory_mb, recent_days, top_k, retain_weeks)
+    meta = {'schema': STREAM_FORMAT_VERSION, 'source': signature, 'settings': settings, **streamed.meta}
+    try:
+        os.makedirs(root, exist_ok=True)
+        snapshot.write_parquet(days_path, streamed.daily_cube)
+        snapshot.write_parquet(rows_path, streamed.rows)
+        snapshot.write_json(meta_path, meta)
+    except (ImportError, OSError, ValueError):
+        pass  # 읽기 전용 NAS 경로: 저장 없이 진행
+    return streamed._replace(meta=meta)
+
+
+# ----------------- 엔진 -----------------
+class StreamingReportEngine(ReportEngine):
+    """스트리밍으로 접은 결과 위의 보고서 엔진 (기사 프레임 = 최근 N일 + 주별 TOP K 행)"""
+
+    def __init__(self, df_event, streamed, version=None, base_date=None, cache=None, figure_cache=None,
+                 view_curves=None, daily_metrics=None, traffic=None, pen_names=None):
+        super().__init__(df_event, streamed.rows, version=version, base_date=base_date, cache=cache,
+                         figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                         traffic=traffic, pen_names=pen_names)
+        self.daily_cube = streamed.daily_cube
+        self.stream_meta = streamed.meta
+
+    @property
+    def cube(self):
+        """주차 × 카테고리 × 기자 집계 큐브 (발행일 큐브를 현재 주차 구간으로 다시 묶음)"""
+        with self._lock:
+            if self._cube is None:
+                self._cube = weekly_from_daily(self.daily_cube, self.week_ranges)
+            return self._cube
+
+    def prepare(self, previous=None):
+        # 보관 행은 이전 버전의 앞부분을 유지하지 않으므로 제목 색인은 증분 갱신 없이 새로 만듦
+        return super().prepare(None)
+
+
+def load_streaming_engine(event_path=EVENT_SUMMARY_PATH, content_path=CONTENT_DETAIL_PATH, base_date=None,
+                          cache=None, version=None, figure_cache=None, view_curves=None, daily_metrics=None,
+                          traffic=None, pen_names=None, **settings):
+    """content_detail을 청크 스트리밍으로 접어(또는 저장된 결과를 읽어) 엔진 생성
+
+    settings(memory_mb, recent_days, top_k, retain_weeks)를 넘기지 않으면 환경 변수 값을 씁니다.
+    """
+    df_event = snapshot.load_with_snapshot(event_path, parse_event_csv)
+    streamed = load_streamed(content_path, **{**settings_from_env(), **settings})
+    return StreamingReportEngine(df_event, streamed, version=version, base_date=base_date, cache=cache,
+                                 figure_cache=figure_cache, view_curves=view_curves, daily_metrics=daily_metrics,
+                                 traffic=traffic, pen_names=pen_names)
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS(MB), 잴 수 없는 플랫폼(Windows)이면 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linux는 KB, macOS는 바이트 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def main(argv=None):
+    defaults = settings_from_env()
+    parser = argparse.ArgumentParser(description="content_detail을 청크 스트리밍으로 접어 저장")
+    parser.add_argument('--content-path', default=CONTENT_DETAIL_PATH)
+    parser.add_argument('--memory-mb', type=int, default=defaults['memory_mb'], help="청크 하나의 작업 메모리 상한(MB)")
+    parser.add_argument('--retain-weeks', type=int, default=defaults['retain_weeks'], help="접어 남길 최근 주 수 (이전 발행일은 버림)")
+    parser.add_argument('--recent-days', type=int, default=defaults['recent_days'], help="원본 행을 보관할 최근 일수")
+    parser.add_argument('--top-k', type=int, default=defaults['top_k'], help="주별로 보관할 상위 기사 수")
+    args = parser.parse_args(argv)
+
+    before = peak_rss_mb()
+    streamed = load_streamed(args.content_path, args.memory_mb, args.recent_days, args.top_k, args.retain_weeks)
+    meta = streamed.meta
+    summary = (f"{args.content_path}: 원본 {meta['rows_read']:,}행 (청크 {meta['chunk_rows']:,}행) -> "
+               f"보관 {meta['rows_kept']:,}행, 발행일 큐브 {meta['cube_rows']:,}행")
+    if before is not None:
+        summary += f", 최대 RSS 증가 {max(0.0, peak_rss_mb() - before):,.0f}MB"
+    print(summary)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""보고서 색상 팔레트 및 CSS (대시보드와 정적 HTML 보고서 공용)"""
+
+# ----------------- 컬러 팔레트 (Cook & Chef Identity) -----------------
+COLOR_NAVY = "#1a237e"
+COLOR_RED = "#d32f2f"
+COLOR_GREY = "#78909c"
+COLOR_BG_ACCENT = "#fffcf7"
+CHART_PALETTE = [COLOR_NAVY, COLOR_RED, "#5c6bc0", "#ef5350", "#8d6e63", COLOR_GREY]
+
+# ----------------- CSS 스타일링 (UI 개선) -----------------
+CSS = f"""
+<style>
+@import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard@v1.3.8/dist/web/static/pretendard.css');
+
+/* 기본 폰트 설정 */
+body {{
+    background-color: #ffffff;
+    font-family: 'Pretendard', sans-serif;
+    color: #263238;
+}}
+.block-container {{
+    padding-top: 2rem;
+    padding-bottom: 5rem;
+    max_width: 1600px;
+}}
+[data-testid="stSidebar"] {{ display: none; }}
+
+/* 헤더 타이틀 */
+.report-title {{
+    font-size: 2.6rem;
+    font-weight: 900;
+    color: {COLOR_NAVY};
+    margin-bottom: 0.5rem;
+    letter-spacing: -0.02em;
+    border-bottom: 4px solid {COLOR_RED};
+    padding-bottom: 15px;
+}}
+
+/* 데이터 집계 시간 */
+.update-time {{
+    color: {COLOR_NAVY};
+    font-weight: 700;
+    font-size: 1.1rem;
+    text-align: right;
+    margin-top: -15px;
+    margin-bottom: 30px;
+    font-family: monospace;
+}}
+
+/* KPI 카드 */
+.kpi-container {{
+    background-color: #fff;
+    border: 1px solid #eceff1;
+    border-top: 5px solid {COLOR_RED};
+    border-radius: 8px;
+    padding: 20px 10px;
+    text-align: center;
+    margin-bottom: 15px;
+    height: 160px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.03);
+}}
+.kpi-label {{
+    font-size: 1.1rem;
+    font-weight: 700;
+    color: #455a64; 
+    margin-bottom: 10px;
+    word-break: keep-all;
+}}
+.kpi-value {{
+    font-size: 2.4rem;
+    font-weight: 900;
+    color: {COLOR_NAVY};
+    line-height: 1.1;
+    letter-spacing: -0.03em;
+}}
+.kpi-unit {{
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: #90a4ae;
+    margin-left: 3px;
+}}
+
+/* 섹션 타이틀 */
+.section-header-container {{
+    margin-top: 50px;
+    margin-bottom: 25px;
+    padding: 15px 25px;
+    background-color: {COLOR_BG_ACCENT};
+    border-left: 8px solid {COLOR_NAVY};
+    border-radius: 4px;
+    width: 100%;
+}}
+.section-header {{
+    font-size: 1.8rem;
+    font-weight: 800;
+    color: {COLOR_NAVY};
+    margin: 0;
+}}
+.section-desc {{
+    font-size: 1rem;
+    color: #5d4037;
+    margin-top: 5px;
+    font-weight: 500;
+}}
+
+/* 차트 소제목 */
+.chart-header {{
+    font-size: 1.3rem;
+    font-weight: 700;
+    color: #37474f;
+    margin-top: 30px;
+    margin-bottom: 15px;
+    padding-left: 12px;
+    border-left: 4px solid {COLOR_RED};
+}}
+
+/* 섹션 선택 (탭 모양의 라디오: 선택된 섹션만 계산/렌더링) */
+[data-testid="stRadio"] [role="radiogroup"] {{
+    gap: 0px;
+    border-bottom: 2px solid #cfd8dc;
+    display: flex;
+    flex-wrap: nowrap;
+    width: 100%;
+}}
+[data-testid="stRadio"] [role="radiogroup"] > label {{
+    height: 60px;
+    margin: 0;
+    background-color: #f7f9fa;
+    border-right: 1px solid #eceff1;
+    color: #607d8b;
+    font-weight: 700;
+    font-size: 1.05rem;
+    flex-grow: 1;
+    text-align: center;
+    justify-content: center;
+    align-items: center;
+}}
+[data-testid="stRadio"] [role="radiogroup"] > label > div:first-child {{ display: none; }}
+[data-testid="stRadio"] [role="radiogroup"] > label:has(input:checked) {{
+    background-color: #fff;
+    color: {COLOR_RED};
+    border-bottom: 4px solid {COLOR_RED};
+}}
+
+/* 테이블 헤더 */
+[data-testid="stDataFrame"] thead th {{
+    background-color: {COLOR_NAVY} !important;
+    color: white !important;
+    font-size: 1rem !important;
+    font-weight: 600 !important;
+}}
+[data-testid="stDataFrame"] {{
+    border: 1px solid #cfd8dc;
+}}
+
+/* 인쇄용 설정 */
+@media print {{
+    @page {{ size: A4 landscape; margin: 5mm; }}
+    body {{ -webkit-print-color-adjust: exact; }}
+    .block-container {{ padding: 0 !important; max-width: 100% !important; }}
+    [data-testid="stRadio"], [data-testid="stCheckbox"], .print-btn-wrapper, .stSelectbox {{ display: none !important; }}
+}}
+</style>
+"""
@@ -0,0 +1,109 @@
+"""기사별 시간대 조회수 시계열 (발행 후 경과시간별 실제 누적 조회수)
+
+파이프라인이 매시 정각 기사별 누적 조회수를 스냅샷 파일에 추가합니다.
+
+    article_hourly_views.csv
+        page_path, snapshot_time, total_views
+        /news/view/1065601405329476, 2025-12-07 17:00, 312
+        /news/view/1065601405329476, 2025-12-07 18:00, 655
+
+시간당 DataFrame 한 행 대신, 기사(page_path 정렬 순서)별로 이어 붙인 연속 숫자 버퍼 두 개
+(관측 시각 키, 누적 조회수)와 기사별 시작 위치(offset)만 들고 있습니다. 관측 시각 키는
+(기사 번호 << 32 | 관측 시각의 epoch 시간)이라 전체 버퍼가 하나의 정렬된 배열이며,
+"발행 N시간 후 조회수"는 임의의 (기사, N) 묶음을 searchsorted 한 번으로 답합니다.
+
+- 발행 N시간 후 시각 이전의 마지막 관측값을 사용 (발행 직후 첫 관측 전이면 0)
+- 아직 N시간이 지나지 않았거나 마지막 관측 이후면 NaN (알 수 없음)
+- 같은 시각 관측이 여러 번이면 가장 큰 누적값
+"""
+import numpy as np
+import pandas as pd
+
+HOUR = np.timedelta64(1, 'h')
+
+
+def parse_hourly_csv(path):
+    """시간대 조회수 스냅샷 파일 파싱"""
+    df = pd.read_csv(path, encoding='utf-8-sig', usecols=['page_path', 'snapshot_time', 'total_views'])
+    df['snapshot_time'] = pd.to_datetime(df['snapshot_time'], errors='coerce')
+    df['total_views'] = pd.to_numeric(df['total_views'], errors='coerce')
+    return df.dropna(subset=['page_path', 'snapshot_time', 'total_views']).reset_index(drop=True)
+
+
+def _epoch_hours(times):
+    """datetime 배열/Series -> 1970-01-01 기준 경과 시간(정수, 내림)"""
+    values = np.asarray(pd.to_datetime(times), dtype='datetime64[ns]')
+    return (values.astype('datetime64[h]') - np.datetime64(0, 'h')).astype(np.int64)
+
+
+class ViewCurveStore:
+    """page_path별 시간대 누적 조회수 (연속 버퍼 + offset)"""
+
+    def __init__(self, df_hourly):
+        paths, article = np.unique(df_hourly['page_path'].astype(str).to_numpy(), return_inverse=True)
+        hours = _epoch_hours(df_hourly['snapshot_time'])
+        views = df_hourly['total_views'].to_numpy(dtype=np.int64)
+
+        # (기사, 시각) 순 정렬 후 같은 시각은 최대 누적값 하나만 남김
+        keys = (article.astype(np.int64) << 32) | hours
+        order = np.lexsort((views, keys))
+        keys, views = keys[order], views[order]
+        last = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[1:] != keys[:-1]
+
+        self.paths = paths
+        self.keys = keys[last]
+        self.views = views[last].astype(np.int32 if views.max(initial=0) < 2**31 else np.int64)
+        self.offsets = np.searchsorted(self.keys >> 32, np.arange(len(paths) + 1))
+
+    @property
+    def articles(self):
+        return len(self.paths)
+
+    @property
+    def nbytes(self):
+        return int(self.keys.nbytes + self.views.nbytes + self.offsets.nbytes)
+
+    def _article_ids(self, page_paths):
+        """page_path -> 기사 번호 (없으면 -1)"""
+        page_paths = np.asarray(page_paths, dtype=object).astype(str)
+        pos = np.searchsorted(self.paths, page_paths)
+        pos = np.minimum(pos, max(len(self.paths) - 1, 0))
+        found = (self.paths[pos] == page_paths) if len(self.paths) else np.zeros(len(page_paths), dtype=bool)
+        return np.where(found, pos, -1)
+
+    def views_at(self, page_paths, published, hours):
+        """기사 × 경과시간 누적 조회수 행렬 (len(page_paths) × len(hours), 알 수 없으면 NaN)
+
+        published: 기사별 발행일시, hours: 발행 후 경과시간(시간) 목록
+        """
+        if not len(self.paths):
+            return np.full((len(page_paths), len(hours)), np.nan)
+        article = self._article_ids(page_paths)[:, None]
+        hours = np.asarray(hours, dtype=np.int64)[None, :]
+        published = np.asarray(pd.to_datetime(published), dtype='datetime64[ns]')
+        target = ((published[:, None] + hours * HOUR).astype('datetime64[h]') - np.datetime64(0, 'h')).astype(np.int64)
+
+        # 기사 구간 안에서 목표 시각 이하의 마지막 관측 위치
+        safe_article = np.maximum(article, 0)
+        pos = np.searchsorted(self.keys, (safe_article << 32) | target, side='right') - 1
+        start = self.offsets[safe_article]
+        end = self.offsets[safe_article + 1]
+        has_before = pos >= start
+        values = np.where(has_before, self.views[np.clip(pos, 0, max(len(self.views) - 1, 0))], 0).astype(np.float64)
+
+        # 마지막 관측 이후(아직 도달 전이거나 수집 중단)는 알 수 없음
+        last_hour = np.where(end > start, self.keys[np.maximum(end - 1, 0)] & 0xFFFFFFFF, -1)
+        unknown = (article < 0) | (end <= start) | (target > last_hour) | np.isnat(published)[:, None]
+        values[unknown] = np.nan
+        return values
+
+    def curves(self, page_paths, published, max_hours=48):
+        """기사별 0~max_hours시간 누적 조회수 (긴 형식: 기사 순번, 경과시간, 누적조회수)"""
+        hours = np.arange(max_hours + 1)
+        values = self.views_at(page_paths, published, hours)
+        return pd.DataFrame({
+            'article': np.repeat(np.arange(len(values)), len(hours)),
+            '경과시간': np.tile(hours, len(values)),
+            '누적조회수': values.ravel(),
+        })
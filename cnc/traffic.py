@@ -0,0 +1,281 @@
+"""유입경로(트래픽 소스) 원본의 스트리밍 집계
+
+리퍼러 원본은 조회(히트)/세션 단위로 한 행씩 쌓이는 큰 파일입니다.
+
+    traffic_hits.csv
+        timestamp, source, page_path[, views]
+        2025-12-07 17:02:11, m.search.naver.com, /news/view/1065601405329476, 1
+        2025-12-07 17:02:15, (direct), /news/view/1065601405329476, 3
+
+전체를 메모리에 올리지 않고 CHUNK_BYTES 단위(행 경계로 자름)로 읽으면서 바로 줄여
+두 가지 합계 표만 남깁니다. 보고서는 원본 대신 이 표만 읽습니다.
+
+- 채널 × 날짜 조회수: 주차/직전주 유입경로 비중 (주차 구간은 기준일에 따라 달라지므로 날짜로 저장)
+- 채널 × page_path 조회수: TOP 기사별 유입경로
+
+합계는 더하기만 하므로, 원본 끝에 행이 추가되면(offset/지문 확인) 새 꼬리만 집계해 기존 표에
+더합니다. 앞부분이 바뀌었으면 전체를 다시 집계합니다. 집계 표는 원본 옆
+`<이름>.by_day.parquet`, `<이름>.by_page.parquet`, `<이름>.traffic.json`(반영 위치)에 저장하며,
+쓸 수 없는 경로면 메모리에만 둡니다.
+
+    python -m cnc.traffic traffic_hits.csv    # 파이프라인에서 미리 집계
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from cnc import snapshot
+from cnc.incremental import complete_lines, prefix_hash, resume_point, source_state
+
+# 채널 분류가 바뀌면 올려서 저장된 집계를 다시 만듭니다.
+TRAFFIC_FORMAT_VERSION = 2
+# 한 번에 파싱할 원본 바이트 수 (파싱 중 메모리는 대략 이 크기의 10~15배)
+CHUNK_BYTES = 16 * 1024 * 1024
+# 아직 합치지 않은 청크별 부분 합계가 이 행 수와 누적 합계 행 수를 모두 넘으면 중간 합산
+MERGE_ROWS = 250_000
+
+# 보고서 유입경로 채널 (표시 순서)
+CHANNELS = ['네이버', '직접', '구글', 'SNS', '다음', '기타']
+# 직접 유입으로 보는 소스 값 (값 전체가 같을 때만)
+DIRECT_SOURCES = {'', '(direct)', '(none)', 'direct'}
+# 채널 규칙 (앞의 규칙 우선, 해당 없으면 '기타'): 리퍼러 호스트의 점으로 나뉜 이름 하나가 labels에 있거나,
+# 호스트가 domains 중 하나이거나 그 하위 도메인이면 해당 채널 (news.mt.co.kr이 t.co로 잡히지 않도록 부분 문자열은 보지 않음)
+CHANNEL_RULES = [
+    ('네이버', {'naver'}, set()),
+    ('구글', {'google'}, set()),
+    ('다음', {'daum'}, set()),
+    ('SNS', {'facebook', 'instagram', 'kakao', 'kakaotalk', 'twitter', 'threads', 'youtube'},
+     {'t.co', 'x.com', 'band.us', 'youtu.be'}),
+]
+
+
+def source_host(source):
+    """소스 문자열(호스트, URL, 'google' 같은 이름) -> 소문자 호스트 (스킴/경로/포트 제거)"""
+    host = source.strip().lower()
+    if '://' in host:
+        host = host.split('://', 1)[1]
+    for sep in '/?#':
+        host = host.split(sep, 1)[0]
+    return host.rsplit('@', 1)[-1].split(':', 1)[0].strip('.')
+
+
+def _channel(source):
+    source = source.strip().lower()
+    if source in DIRECT_SOURCES:
+        return '직접'
+    host = source_host(source)
+    labels = host.split('.')
+    for channel, names, domains in CHANNEL_RULES:
+        if any(label in names for label in labels) or any(host == d or host.endswith('.' + d) for d in domains):
+            return channel
+    return '기타'
+
+
+def channel_of(sources):
+    """소스 문자열 배열 -> 채널 배열 (빈 값은 '직접', 분류는 고유 소스마다 한 번)"""
+    codes, uniques = pd.factorize(pd.Series(sources, dtype=object).fillna('').astype(str))
+    channels = np.array([_channel(source) for source in uniques], dtype=object)
+    return channels[codes]
+
+
+def aggregate_paths(csv_path):
+    """원본 경로 -> (채널×날짜 parquet, 채널×기사 parquet, 메타 json)"""
+    base, _ = os.path.splitext(csv_path)
+    return base + '.by_day.parquet', base + '.by_page.parquet', base + '.traffic.json'
+
+
+def reduce_chunk(df):
+    """원본 행 청크 -> (채널×날짜 합계, 채널×기사 합계) 부분 집계"""
+    views = pd.to_numeric(df['views'], errors='coerce').fillna(0) if 'views' in df else pd.Series(1, index=df.index)
+    # 시각 문자열 앞 10자(YYYY-MM-DD)만으로 날짜를 묶고, 변환은 고유 날짜에만 적용
+    day = df['timestamp'].astype(str).str.slice(0, 10)
+    source = df['source'].fillna('').astype(str)
+    by_source_day = views.groupby([source, day]).sum()
+    by_source_page = views.groupby([source, df['page_path'].astype(str)]).sum()
+
+    by_day = by_source_day.reset_index()
+    by_day.columns = ['source', 'date', 'views']
+    by_day['channel'] = channel_of(by_day['source'])
+    by_day['date'] = pd.to_datetime(by_day['date'], errors='coerce')
+    by_day = by_day.dropna(subset=['date']).groupby(['date', 'channel'], as_index=False)['views'].sum()
+
+    by_page = by_source_page.reset_index()
+    by_page.columns = ['source', 'page_path', 'views']
+    by_page['channel'] = channel_of(by_page['source'])
+    by_page = by_page.groupby(['page_path', 'channel'], as_index=False)['views'].sum()
+    return by_day, by_page
+
+
+def _combine(frames, keys):
+    """부분 집계 목록을 키별로 합산 (키 순으로 정렬)"""
+    frames = [f for f in frames if f is not None and len(f)]
+    if not frames:
+        return pd.DataFrame({k: pd.Series(dtype='datetime64[ns]' if k == 'date' else object) for k in keys}
+                            | {'views': pd.Series(dtype='int64')})
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    df = df.groupby(keys, as_index=False, sort=True)['views'].sum()
+    df['views'] = df['views'].round().astype('int64')
+    return df
+
+
+def stream_reduce(f, header, start, end, chunk_bytes=CHUNK_BYTES, hashed=None):
+    """파일 f의 [start, end) 바이트(완결된 행)를 chunk_bytes씩 읽어 집계 (by_day, by_page, 읽은 행 수)
+
+    hashed(hashlib 객체)를 주면 읽은 바이트를 그대로 더해, 원본 위치 기록에 쓸 해시를 다시 읽지 않고 얻습니다.
+    """
+    day_parts, page_parts, rows, pending = [], [], 0, 0
+    f.seek(start)
+    position = start
+    while position < end:
+        block = f.read(min(chunk_bytes, end - position))
+        if position + len(block) < end:
+            # 청크 끝의 잘린 행은 다음 청크로 넘김
+            cut = block.rfind(b'\n') + 1
+            if cut == 0:
+                block += f.readline()
+                cut = len(block)
+            f.seek(position + cut)
+            block = block[:cut]
+        position += len(block)
+        if hashed is not None:
+            hashed.update(block)
+
+        df = pd.read_csv(io.BytesIO(header + block), encoding='utf-8-sig', dtype={'source': str, 'page_path': str})
+        rows += len(df)
+        by_day, by_page = reduce_chunk(df)
+        day_parts.append(by_day)
+        page_parts.append(by_page)
+        pending += len(by_page)
+        # 부분 합계가 누적 합계만큼 쌓일 때마다 합쳐서, 합산 비용과 메모리를 모두 누적 합계 크기 수준으로 유지
+        if pending > max(MERGE_ROWS, len(page_parts[0])):
+            page_parts = [_combine(page_parts, ['page_path', 'channel'])]
+            day_parts = [_combine(day_parts, ['date', 'channel'])]
+            pending = 0
+    return _combine(day_parts, ['date', 'channel']), _combine(page_parts, ['page_path', 'channel']), rows
+
+
+class TrafficAggregates:
+    """유입경로 합계 표 (채널×날짜, 채널×기사)와 원본 반영 위치"""
+
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self.by_day = _combine([], ['date', 'channel'])
+        self.by_page = _combine([], ['page_path', 'channel'])
+        self.state = None
+        self._hashed = None  # state['offset']까지 넣은 hashlib 객체 (다음 반영 때 꼬리만 더함)
+        self._page_keys = None  # (by_page, 그 page_path 배열) 조회용, by_page가 바뀌면 다시 만듦
+        self.persistent = True
+        self.last_mode = None  # 'stored' | 'full' | 'append' | 'unchanged'
+        self.last_rows = 0
+        self._lock = threading.Lock()
+
+    # ----------------- 저장 -----------------
+    def _load_stored(self):
+        day_path, page_path, meta_path = aggregate_paths(self.csv_path)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('schema') != TRAFFIC_FORMAT_VERSION:
+                return
+            by_day, by_page = pd.read_parquet(day_path), pd.read_parquet(page_path)
+        except (ImportError, OSError, ValueError):
+            return
+        self.by_day, self.by_page, self.state = by_day, by_page, meta['source']
+        self._hashed = None
+        self._page_keys = None
+
+    def _store(self):
+        day_path, page_path, meta_path = aggregate_paths(self.csv_path)
+        try:
+            snapshot.write_parquet(day_path, self.by_day)
+            snapshot.write_parquet(page_path, self.by_page)
+            snapshot.write_json(meta_path, {'schema': TRAFFIC_FORMAT_VERSION, 'source': self.state})
+        except (ImportError, OSError, ValueError):
+            # 읽기 전용 NAS 경로: 집계는 이 프로세스 메모리에만 유지
+            self.persistent = False
+
+    # ----------------- 원본 반영 -----------------
+    def sync(self, chunk_bytes=CHUNK_BYTES):
+        """원본에서 아직 집계하지 않은 행만 스트리밍 집계해 합계 표에 반영"""
+        with self._lock:
+            if self.state is None and self.persistent:
+                self._load_stored()
+                self.last_mode = 'stored'
+            with open(self.csv_path, 'rb') as f:
+                size = snapshot.source_signature(self.csv_path)['size']
+                header = f.readline()
+                f.seek(max(len(header), size - chunk_bytes))
+                end = max(len(header), f.tell() + len(complete_lines(f.read())))
+                offset, verified = resume_point(f, size, header, self.state)
+
+                if offset is None:
+                    hashed = hashlib.sha1(header)
+                    self.by_day, self.by_page, self.last_rows = stream_reduce(f, header, len(header), end, chunk_bytes,
+                                                                              hashed)
+                    self.last_mode = 'full'
+                elif end > offset:
+                    # 앞부분 해시(확인 중 계산했거나 지난 반영에서 이어 온 것)에 새 꼬리만 더함
+                    hashed = (verified or self._hashed or prefix_hash(f, offset)).copy()
+                    by_day, by_page, self.last_rows = stream_reduce(f, header, offset, end, chunk_bytes, hashed)
+                    self.by_day = _combine([self.by_day, by_day], ['date', 'channel'])
+                    self.by_page = _combine([self.by_page, by_page], ['page_path', 'channel'])
+                    self.last_mode = 'append'
+                else:
+                    if self.last_mode != 'stored':
+                        self.last_mode = 'unchanged'
+                    self.last_rows = 0
+                    self._hashed = verified or self._hashed
+                    return self
+
+                self._hashed = hashed
+                self.state = source_state(f, header, end, hashed=hashed)
+                self._page_keys = None
+            if self.persistent:
+                self._store()
+            return self
+
+    # ----------------- 조회 -----------------
+    def channel_views(self, start, end):
+        """start~end(포함) 날짜의 채널별 조회수 (CHANNELS 순서, 없는 채널은 0)"""
+        dates = self.by_day['date'].to_numpy(dtype='datetime64[ns]')
+        lo = np.searchsorted(dates, pd.Timestamp(start).normalize().to_datetime64(), side='left')
+        hi = np.searchsorted(dates, pd.Timestamp(end).normalize().to_datetime64(), side='right')
+        totals = self.by_day.iloc[lo:hi].groupby('channel')['views'].sum()
+        return pd.DataFrame({'유입경로': CHANNELS, '조회수': totals.reindex(CHANNELS, fill_value=0).to_numpy(dtype='int64')})
+
+    def page_channels(self, page_paths):
+        """기사별 채널 조회수 (긴 형식: page_path, channel, views, 기사/채널 순서 유지)"""
+        # 공유 저장소는 다른 스레드의 sync()가 표를 바꿀 수 있으므로 표와 키 배열을 한 쌍으로 읽음
+        by_page = self.by_page
+        cached = self._page_keys
+        if cached is None or cached[0] is not by_page:
+            cached = self._page_keys = (by_page, by_page['page_path'].to_numpy(dtype=object).astype(str))
+        keys = cached[1]
+        page_paths = np.asarray(page_paths, dtype=object).astype(str)
+        lo = np.searchsorted(keys, page_paths, side='left')
+        hi = np.searchsorted(keys, page_paths, side='right')
+        rows = np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)]) if len(page_paths) else np.array([], dtype=int)
+        return by_page.iloc[rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="유입경로 원본을 채널별 합계 표로 집계")
+    parser.add_argument('path', help="조회/세션 단위 유입경로 원본 CSV")
+    parser.add_argument('--chunk-mb', type=int, default=CHUNK_BYTES // (1024 * 1024), help="한 번에 읽을 크기(MB)")
+    args = parser.parse_args(argv)
+
+    aggregates = TrafficAggregates(args.path).sync(args.chunk_mb * 1024 * 1024)
+    print(f"{args.path}: {aggregates.last_mode}, 새 행 {aggregates.last_rows:,}개, "
+          f"채널×날짜 {len(aggregates.by_day):,}행, 채널×기사 {len(aggregates.by_page):,}행")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""마스터 시트 감시 및 백그라운드 교체
+
+NAS의 마스터 시트는 정해진 일정에 갱신됩니다. 요청 안에서 다시 읽으면 갱신 후 첫 사용자가
+전체 재로드 비용을 떠안게 되므로, 백그라운드 스레드가 주기적으로 파일 서명(크기/수정시각)을
+확인하고 새 버전이면 엔진과 파생 인덱스를 요청 경로 밖에서 만든 뒤 참조 하나만 바꿔 끼웁니다.
+
+- 요청은 get()으로 그 시점의 엔진을 받아 끝까지 그것만 사용하므로, 진행 중인 실행은 이전
+  버전으로 마치고 다음 실행부터 새 버전을 봅니다.
+- 파일을 쓰는 도중일 수 있으므로 같은 새 서명이 두 번 연속 관찰될 때 다시 만듭니다.
+- 네트워크 드라이브에서는 inotify 같은 변경 알림을 믿을 수 없어 폴링합니다.
+- 다시 만들다 실패하면 이전 엔진을 계속 쓰고 오류만 기록합니다.
+"""
+import threading
+import time
+from datetime import date, datetime
+
+from cnc.loader import data_version
+
+
+class DatasetWatcher:
+    """파일 서명 폴링 -> 백그라운드 재구성 -> 원자적 교체"""
+
+    def __init__(self, event_path, content_path, build, interval=30.0, today=date.today, optional_paths=()):
+        self.event_path = event_path
+        self.content_path = content_path
+        self.optional_paths = tuple(optional_paths)  # 없어도 되는 추가 원본 (생기거나 바뀌면 다시 만듦)
+        self.build = build  # build(base_date, previous) -> 파생 인덱스까지 준비된 엔진 (version 속성 필요)
+        self.interval = interval
+        self.today = today
+
+        self._current = None  # 현재 엔진 (참조 교체만 하므로 읽기는 잠금 불필요)
+        self._signature = None  # (데이터 버전, 기준일)
+        self._pending = None
+        self._build_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.builds = 0
+        self.last_check = None
+        self.last_swap = None
+        self.last_build_seconds = None
+        self.last_error = None
+        self.last_exception = None
+
+    # ----------------- 조회 -----------------
+    def get(self):
+        """현재 엔진 (한 번도 로드하지 못했으면 None, 오류는 last_error)"""
+        return self._current
+
+    def status(self):
+        return {
+            'version': self._signature[0] if self._signature else None,
+            'base_date': str(self._signature[1]) if self._signature else None,
+            'pending': self._pending[0] if self._pending else None,
+            'builds': self.builds,
+            'interval_sec': self.interval,
+            'last_check': self.last_check,
+            'last_swap': self.last_swap,
+            'last_build_sec': self.last_build_seconds,
+            'last_error': self.last_error,
+            'running': self._thread is not None and self._thread.is_alive(),
+        }
+
+    # ----------------- 감시 -----------------
+    def _observe(self):
+        return data_version(self.event_path, self.content_path, *self.optional_paths), self.today()
+
+    def _rebuild(self, base_date):
+        started = time.perf_counter()
+        # 직전 엔진을 넘겨 추가분만 색인할 수 있는 파생 인덱스는 이어서 만듦
+        engine = self.build(base_date, self._current)
+        self.last_build_seconds = round(time.perf_counter() - started, 3)
+        # 엔진이 실제로 읽은 버전으로 기록 (읽는 도중 파일이 또 바뀌었으면 다음 확인 때 다시 만듦)
+        self._signature = (engine.version, base_date)
+        self._current = engine
+        self._pending = None
+        self.builds += 1
+        self.last_swap = datetime.now().isoformat(timespec='seconds')
+        self.last_error = self.last_exception = None
+
+    def check_now(self):
+        """서명을 한 번 확인하고 필요하면 다시 만들어 교체 (교체했으면 True)"""
+        with self._build_lock:
+            self.last_check = datetime.now().isoformat(timespec='seconds')
+            try:
+                signature = self._observe()
+                if signature == self._signature:
+                    self._pending = None
+                    return False
+                # 처음 로드이거나, 같은 새 서명이 두 번 연속 관찰되면(쓰기 완료) 다시 만듦
+                if self._current is not None and signature != self._pending:
+                    self._pending = signature
+                    return False
+                self._rebuild(signature[1])
+                return True
+            except Exception as e:
+                self.last_exception = e
+                self.last_error = f"{type(e).__name__}: {e}"
+                return False
+
+    def start(self):
+        """첫 로드는 호출 스레드에서 수행하고, 이후 감시 스레드 시작"""
+        self.check_now()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='cnc-dataset-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check_now()
@@ -0,0 +1,110 @@
+"""주차(week_id) 목록과 주차별 날짜 범위"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+
+def week_ranges(df_event, base_date=None):
+    """week_id -> (시작일, 종료일) 매핑
+
+    가장 최근 주차가 base_date(기본: 오늘) 직전 일요일에 끝난다고 보고 역산합니다.
+    0주차는 1월 1일부터 1주차 종료일까지로 표기되며, 겹치는 날짜는 assign_week_ids에서
+    시작일이 늦은 주차에 배정됩니다.
+    """
+    if df_event.empty:
+        return {}
+
+    # 0주차도 포함하여 유효한 주차 목록 생성
+    valid_weeks = sorted((int(w) for w in df_event['week_id'].unique() if w >= 0), reverse=True)
+    if not valid_weeks:
+        return {}
+
+    base_date = base_date or datetime.now().date()
+    latest_week_id = valid_weeks[0]
+    base_sunday = base_date - timedelta(days=base_date.weekday() + 1)
+
+    ranges = {}
+    for week_num in valid_weeks:
+        if week_num == 0:
+            # 0주차 처리
+            end_date = base_sunday - timedelta(weeks=latest_week_id - 1)
+            start_date = end_date.replace(month=1, day=1)
+        else:
+            # 1주차 이상은 정상 주차로 간주하고 기간 역산
+            end_date = base_sunday - timedelta(weeks=latest_week_id - week_num)
+            start_date = end_date - timedelta(days=6)
+        ranges[week_num] = (start_date, end_date)
+    return ranges
+
+
+def generate_week_map(df_event, base_date=None):
+    """'NN주' -> 기간 문자열 매핑 (주차 내림차순)"""
+    week_map = {}
+    for week_num, (start_date, end_date) in week_ranges(df_event, base_date).items():
+        week_key = f"{week_num:02d}주"
+        if week_num == 0:
+            week_map[week_key] = f"01.01 ~ {end_date.strftime('%m.%d')}"
+        else:
+            week_map[week_key] = f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}"
+
+    # 주차를 내림차순으로 정렬하여 반환
+    return dict(sorted(week_map.items(), key=lambda item: item[0], reverse=True))
+
+
+def week_bounds(ranges):
+    """주차 범위를 (week_id 배열, 시작 시각, 종료 시각(미포함)) numpy 배열로 변환 (시작 시각 오름차순)
+
+    구간이 겹치면 앞 주차의 종료 시각을 다음 주차의 시작 시각으로 잘라 서로 겹치지 않게 합니다.
+    """
+    items = sorted(ranges.items(), key=lambda item: item[1][0])
+    week_ids = np.array([w for w, _ in items], dtype=np.int64)
+    starts = np.array([np.datetime64(s, 'ns') for _, (s, _) in items], dtype='datetime64[ns]')
+    ends = np.array([np.datetime64(e, 'ns') + np.timedelta64(1, 'D') for _, (_, e) in items], dtype='datetime64[ns]')
+    if len(ends) > 1:
+        ends[:-1] = np.minimum(ends[:-1], starts[1:])
+    return week_ids, starts, ends
+
+
+def assign_week_ids(datetimes, ranges):
+    """발행일시 배열을 week_id로 변환 (어느 주차에도 속하지 않으면 -1)"""
+    week_ids, starts, ends = week_bounds(ranges)
+    values = pd.to_datetime(pd.Series(datetimes)).to_numpy(dtype='datetime64[ns]')
+    if len(week_ids) == 0:
+        return np.full(len(values), -1, dtype=np.int64)
+
+    # 이진 탐색으로 각 시각이 속한 주차 구간을 찾음
+    idx = np.searchsorted(starts, values, side='right') - 1
+    safe_idx = idx.clip(0)
+    inside = (idx >= 0) & (values < ends[safe_idx])
+    return np.where(inside, week_ids[safe_idx], -1)
+
+
+class WeekIndex:
+    """publishing_datetime 오름차순으로 정렬된 기사 프레임 위의 주차 경계 인덱스
+
+    주차별 (시작 행, 끝 행) 위치를 searchsorted로 한 번만 계산해 두므로,
+    주차 선택은 전체 프레임을 복사하거나 훑지 않고 연속 구간 슬라이스로 끝납니다.
+    """
+
+    def __init__(self, df_content, ranges):
+        times = df_content['publishing_datetime']
+        if not times.is_monotonic_increasing:
+            df_content = df_content.sort_values('publishing_datetime', kind='stable', na_position='last', ignore_index=True)
+            times = df_content['publishing_datetime']
+        self.df = df_content
+
+        values = times.to_numpy(dtype='datetime64[ns]')
+        week_ids, starts, ends = week_bounds(ranges)
+        lo = np.searchsorted(values, starts, side='left')
+        hi = np.searchsorted(values, ends, side='left')
+        self.positions = {int(w): (int(a), int(b)) for w, a, b in zip(week_ids, lo, hi)}
+
+    def rows(self, week_id):
+        """해당 주차에 발행된 기사 행 (원본 프레임의 슬라이스, 없는 주차면 빈 프레임)"""
+        lo, hi = self.positions.get(week_id, (0, 0))
+        return self.df.iloc[lo:hi]
+
+    def count(self, week_id):
+        lo, hi = self.positions.get(week_id, (0, 0))
+        return hi - lo
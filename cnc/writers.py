@@ -0,0 +1,94 @@
+"""기자 필명 ↔ 본명 매핑과 주차별 기자 집계표
+
+매핑 파일은 필명 하나당 한 행입니다 (한 기자가 여러 필명을 쓸 수 있음).
+
+    pen_names.csv
+        pen_name, real_name        (또는 필명, 본명)
+        맛객, 이경엽
+        Chef J, 조용수
+
+기사의 writer_name(바이라인)은 필명일 수도, 본명일 수도 있습니다. 필명과 본명을 모두 키로 넣은
+해시 인덱스(pd.Index) 하나로 바이라인 -> (본명, 필명)을 찾되, 기사 행마다가 아니라 주차 큐브의
+고유 기자(정수 코드)마다 한 번만 조회합니다. 매핑에 없는 바이라인은 본명이자 필명으로 봅니다.
+
+주차별 기자 집계표는 (본명, 필명) 한 쌍당 한 행이며, 7번(본명 기준)/8번(필명 기준) 탭은 이 표를
+각각 본명/필명으로 다시 합산해 씁니다.
+"""
+import numpy as np
+import pandas as pd
+
+from cnc.cube import CUBE_MEASURES, rollup
+
+# 매핑 파일 열 이름 (영문 또는 한글 헤더)
+PEN_NAME_COLUMNS = {'필명': 'pen_name', '본명': 'real_name'}
+
+
+def parse_pen_name_csv(path):
+    """필명-본명 매핑 파일 파싱 (빈 값 제외, 같은 필명은 마지막 행)"""
+    df = pd.read_csv(path, encoding='utf-8-sig', dtype=str).rename(columns=PEN_NAME_COLUMNS)
+    df = df[['pen_name', 'real_name']].apply(lambda s: s.str.strip())
+    df = df.dropna().loc[lambda d: (d['pen_name'] != '') & (d['real_name'] != '')]
+    return df.drop_duplicates('pen_name', keep='last').reset_index(drop=True)
+
+
+class PenNameMap:
+    """바이라인(필명 또는 본명) -> (본명, 대표 필명) 해시 조회"""
+
+    def __init__(self, df_map):
+        pens = df_map['pen_name'].to_numpy(dtype=object)
+        reals = df_map['real_name'].to_numpy(dtype=object)
+        # 본명으로 쓴 바이라인은 그 기자의 첫 번째 필명으로 표시 (필명 키가 우선)
+        first_pen = pd.Series(pens).groupby(reals, sort=False).first()
+        real_keys = first_pen.index[~first_pen.index.isin(pens)]
+
+        self.keys = pd.Index(np.concatenate([pens, real_keys.to_numpy(dtype=object)]))
+        self.real_names = np.concatenate([reals, real_keys.to_numpy(dtype=object)])
+        self.pen_names = np.concatenate([pens, first_pen.loc[real_keys].to_numpy(dtype=object)])
+
+    def resolve(self, bylines):
+        """바이라인 배열 -> (본명 배열, 필명 배열), 매핑에 없으면 바이라인 그대로"""
+        bylines = pd.Series(bylines, dtype=object).fillna('').astype(str).str.strip().to_numpy(dtype=object)
+        pos = self.keys.get_indexer(bylines)
+        found = pos >= 0
+        real = np.where(found, self.real_names[pos], bylines)
+        pen = np.where(found, self.pen_names[pos], bylines)
+        return real, pen
+
+
+def writer_table(cube_week, pen_names=None):
+    """선택 주차 큐브 조각 -> (본명, 필명)별 집계표 (해당 주 발행 기사 전체 기준)
+
+    큐브의 writer_name은 카테고리(정수 코드)이므로 기자별 합산은 코드 단위로 끝나고,
+    필명/본명 조회는 고유 기자 수만큼만 합니다.
+    """
+    by_writer = rollup(cube_week, ['writer_name'])
+    bylines = by_writer['writer_name'].astype(str).to_numpy(dtype=object)
+    if pen_names is not None:
+        real, pen = pen_names.resolve(bylines)
+    else:
+        real, pen = bylines, bylines
+    df = pd.DataFrame({'본명': real, '필명': pen})
+    for col in CUBE_MEASURES:
+        df[col] = by_writer[col].to_numpy()
+    return df.groupby(['본명', '필명'], sort=False, as_index=False)[list(CUBE_MEASURES)].sum()
+
+
+def leaderboard(df_writers, by):
+    """기자 집계표를 by('본명' 또는 '필명') 기준으로 합산한 순위표 (전체 조회 수 내림차순)
+
+    다른 쪽 이름은 같은 기자의 이름을 ', '로 이어 붙입니다.
+    """
+    other = '필명' if by == '본명' else '본명'
+    grouped = df_writers.groupby(by, sort=False)
+    board = grouped[list(CUBE_MEASURES)].sum()
+    # 대부분 이름이 하나뿐이므로 첫 이름을 쓰고, 여러 개인 기자만 이어 붙임
+    board[other] = grouped[other].first()
+    multi = grouped.size() > 1
+    if multi.any():
+        df_multi = df_writers[df_writers[by].isin(multi.index[multi])]
+        board.loc[multi[multi].index, other] = df_multi.groupby(by, sort=False)[other].agg(
+            lambda names: ', '.join(dict.fromkeys(names)))
+    board = board.reset_index().sort_values(['total_views', by], ascending=[False, True], ignore_index=True)
+    board['순위'] = np.arange(1, len(board) + 1)
+    board['평균조회수'] = (board['total_views'] / board['article_count'].where(board['article_count'] > 0)).fillna(0).astype(int)
+    return board
@@ -0,0 +1,34 @@
+"""테스트 공용 픽스처: 저장소에 들어 있는 실제 마스터 시트를 잘라 임시 폴더에 씀"""
+import os
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT_CSV = os.path.join(ROOT_DIR, 'content_detail_master_sheet.csv')
+EVENT_CSV = os.path.join(ROOT_DIR, 'event_summary_master_sheet.csv')
+
+
+@pytest.fixture(scope='session')
+def content_lines():
+    """content_detail 시트의 행 바이트 목록 (0번은 헤더)"""
+    with open(CONTENT_CSV, 'rb') as f:
+        return f.read().splitlines(keepends=True)
+
+
+@pytest.fixture
+def sheet_dir(tmp_path):
+    """event_summary 시트를 복사해 둔 임시 폴더 (content_detail은 테스트마다 씀)"""
+    with open(EVENT_CSV, 'rb') as src, open(tmp_path / 'event_summary_master_sheet.csv', 'wb') as dst:
+        dst.write(src.read())
+    return tmp_path
+
+
+def write_lines(path, lines, mode='wb'):
+    with open(path, mode) as f:
+        f.write(b''.join(lines))
+
+
+def bump_mtime(path, seconds=1):
+    """수정 시각을 확실히 다르게 (파일 시스템 시각 해상도와 무관하게)"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
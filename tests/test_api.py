@@ -0,0 +1,114 @@
+"""cnc.api: ETag/Last-Modified 재검증(304), 경로/인자 오류, 데이터 갱신 후 새 ETag"""
+import json
+import os
+from datetime import date, datetime
+from email.utils import formatdate
+from http import HTTPStatus
+
+import pytest
+
+from cnc.api import JsonApi
+from cnc.engine import load_engine
+from cnc.watcher import DatasetWatcher
+from tests.conftest import CONTENT_CSV, EVENT_CSV, bump_mtime
+
+OPTIONAL = ('hourly_path', 'daily_path', 'traffic_path', 'pen_names_path')
+
+
+def _make_api(tmp_path, mtime=None):
+    paths = {}
+    for name, src in (('event_path', EVENT_CSV), ('content_path', CONTENT_CSV)):
+        paths[name] = str(tmp_path / os.path.basename(src))
+        with open(src, 'rb') as f_src, open(paths[name], 'wb') as f_dst:
+            f_dst.write(f_src.read())
+        if mtime is not None:
+            os.utime(paths[name], (mtime, mtime))
+    optional = {name: str(tmp_path / f'missing_{name}.csv') for name in OPTIONAL}
+
+    def build(base_date, previous):
+        return load_engine(base_date=base_date, **paths, **optional).prepare(previous)
+
+    watcher = DatasetWatcher(paths['event_path'], paths['content_path'], build, today=lambda: date(2025, 12, 10),
+                             optional_paths=tuple(optional.values()))
+    watcher.check_now()
+    return JsonApi(watcher)
+
+
+@pytest.fixture
+def api(tmp_path):
+    return _make_api(tmp_path)
+
+
+def _get(api, path, query=None, **headers):
+    return api.respond(path, query or {}, headers)
+
+
+def test_ok_response_has_validators(api):
+    status, headers, body = _get(api, '/api/weeks/latest/top', {'n': ['5']})
+    assert status == HTTPStatus.OK
+    assert headers['ETag'].startswith('"') and 'Last-Modified' in headers
+    payload = json.loads(body)
+    assert len(payload['data']) <= 5 and payload['data_version'] == api.watcher.get().version
+
+
+def test_matching_etag_is_not_modified(api):
+    _, headers, body = _get(api, '/api/weeks/latest/categories')
+    status, again, empty = _get(api, '/api/weeks/latest/categories', **{'If-None-Match': headers['ETag']})
+    assert status == HTTPStatus.NOT_MODIFIED and empty == b''
+    assert again['ETag'] == headers['ETag']
+
+    status, _, _ = _get(api, '/api/weeks/latest/categories', **{'If-None-Match': f'"other", W/{headers["ETag"]}'})
+    assert status == HTTPStatus.NOT_MODIFIED
+    status, _, same = _get(api, '/api/weeks/latest/categories', **{'If-None-Match': '"stale"'})
+    assert status == HTTPStatus.OK and same == body
+
+
+def test_if_modified_since(api):
+    _, headers, _ = _get(api, '/api/weeks')
+    status, _, _ = _get(api, '/api/weeks', **{'If-Modified-Since': headers['Last-Modified']})
+    assert status == HTTPStatus.NOT_MODIFIED
+    status, _, _ = _get(api, '/api/weeks', **{'If-Modified-Since': formatdate(0, usegmt=True)})
+    assert status == HTTPStatus.OK
+    # If-None-Match가 있으면 If-Modified-Since는 보지 않음
+    status, _, _ = _get(api, '/api/weeks', **{'If-None-Match': '"stale"', 'If-Modified-Since': headers['Last-Modified']})
+    assert status == HTTPStatus.OK
+
+
+def test_date_rollover_is_modified(tmp_path):
+    # 원본은 그대로인 채 날짜만 바뀌면 주차 구간이 달라지므로 If-Modified-Since에 304를 주면 안 됨
+    api = _make_api(tmp_path, mtime=datetime(2025, 12, 9, 18).timestamp())
+    _, headers, _ = _get(api, '/api/weeks/latest/top')
+    api.watcher.today = lambda: date(2025, 12, 17)
+    api.watcher.check_now()
+    assert api.watcher.check_now() is True
+
+    status, fresh, _ = _get(api, '/api/weeks/latest/top', **{'If-Modified-Since': headers['Last-Modified']})
+    assert status == HTTPStatus.OK and fresh['ETag'] != headers['ETag']
+    status, _, _ = _get(api, '/api/weeks/latest/top', **{'If-Modified-Since': fresh['Last-Modified']})
+    assert status == HTTPStatus.NOT_MODIFIED
+
+
+def test_bad_requests(api):
+    assert _get(api, '/api/weeks/latest/top', {'n': ['x']})[0] == HTTPStatus.BAD_REQUEST
+    assert _get(api, '/api/weeks/latest/top', {'n': ['0']})[0] == HTTPStatus.BAD_REQUEST
+    assert _get(api, '/api/weeks/99/top')[0] == HTTPStatus.NOT_FOUND
+    assert _get(api, '/api/nothing')[0] == HTTPStatus.NOT_FOUND
+
+
+def test_new_data_changes_etag(api):
+    _, headers, _ = _get(api, '/api/weeks/latest/writers')
+    content = api.watcher.content_path
+    with open(content, 'ab') as f:
+        f.write(b'\r\n')
+    bump_mtime(content)
+    api.watcher.check_now()
+    assert api.watcher.check_now() is True
+
+    status, fresh, _ = _get(api, '/api/weeks/latest/writers', **{'If-None-Match': headers['ETag']})
+    assert status == HTTPStatus.OK and fresh['ETag'] != headers['ETag']
+
+
+def test_unavailable_before_first_load(tmp_path):
+    watcher = DatasetWatcher(str(tmp_path / 'none.csv'), str(tmp_path / 'none2.csv'), lambda *_: None)
+    watcher.check_now()
+    assert JsonApi(watcher).respond('/api/weeks', {}, {})[0] == HTTPStatus.SERVICE_UNAVAILABLE
@@ -0,0 +1,65 @@
+"""cnc.cache: LRU 퇴출, TTL 만료, 메모리 상한, 적중 통계"""
+import pandas as pd
+
+from cnc import cache as cache_module
+from cnc.cache import VersionedCache, estimate_nbytes
+
+
+def _fill(cache, *keys):
+    for key in keys:
+        cache.get_or_compute(key, lambda key=key: key.upper())
+
+
+def test_hit_does_not_recompute():
+    cache = VersionedCache(max_entries=4)
+    calls = []
+    for _ in range(3):
+        assert cache.get_or_compute('a', lambda: calls.append(1) or 'A') == 'A'
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+
+
+def test_least_recently_used_is_evicted():
+    cache = VersionedCache(max_entries=2)
+    _fill(cache, 'a', 'b')
+    _fill(cache, 'a')  # a를 최근 사용으로
+    _fill(cache, 'c')  # b 퇴출
+    misses = cache.misses
+    _fill(cache, 'a', 'c')
+    assert cache.misses == misses
+    _fill(cache, 'b')
+    assert cache.misses == misses + 1
+    assert cache.stats()['entries'] == 2 and cache.evictions == 2
+
+
+def test_expired_entry_is_recomputed(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+    cache = VersionedCache(max_entries=4, ttl=60)
+    _fill(cache, 'a')
+    now[0] += 59
+    _fill(cache, 'a')
+    assert cache.misses == 1
+    now[0] += 2
+    _fill(cache, 'a')
+    assert cache.misses == 2 and cache.evictions == 1
+
+
+def test_byte_budget_evicts_oldest():
+    cache = VersionedCache(max_entries=10, sizeof=len, max_bytes=10)
+    for key in ('aaaa', 'bbbb', 'cccc'):
+        cache.get_or_compute(key, lambda key=key: key)
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['bytes'] == 8 and stats['evictions'] == 1
+
+
+def test_version_in_key_separates_entries():
+    cache = VersionedCache(max_entries=4)
+    assert cache.get_or_compute(('top10', '49주', 'v1'), lambda: 1) == 1
+    assert cache.get_or_compute(('top10', '49주', 'v2'), lambda: 2) == 2
+
+
+def test_estimate_nbytes_counts_frames():
+    df = pd.DataFrame({'x': range(1000)})
+    assert estimate_nbytes(df) >= 8000
+    assert estimate_nbytes({'a': df, 'b': [df]}) >= 16000
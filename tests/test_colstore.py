@@ -0,0 +1,87 @@
+"""cnc.colstore: 수치 열 메모리 매핑 공유 (내보내기/다시 열기/원본 상태 버전/쓸 수 없는 폴더)"""
+import numpy as np
+import pandas as pd
+
+from cnc.colstore import COLUMN_STORE_ENV, ColumnStore, column_dir
+from cnc.loader import content_loader, parse_content_csv
+from cnc.schema import NULLABLE_COUNT_COLUMNS
+from tests.conftest import CONTENT_CSV, write_lines
+
+
+def _is_mapped(series):
+    values = series.array
+    arr = values._data if isinstance(values, pd.arrays.IntegerArray) else series.to_numpy()
+    while arr is not None and not isinstance(arr, np.memmap):
+        arr = arr.base
+    return arr is not None
+
+
+def test_share_exports_then_maps(tmp_path):
+    df = parse_content_csv(CONTENT_CSV).head(300)
+    first = ColumnStore(str(tmp_path / 'cols'))
+    shared = first.share(df)
+    assert first.last_mode == 'exported'
+    assert _is_mapped(shared['total_views'])
+    assert shared.equals(df)
+
+    second = ColumnStore(str(tmp_path / 'cols'))
+    again = second.share(df)
+    assert second.last_mode == 'mapped' and second.version == first.version
+    assert again.equals(df)
+
+
+def test_nullable_columns_keep_missing_values(tmp_path):
+    df = parse_content_csv(CONTENT_CSV).head(50)
+    col = NULLABLE_COUNT_COLUMNS[0]
+    df[col] = df[col].mask(df.index % 3 == 0)
+    shared = ColumnStore(str(tmp_path / 'cols')).share(df)
+    pd.testing.assert_series_equal(shared[col], df[col])
+
+
+def test_unwritable_root_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / 'file'
+    blocker.write_text('x')
+    store = ColumnStore(str(blocker / 'cols'))
+    df = parse_content_csv(CONTENT_CSV).head(20)
+    assert store.share(df) is df
+    assert store.last_mode == 'memory' and not store.persistent
+
+
+def test_disabled_by_default(tmp_path, monkeypatch, content_lines):
+    monkeypatch.delenv(COLUMN_STORE_ENV, raising=False)
+    path = tmp_path / 'content_detail_master_sheet.csv'
+    write_lines(path, content_lines[:51])
+    loader = content_loader(str(path))
+    assert loader.column_store is None and not _is_mapped(loader.refresh()['total_views'])
+    assert not (tmp_path / column_dir(path.name)).exists()
+
+
+def test_loader_versions_follow_source_state(tmp_path, monkeypatch, content_lines):
+    monkeypatch.setenv(COLUMN_STORE_ENV, '1')
+    path = tmp_path / 'content_detail_master_sheet.csv'
+    write_lines(path, content_lines[:201])
+    first = content_loader(str(path))
+    first.refresh()
+    assert first.column_store.last_mode == 'exported'
+
+    # 같은 원본을 읽은 두 번째 워커는 열을 내보내지 않고 같은 버전을 엶
+    second = content_loader(str(path))
+    df = second.refresh()
+    assert second.column_store.last_mode == 'mapped'
+    assert second.column_store.version == first.column_store.version
+    assert _is_mapped(df['total_views'])
+
+    write_lines(path, content_lines[201:211], mode='ab')
+    df = first.refresh()
+    assert first.column_store.last_mode == 'exported'
+    assert first.column_store.version != second.column_store.version
+    assert len(df) == 210 and _is_mapped(df['total_views'])
+
+    # 직전 버전은 남기고(아직 읽는 워커가 다시 열 수 있음) 그보다 오래된 버전만 정리
+    root = tmp_path / column_dir(path.name)
+    versions = [second.column_store.version, first.column_store.version]
+    assert sorted(p.name for p in root.iterdir()) == sorted(versions)
+    write_lines(path, content_lines[211:221], mode='ab')
+    first.refresh()
+    versions = versions[1:] + [first.column_store.version]
+    assert sorted(p.name for p in root.iterdir()) == sorted(versions)
@@ -0,0 +1,79 @@
+"""cnc.cube: 주차 큐브 조각/재집계가 주차 기사 행을 직접 groupby한 결과와 같은지 (발행일 큐브 경로 포함)"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cnc.cube import (CUBE_DIMENSIONS, CUBE_MEASURES, build_daily_cube, build_weekly_cube, merge_daily_cubes, rollup,
+                      slice_week, weekly_from_daily)
+from cnc.loader import parse_content_csv, parse_event_csv
+from cnc.weeks import week_bounds, week_ranges
+from tests.conftest import CONTENT_CSV, EVENT_CSV
+
+DIMENSIONS = CUBE_DIMENSIONS[1:]
+
+
+@pytest.fixture(scope='module')
+def frames():
+    df_event, df_content = parse_event_csv(EVENT_CSV), parse_content_csv(CONTENT_CSV)
+    return df_content, week_ranges(df_event, date(2025, 12, 10))
+
+
+def _week_rows(df_content, ranges):
+    """주차별 기사 행 (발행일시를 주차 구간과 직접 비교)"""
+    times = df_content['publishing_datetime']
+    week_ids, starts, ends = week_bounds(ranges)
+    return {int(w): df_content[(times >= s) & (times < e)] for w, s, e in zip(week_ids, starts, ends)}
+
+
+def _baseline(rows, by):
+    """기존 방식: 기사 행을 그대로 groupby (큐브와 같은 열 이름/정렬)"""
+    df = rows.assign(
+        engagement_time_sum=rows['avg_engagement_time_sec'].astype('float64').fillna(0)
+        * rows['total_users'].astype('float64').fillna(0))
+    for col in ['total_views', 'total_users', 'likes_count', 'comments_count', 'scroll_90_count']:
+        df[col] = df[col].astype('float64').fillna(0)
+    out = df.groupby(by, observed=True).agg(**CUBE_MEASURES).reset_index()
+    return _normalized(out, by)
+
+
+def _normalized(df, by):
+    df = df[by + list(CUBE_MEASURES)].copy()
+    for col in by:
+        df[col] = df[col].astype(str)
+    for col in CUBE_MEASURES:
+        df[col] = df[col].astype('float64')
+    return df.sort_values(by, ignore_index=True)
+
+
+@pytest.mark.parametrize('by', [DIMENSIONS, ['category_main'], ['category_main', 'category_sub'], ['writer_name']])
+def test_week_slices_match_groupby(frames, by):
+    df_content, ranges = frames
+    cube = build_weekly_cube(df_content, ranges)
+    checked = 0
+    for week_id, rows in _week_rows(df_content, ranges).items():
+        actual = _normalized(rollup(slice_week(cube, week_id), by), by)
+        expected = _baseline(rows, by)
+        pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+        checked += len(rows)
+    assert checked > 0
+
+
+def test_cube_covers_every_article_in_range(frames):
+    df_content, ranges = frames
+    cube = build_weekly_cube(df_content, ranges)
+    in_range = sum(len(rows) for rows in _week_rows(df_content, ranges).values())
+    assert cube['article_count'].sum() == in_range
+    assert cube['total_views'].sum() == sum(int(rows['total_views'].sum())
+                                            for rows in _week_rows(df_content, ranges).values())
+
+
+def test_daily_cube_chunks_match_weekly(frames):
+    # 청크별 발행일 큐브를 합쳐 주차로 묶어도 한 번에 만든 주차 큐브와 같음 (cnc/stream.py 경로)
+    df_content, ranges = frames
+    chunks = np.array_split(np.arange(len(df_content)), 5)
+    daily = merge_daily_cubes([build_daily_cube(df_content.iloc[rows]) for rows in chunks])
+    expected = _normalized(build_weekly_cube(df_content, ranges), CUBE_DIMENSIONS)
+    actual = _normalized(weekly_from_daily(daily, ranges), CUBE_DIMENSIONS)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
@@ -0,0 +1,65 @@
+"""cnc.daily: 원본 끝에 붙은 일별 행만 해당 달 파티션에 반영"""
+import os
+
+import pandas as pd
+import pytest
+
+from cnc import incremental
+from cnc.daily import DailyMetricsStore, parse_daily_csv, partition_dir
+from cnc.loader import read_daily_metrics
+from tests.conftest import bump_mtime, write_lines
+
+
+def _days(start, count):
+    dates = pd.date_range(start, periods=count, freq='D')
+    return [f'{d:%Y-%m-%d},{1000 + i},{2000 + 3 * i}\n'.encode() for i, d in enumerate(dates)]
+
+
+def test_append_then_sync_matches_full(tmp_path, monkeypatch):
+    path = tmp_path / 'daily_metrics.csv'
+    write_lines(path, [b'date,uv,pv\n'] + _days('2025-10-01', 60))
+    store = DailyMetricsStore(partition_dir(str(path))).sync(str(path))
+    assert store.last_mode == 'full' and store.last_months == ['2025-10', '2025-11']
+    october = os.stat(os.path.join(store.root, '2025-10.parquet')).st_mtime_ns
+
+    # 12월 행 추가 + 11월 마지막 날 정정, 마지막 행은 쓰는 중
+    write_lines(path, [b'2025-11-30,1,2\n'] + _days('2025-12-01', 9) + [b'2025-12-10,9'], mode='ab')
+    bump_mtime(path)
+    # 앞부분은 추가분 확인에서 한 번만 해시 (기록할 때 파일 전체를 다시 해시하지 않음)
+    monkeypatch.setattr(incremental, 'prefix_digest', lambda *_: pytest.fail('앞부분을 다시 해시함'))
+    store.sync(str(path))
+    assert store.last_mode == 'append' and store.last_months == ['2025-11', '2025-12']
+    assert os.stat(os.path.join(store.root, '2025-10.parquet')).st_mtime_ns == october  # 지난 달은 그대로
+
+    with open(path, 'rb') as f:
+        expected = parse_daily_csv(incremental.complete_lines(f.read()))
+    got = store.read('2025-01-01', '2026-01-01')
+    pd.testing.assert_frame_equal(got.reset_index(drop=True), expected, check_dtype=False)
+    assert got.loc[got['date'] == '2025-11-30', 'uv'].item() == 1
+
+    # 마지막 행이 마저 쓰이면 다음 동기화(새 저장소 = 다른 프로세스)가 그 행만 반영
+    write_lines(path, [b'9,9\n'], mode='ab')
+    bump_mtime(path)
+    other = DailyMetricsStore(store.root).sync(str(path))
+    assert other.last_mode == 'append' and other.last_months == ['2025-12']
+    assert other.read('2025-12-10', '2025-12-10')['uv'].item() == 99
+
+
+def test_rewritten_prefix_rebuilds(tmp_path):
+    path = tmp_path / 'daily_metrics.csv'
+    write_lines(path, [b'date,uv,pv\n'] + _days('2025-11-01', 40))
+    store = DailyMetricsStore(partition_dir(str(path))).sync(str(path))
+    write_lines(path, [b'date,uv,pv\n'] + _days('2025-12-01', 5))
+    bump_mtime(path)
+    assert store.sync(str(path)).last_mode == 'full'
+    assert store.months() == ['2025-12'] and len(store.read('2025-01-01', '2026-01-01')) == 5
+
+
+def test_engine_rebuilds_reuse_one_store(tmp_path):
+    path = str(tmp_path / 'daily_metrics.csv')
+    write_lines(path, [b'date,uv,pv\n'] + _days('2025-11-01', 10))
+    store = read_daily_metrics(path)
+    write_lines(path, _days('2025-11-11', 2), mode='ab')
+    bump_mtime(path)
+    assert read_daily_metrics(path) is store and store.last_mode == 'append'
+    assert read_daily_metrics(str(tmp_path / 'missing.csv')) is None
@@ -0,0 +1,62 @@
+"""cnc.events.EventMatrix: 피벗 행렬/최근 N주 구간이 긴 형식 시트를 직접 거르고 합산한 결과와 같은지"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from cnc.events import REQUIRED_EVENTS, EventMatrix
+from cnc.loader import parse_event_csv
+from tests.conftest import EVENT_CSV
+
+
+@pytest.fixture(scope='module')
+def df_event():
+    return parse_event_csv(EVENT_CSV)
+
+
+def _summed(df_event):
+    """(week_id, event_name) -> 이벤트 수 합계 (중복 행 합산, 음수 주차 제외)"""
+    valid = df_event[df_event['week_id'] >= 0]
+    return valid.groupby(['week_id', 'event_name'])['event_count'].sum()
+
+
+def _baseline_window(df_event, week_id, n_weeks, event_names):
+    """기존 방식: 주차 목록에서 최근 n주를 골라 이벤트별로 걸러 합산 (없는 이벤트는 0)"""
+    week_ids = sorted((w for w in df_event['week_id'].unique() if w >= 0), reverse=True)
+    start = week_ids.index(week_id) if week_id in week_ids else 0
+    recent = week_ids[start:start + n_weeks]
+    summed = _summed(df_event)
+    data = {'week_id': recent}
+    for name in event_names:
+        data[name] = [float(summed.get((w, name), 0)) for w in recent]
+    return pd.DataFrame(data)
+
+
+def test_matrix_matches_long_sheet(df_event):
+    matrix = EventMatrix(df_event)
+    summed = _summed(df_event)
+    assert df_event.duplicated(['week_id', 'event_name']).any()  # 중복 행 합산도 확인
+    assert list(matrix.weeks) == sorted(summed.index.get_level_values('week_id').unique())
+    for (week_id, name), count in summed.items():
+        assert matrix.series(name).loc[week_id] == count
+    # 시트에 없는 (주차, 이벤트) 칸은 0
+    assert np.count_nonzero(matrix.values) <= len(summed)
+
+
+@pytest.mark.parametrize('week_id', [49, 25, 20, 18, 5, 0, 99])
+def test_window_matches_baseline(df_event, week_id):
+    names = list(REQUIRED_EVENTS)
+    expected = _baseline_window(df_event, week_id, 12, names)
+    actual = EventMatrix(df_event).window(week_id, 12, names)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_missing_events(df_event):
+    matrix = EventMatrix(df_event)
+    assert matrix.missing() == ['page_view']
+    with pytest.raises(KeyError):
+        matrix.series('page_view')
+
+
+def test_empty_sheet():
+    matrix = EventMatrix(pd.DataFrame({'week_id': [], 'event_count': [], 'event_name': []}))
+    assert matrix.window(3, 12, ['session_start']).empty
@@ -0,0 +1,168 @@
+"""cnc.incremental: append-only 증분 로드, upsert, 앞부분 변경 시 전체 재로드"""
+import pytest
+
+from cnc.incremental import appended_offset, complete_lines, source_state
+from cnc.loader import content_loader, parse_content_csv
+from tests.conftest import bump_mtime, write_lines
+
+
+def _views(df, page_path):
+    return int(df.loc[df['page_path'] == page_path, 'total_views'].iloc[0])
+
+
+def _rewrite_views(line, views):
+    """행의 total_views(두 번째 열)를 같은 자릿수의 값으로 바꾼 행 -> (행, page_path)"""
+    page_path, old, rest = line.split(b',', 2)
+    new = str(views).encode().rjust(len(old), b'9')[:len(old)]
+    return b','.join([page_path, new, rest]), page_path.decode()
+
+
+@pytest.fixture
+def content_csv(tmp_path, content_lines):
+    path = tmp_path / 'content_detail_master_sheet.csv'
+    write_lines(path, content_lines[:201])
+    return path
+
+
+def test_append_parses_only_new_rows(content_csv, content_lines):
+    loader = content_loader(str(content_csv))
+    assert len(loader.refresh()) == 200 and loader.last_mode == 'full'
+
+    write_lines(content_csv, content_lines[201:251], mode='ab')
+    df = loader.refresh()
+    assert loader.last_mode == 'append' and loader.last_added == 50
+    assert len(df) == 250
+    assert df['publishing_datetime'].is_monotonic_increasing
+
+    loader.refresh()
+    assert loader.last_mode == 'unchanged'
+
+
+def test_append_matches_full_parse(content_csv, content_lines):
+    loader = content_loader(str(content_csv))
+    loader.refresh()
+    write_lines(content_csv, content_lines[201:401], mode='ab')
+    df = loader.refresh()
+
+    expected = parse_content_csv(str(content_csv))
+    assert sorted(df['page_path']) == sorted(expected['page_path'])
+    assert df['total_views'].sum() == expected['total_views'].sum()
+
+
+def test_appended_key_replaces_existing_row(content_csv, content_lines):
+    loader = content_loader(str(content_csv))
+    loader.refresh()
+
+    line, page_path = _rewrite_views(content_lines[10], 7)
+    write_lines(content_csv, [line], mode='ab')
+    df = loader.refresh()
+    assert loader.last_mode == 'append'
+    assert len(df) == 200
+    assert _views(df, page_path) == int(line.split(b',')[1])
+
+
+def test_partial_last_line_waits_for_newline(content_csv, content_lines):
+    loader = content_loader(str(content_csv))
+    loader.refresh()
+
+    row = content_lines[201]
+    write_lines(content_csv, [row[:20]], mode='ab')
+    assert len(loader.refresh()) == 200
+    write_lines(content_csv, [row[20:]], mode='ab')
+    assert len(loader.refresh()) == 201
+
+
+def test_same_size_rewrite_reloads(content_csv, content_lines):
+    loader = content_loader(str(content_csv))
+    loader.refresh()
+
+    lines = list(content_lines[:201])
+    lines[150], page_path = _rewrite_views(lines[150], 0)
+    before = content_csv.stat().st_size
+    write_lines(content_csv, lines)
+    bump_mtime(content_csv)
+    assert content_csv.stat().st_size == before
+
+    df = loader.refresh()
+    assert loader.last_mode == 'full'
+    assert _views(df, page_path) == int(lines[150].split(b',')[1])
+
+
+def test_early_row_edit_with_append_reloads(content_csv, content_lines):
+    loader = content_loader(str(content_csv))
+    loader.refresh()
+
+    lines = list(content_lines[:211])
+    lines[2], page_path = _rewrite_views(lines[2], 0)
+    write_lines(content_csv, lines)
+    bump_mtime(content_csv)
+
+    df = loader.refresh()
+    assert loader.last_mode == 'full'
+    assert len(df) == 210
+    assert _views(df, page_path) == int(lines[2].split(b',')[1])
+
+
+def test_touch_without_change_keeps_data(content_csv):
+    loader = content_loader(str(content_csv))
+    df = loader.refresh()
+    bump_mtime(content_csv)
+
+    assert loader.refresh() is df
+    assert loader.last_mode == 'unchanged'
+
+
+def test_cold_start_resumes_from_snapshot(content_csv, content_lines):
+    content_loader(str(content_csv)).refresh()
+    write_lines(content_csv, content_lines[201:221], mode='ab')
+
+    loader = content_loader(str(content_csv))
+    df = loader.refresh()
+    assert loader.last_mode == 'append' and loader.last_added == 20
+    assert len(df) == 220
+
+
+def test_cold_start_ignores_snapshot_after_rewrite(content_csv, content_lines):
+    content_loader(str(content_csv)).refresh()
+    lines = list(content_lines[:201])
+    lines[5], page_path = _rewrite_views(lines[5], 0)
+    write_lines(content_csv, lines)
+    bump_mtime(content_csv)
+
+    loader = content_loader(str(content_csv))
+    df = loader.refresh()
+    assert loader.last_mode == 'full'
+    assert _views(df, page_path) == int(lines[5].split(b',')[1])
+
+
+# ----------------- 모듈 함수 (daily/traffic 저장소 공용) -----------------
+def _state(path):
+    with open(path, 'rb') as f:
+        header = f.readline()
+        data = complete_lines(header + f.read())
+        return source_state(f, header, len(data))
+
+
+def _offset(path, state):
+    with open(path, 'rb') as f:
+        header = f.readline()
+        return appended_offset(f, path.stat().st_size, header, state)
+
+
+def test_appended_offset(tmp_path):
+    path = tmp_path / 'rows.csv'
+    path.write_bytes(b'a,b\n1,2\n3,4\n')
+    state = _state(path)
+    assert _offset(path, state) == state['offset']
+
+    path.write_bytes(b'a,b\n1,2\n3,4\n5,6\n')
+    assert _offset(path, state) == state['offset']
+
+    path.write_bytes(b'a,b\n1,9\n3,4\n5,6\n')
+    bump_mtime(path)
+    assert _offset(path, state) is None
+
+    path.write_bytes(b'a,c\n1,2\n3,4\n5,6\n')
+    assert _offset(path, state) is None
+    assert _offset(path, {'offset': 4}) is None
+    assert _offset(path, None) is None
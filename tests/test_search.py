@@ -0,0 +1,59 @@
+"""cnc.search: 바이그램 색인 검색 결과가 제목 전체 대조(브루트 포스)와 같은지"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from cnc.loader import parse_content_csv
+from cnc.search import TitleIndex, normalize_titles, query_terms
+from tests.conftest import CONTENT_CSV
+
+QUERIES = ['셰프', '메리어트 호텔', '메리어트', 'k-푸드', 'K', '맛', '의', '  서울   호텔 ', '없는검색어쀍', '2025']
+
+
+@pytest.fixture(scope='module')
+def titles():
+    return normalize_titles(parse_content_csv(CONTENT_CSV)['article_title']).reset_index(drop=True)
+
+
+def brute_force(titles, query):
+    terms = query_terms(query)
+    if not terms:
+        return np.array([], dtype=np.int64)
+    hit = [all(term in title for term in terms) for title in titles]
+    return np.flatnonzero(hit)
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_search_matches_brute_force(titles, query):
+    index = TitleIndex.build(titles)
+    assert list(index.search(query, titles)) == list(brute_force(titles, query))
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_ranked_search_matches_brute_force(titles, query):
+    views = pd.Series(np.random.default_rng(0).integers(0, 50, len(titles)))
+    index = TitleIndex.build(titles)
+    rows = brute_force(titles, query)
+    # 조회수 내림차순, 동점이면 행 순서
+    expected = rows[np.lexsort((rows, -views.to_numpy()[rows]))][:20]
+    assert list(index.search(query, titles, views=views, limit=20)) == list(expected)
+
+
+def test_extended_index_matches_rebuild(titles):
+    head = titles.iloc[:5000]
+    index = TitleIndex.build(head)
+    for end in (7000, 9000, len(titles)):
+        index = index.update(head, titles.iloc[:end])
+        head = titles.iloc[:end]
+    assert len(index.segments) > 1
+    for query in QUERIES:
+        assert list(index.search(query, titles)) == list(brute_force(titles, query))
+
+
+def test_changed_prefix_rebuilds(titles):
+    index = TitleIndex.build(titles.iloc[:100])
+    changed = titles.iloc[:200].copy()
+    changed.iloc[0] = '완전히 다른 제목'
+    rebuilt = index.update(titles.iloc[:100], changed)
+    assert len(rebuilt.segments) == 1
+    assert 0 in rebuilt.search('다른 제목', changed)
@@ -0,0 +1,93 @@
+"""cnc.sections: 섹션은 선언한 데이터 항목(과 그 항목이 쓰는 항목)만 계산, 그림은 주차/버전별로 재사용"""
+import tracemalloc
+from datetime import date
+
+import pytest
+
+from cnc import figures
+from cnc.engine import FILTERED_DATA_BUILDERS, ReportEngine
+from cnc.loader import parse_content_csv, parse_event_csv
+from cnc.profiling import StageProfiler
+from cnc.sections import SECTIONS, build_section, iter_figures
+from tests.conftest import CONTENT_CSV, EVENT_CSV
+
+
+@pytest.fixture(scope='module')
+def frames():
+    return parse_event_csv(EVENT_CSV), parse_content_csv(CONTENT_CSV)
+
+
+def _engine(frames):
+    return ReportEngine(*frames, version='test', base_date=date(2025, 12, 10)).prepare()
+
+
+def _computed(engine):
+    return {key[0] for key in engine.cache._entries if key[0] in FILTERED_DATA_BUILDERS}
+
+
+@pytest.mark.parametrize('section', SECTIONS, ids=lambda s: s.key)
+def test_section_computes_only_its_deps(frames, section):
+    # 선언한 항목만 직접 가져왔을 때 계산되는 항목 (writers -> cube_week처럼 안쪽에서 쓰는 항목 포함)
+    reference = _engine(frames)
+    week = next(iter(reference.week_map))
+    for dep in section.deps:
+        reference.get(dep, week)
+
+    engine = _engine(frames)
+    assert build_section(section, engine, week)
+    assert _computed(engine) == _computed(reference)
+    assert set(section.deps) <= _computed(engine)
+    assert len(_computed(engine)) < len(FILTERED_DATA_BUILDERS)
+
+
+def test_profiler_records_data_and_build_stages(frames):
+    section = SECTIONS[0]
+    engine = _engine(frames)
+    profiler = StageProfiler(enabled=True)
+    try:
+        blocks = build_section(section, engine, next(iter(engine.week_map)), profiler)
+    finally:
+        tracemalloc.stop()
+    assert blocks
+    assert [r['stage'] for r in profiler.records] == [f'{section.key}/data', f'{section.key}/build']
+
+
+def test_declared_deps_exist():
+    for section in SECTIONS:
+        assert set(section.deps) <= set(FILTERED_DATA_BUILDERS)
+
+
+# ----------------- 그림 캐시 -----------------
+def _figures(blocks):
+    return [fig for _, _, fig in iter_figures(blocks)]
+
+
+def test_figures_are_reused_per_week_and_version(frames):
+    section = next(s for s in SECTIONS if s.key == 'category')
+    engine = _engine(frames)
+    week = next(iter(engine.week_map))
+    first = _figures(build_section(section, engine, week))
+    assert first
+    assert all(a is b for a, b in zip(first, _figures(build_section(section, engine, week))))
+
+    # 다른 주차, 또는 같은 그림 캐시를 쓰는 새 데이터 버전은 다시 만듦
+    other_week = list(engine.week_map)[1]
+    assert not any(a is b for a, b in zip(first, _figures(build_section(section, engine, other_week))))
+    newer = ReportEngine(*frames, version='test-2', base_date=date(2025, 12, 10), figure_cache=engine.figure_cache)
+    assert not any(a is b for a, b in zip(first, _figures(build_section(section, newer.prepare(), week))))
+
+
+def test_figure_size_is_estimated_without_serializing(monkeypatch):
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    monkeypatch.setattr(pio, 'to_json', lambda *a, **k: pytest.fail('그림을 직렬화함'))
+    small = go.Figure(go.Bar(x=['a', 'b'], y=[1, 2]))
+    large = go.Figure(go.Bar(x=[f'기사 {i}' for i in range(5000)], y=list(range(5000))))
+    assert 0 < figures.figure_nbytes(small) < figures.figure_nbytes(large)
+
+    cache = figures.figure_cache(max_bytes=figures.figure_nbytes(large) + figures.figure_nbytes(small))
+    cache.get_or_compute('large', lambda: large)
+    cache.get_or_compute('small', lambda: small)
+    cache.get_or_compute('large-2', lambda: large)  # 상한을 넘으면 오래된 항목부터 밀려남
+    assert 'large' not in cache._entries and 'large-2' in cache._entries
@@ -0,0 +1,41 @@
+"""cnc.snapshot: 스냅샷 저장은 쓰는 쪽마다 고유 임시 파일을 쓰고, 실패하면 임시 파일을 남기지 않음"""
+import threading
+
+import pandas as pd
+
+from cnc import snapshot
+
+
+def _leftovers(tmp_path):
+    return [p.name for p in tmp_path.iterdir() if '.tmp' in p.name]
+
+
+def test_concurrent_writers_do_not_share_temp_files(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / 'sheet.csv')
+    df = pd.DataFrame({'a': range(1000)})
+    # 모든 스레드가 임시 파일을 다 쓴 뒤에야 교체하도록 맞춤 (임시 이름이 같으면 먼저 교체한 쪽이 가져가 나머지는 실패)
+    barrier = threading.Barrier(4)
+    to_parquet = pd.DataFrame.to_parquet
+
+    def synchronized_to_parquet(self, *args, **kwargs):
+        to_parquet(self, *args, **kwargs)
+        barrier.wait(timeout=10)
+
+    monkeypatch.setattr(pd.DataFrame, 'to_parquet', synchronized_to_parquet)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(snapshot.write_snapshot(csv_path, df, {'size': 1})))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 4
+    assert snapshot.read_snapshot(csv_path, {'size': 1})['a'].tolist() == list(range(1000))
+    assert not _leftovers(tmp_path)
+
+
+def test_failed_write_removes_temp_file(tmp_path):
+    bad = pd.DataFrame({'a': [1, 'x', object()]})  # parquet로 쓸 수 없는 열
+    assert snapshot.write_snapshot(str(tmp_path / 'sheet.csv'), bad, {'size': 1}) is False
+    assert not _leftovers(tmp_path) and not list(tmp_path.glob('*.parquet'))
@@ -0,0 +1,92 @@
+"""cnc.store: SQLite 백엔드가 메모리(CSV) 경로와 같은 결과를 내는지, 동시 적재가 안전한지"""
+import os
+import threading
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from cnc.engine import load_engine
+from cnc.loader import read_master_sheets
+from cnc.store import SqliteStore
+from tests.conftest import CONTENT_CSV, EVENT_CSV
+
+BASE_DATE = date(2025, 12, 10)
+
+
+@pytest.fixture(scope='module')
+def engines(tmp_path_factory):
+    """같은 시트를 읽은 (메모리 엔진, SQLite 엔진)"""
+    tmp = tmp_path_factory.mktemp('store')
+    paths = {}
+    for name, src in (('event_path', EVENT_CSV), ('content_path', CONTENT_CSV)):
+        paths[name] = str(tmp / os.path.basename(src))
+        with open(src, 'rb') as f_src, open(paths[name], 'wb') as f_dst:
+            f_dst.write(f_src.read())
+    # 선택 파일(시간대/일별/유입경로/필명)은 없는 경로로 두어 두 엔진 모두 같은 대체 경로를 씀
+    optional = {name: str(tmp / f'missing_{name}.csv')
+                for name in ('hourly_path', 'daily_path', 'traffic_path', 'pen_names_path')}
+    memory = load_engine(base_date=BASE_DATE, **paths, **optional)
+    sqlite = load_engine(base_date=BASE_DATE, backend='sqlite', db_path=str(tmp / 'master.sqlite'), **paths, **optional)
+    return memory.prepare(), sqlite.prepare()
+
+
+def _weeks(engine):
+    return [int(week[:2]) for week in engine.week_map]
+
+
+def test_top_articles_match(engines):
+    memory, sqlite = engines
+    for week_id in _weeks(memory):
+        expected = memory.top_articles(week_id, 10).reset_index(drop=True)
+        actual = sqlite.top_articles(week_id, 10).reset_index(drop=True)
+        pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+
+
+def test_cube_week_matches(engines):
+    memory, sqlite = engines
+    keys = ['category_main', 'category_sub', 'writer_name']
+    for week_id in _weeks(memory):
+        expected = memory.cube_week(week_id).sort_values(keys, ignore_index=True)
+        actual = sqlite.cube_week(week_id).sort_values(keys, ignore_index=True)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_categorical=False)
+
+
+def test_filtered_sections_match(engines):
+    memory, sqlite = engines
+    for week in list(memory.week_map)[:6]:
+        for name in ('top10', 'writers'):
+            pd.testing.assert_frame_equal(sqlite.get(name, week), memory.get(name, week), check_dtype=False,
+                                          check_categorical=False)
+
+
+def test_search_matches(engines):
+    memory, sqlite = engines
+    for query in ('셰프', '호텔', '메리어트'):
+        expected = memory.search_articles(query, 20)
+        actual = sqlite.search_articles(query, 20)
+        assert sorted(actual['page_path']) == sorted(expected['page_path'])
+
+
+def test_concurrent_ingest_keeps_valid_db(tmp_path):
+    df_event, df_content = read_master_sheets(EVENT_CSV, CONTENT_CSV)
+    df_content = df_content.head(500)
+    store = SqliteStore(str(tmp_path / 'master.sqlite'))
+    errors = []
+
+    def ingest(version):
+        try:
+            store.ingest(df_event, df_content, version)
+        except Exception as exc:  # noqa: BLE001 - 스레드 예외를 본 스레드에서 확인
+            errors.append(exc)
+
+    threads = [threading.Thread(target=ingest, args=(f'v{i}',)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert store.version() in {f'v{i}' for i in range(4)}
+    assert store.meta()['rows'] == 500
+    assert os.listdir(tmp_path) == ['master.sqlite']
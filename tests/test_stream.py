@@ -0,0 +1,77 @@
+"""cnc.stream: 청크로 접은 결과가 메모리 경로와 같은지, 남기는 상태가 보관 기간으로 묶이는지, resource 모듈이 없어도 쓸 수 있는지"""
+import importlib
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from cnc import stream
+from cnc.engine import ReportEngine
+from cnc.loader import parse_content_csv, parse_event_csv
+from tests.conftest import CONTENT_CSV, EVENT_CSV
+
+BASE_DATE = date(2025, 12, 10)
+
+
+def test_multi_chunk_fold_matches_memory(tmp_path):
+    content_path = tmp_path / 'content_detail_master_sheet.csv'
+    content_path.write_bytes(open(CONTENT_CSV, 'rb').read())
+    df_event = parse_event_csv(EVENT_CSV)
+    memory = ReportEngine(df_event, parse_content_csv(CONTENT_CSV), base_date=BASE_DATE).prepare()
+
+    # 청크가 여러 개가 되도록 작은 메모리 상한, 옛 주차도 TOP 10이 남도록 K=10
+    streamed = stream.stream_content(str(content_path), memory_mb=1, recent_days=7, top_k=10)
+    assert streamed.meta['chunk_rows'] < streamed.meta['rows_read']
+    engine = stream.StreamingReportEngine(df_event, streamed, base_date=BASE_DATE).prepare()
+
+    keys = ['category_main', 'category_sub', 'writer_name']
+    for week in memory.week_map:
+        week_id = int(week[:2])
+        expected = memory.top_articles(week_id, 10).reset_index(drop=True)
+        actual = engine.top_articles(week_id, 10).reset_index(drop=True)
+        assert list(actual['page_path']) == list(expected['page_path'])
+        pd.testing.assert_frame_equal(engine.cube_week(week_id).sort_values(keys, ignore_index=True),
+                                      memory.cube_week(week_id).sort_values(keys, ignore_index=True),
+                                      check_dtype=False, check_categorical=False)
+
+
+def test_retained_state_is_bounded():
+    # 표본 행의 발행일을 400일에 걸쳐 펼친 원본을 오래된 것부터 청크로 접음 (연초 주 포함)
+    raw = stream.read_content_csv(CONTENT_CSV)
+    days = pd.Timestamp('2024-06-03') + pd.to_timedelta(np.arange(len(raw)) * 400 // len(raw), unit='D')
+    raw['publishing_datetime'] = (days + pd.Timedelta(hours=9)).strftime('%Y-%m-%d %H:%M:%S')
+    retain_weeks, top_k, recent_days = 6, 5, 10
+    folder = stream.ContentFolder(recent_days, top_k, retain_weeks)
+
+    for start in range(0, len(raw), 500):
+        folder.fold(raw.iloc[start:start + 500].copy())
+        oldest = folder.latest - pd.Timedelta(days=folder.latest.weekday() + 7 * (retain_weeks - 1))
+        assert folder.daily_cube['date'].min() >= oldest
+        assert folder.daily_cube['date'].nunique() <= 7 * retain_weeks
+        assert folder.top['publishing_datetime'].min() >= oldest
+        assert len(folder.top) <= (retain_weeks + 1) * top_k
+        assert folder.recent['publishing_datetime'].min() >= folder.latest - pd.Timedelta(days=recent_days - 1)
+    assert folder.rows_read == len(raw) and folder.daily_cube['date'].min() > pd.Timestamp('2025-06-01')
+
+
+def test_weekly_top_covers_new_year_week():
+    # 12/29(월)~1/4(일) 주: 0주차(1/1~1/4)의 TOP은 12월 기사에 밀리지 않아야 함
+    df = pd.DataFrame({
+        'publishing_datetime': pd.to_datetime(['2025-12-29', '2025-12-30', '2026-01-01', '2026-01-02']),
+        'total_views': [100, 90, 5, 3],
+        stream.ROW_COLUMN: range(4),
+    })
+    top = stream.top_per_week(df, 1)
+    assert list(top['total_views']) == [100, 5]
+
+
+def test_import_without_resource_module(monkeypatch):
+    # Windows에는 resource 모듈이 없음: 모듈은 가져올 수 있고 RSS 보고만 빠져야 함
+    monkeypatch.setitem(sys.modules, 'resource', None)
+    try:
+        module = importlib.reload(stream)
+        assert module.peak_rss_mb() is None
+    finally:
+        monkeypatch.undo()
+        importlib.reload(stream)
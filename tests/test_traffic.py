@@ -0,0 +1,89 @@
+"""cnc.traffic: 리퍼러 채널 분류, 원본 추가분만 집계"""
+import pandas as pd
+import pytest
+
+from cnc import incremental
+from cnc.loader import read_traffic
+from cnc.traffic import TrafficAggregates, channel_of
+from tests.conftest import bump_mtime, write_lines
+
+
+@pytest.mark.parametrize('source, channel', [
+    ('m.search.naver.com', '네이버'),
+    ('naver', '네이버'),
+    ('https://search.naver.com/search.naver?query=셰프', '네이버'),
+    ('www.google.co.kr', '구글'),
+    ('google', '구글'),
+    ('v.daum.net', '다음'),
+    ('t.co', 'SNS'),
+    ('l.facebook.com', 'SNS'),
+    ('x.com', 'SNS'),
+    ('mobile.x.com', 'SNS'),
+    ('https://t.co/abc', 'SNS'),
+    ('(direct)', '직접'),
+    ('(none)', '직접'),
+    ('', '직접'),
+    (None, '직접'),
+    # 규칙 단어를 부분 문자열로만 포함하는 다른 도메인
+    ('news.mt.co.kr', '기타'),
+    ('www.microsoft.com', '기타'),
+    ('netflix.com', '기타'),
+    ('directory.com', '기타'),
+    ('www.direct.co.kr', '기타'),
+    ('googleusercontent.com', '기타'),
+    ('mynaver.example.com', '기타'),
+])
+def test_channel_of(source, channel):
+    assert list(channel_of([source])) == [channel]
+
+
+def test_channel_of_keeps_order_for_repeated_sources():
+    sources = ['t.co', 'netflix.com', 't.co', '(direct)']
+    assert list(channel_of(sources)) == ['SNS', '기타', 'SNS', '직접']
+    assert len(channel_of([])) == 0
+
+
+# ----------------- 추가분 집계 -----------------
+def _hits(day, count):
+    sources = ['m.search.naver.com', '(direct)', 't.co', 'www.google.com', 'news.mt.co.kr']
+    return [f'2025-12-{day:02d} 10:{i % 60:02d}:00,{sources[i % 5]},/news/view/{i % 7},{i % 3 + 1}\n'.encode()
+            for i in range(count)]
+
+
+def _frames(aggregates):
+    return aggregates.by_day.reset_index(drop=True), aggregates.by_page.reset_index(drop=True)
+
+
+def test_append_then_sync_matches_full(tmp_path, monkeypatch):
+    path = tmp_path / 'traffic_hits.csv'
+    write_lines(path, [b'timestamp,source,page_path,views\n'] + _hits(7, 300))
+    aggregates = TrafficAggregates(str(path)).sync(chunk_bytes=2048)
+    assert aggregates.last_mode == 'full'
+
+    write_lines(path, _hits(8, 200) + [b'2025-12-08 11:00:00,t.co,/news'], mode='ab')  # 마지막 행은 쓰는 중
+    bump_mtime(path)
+    # 앞부분은 추가분 확인에서 한 번만 해시 (기록할 때 파일 전체를 다시 해시하지 않음)
+    monkeypatch.setattr(incremental, 'prefix_digest', lambda *_: pytest.fail('앞부분을 다시 해시함'))
+    assert aggregates.sync(chunk_bytes=2048).last_mode == 'append' and aggregates.last_rows == 200
+
+    fresh = TrafficAggregates(str(path))
+    fresh.persistent = False
+    fresh.sync()
+    for got, expected in zip(_frames(aggregates), _frames(fresh)):
+        pd.testing.assert_frame_equal(got, expected)
+    assert aggregates.state == fresh.state
+
+    # 저장된 표를 읽은 새 프로세스도 추가분만 집계
+    write_lines(path, [b'/view/1,1\n'] + _hits(9, 50), mode='ab')
+    bump_mtime(path)
+    restarted = TrafficAggregates(str(path)).sync()
+    assert restarted.last_mode == 'append' and restarted.last_rows == 51
+
+
+def test_engine_rebuilds_reuse_one_aggregate(tmp_path):
+    path = str(tmp_path / 'traffic_hits.csv')
+    write_lines(path, [b'timestamp,source,page_path,views\n'] + _hits(7, 20))
+    aggregates = read_traffic(path)
+    write_lines(path, _hits(8, 5), mode='ab')
+    bump_mtime(path)
+    assert read_traffic(path) is aggregates and aggregates.last_mode == 'append' and aggregates.last_rows == 5
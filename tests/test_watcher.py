@@ -0,0 +1,81 @@
+"""cnc.watcher: 같은 새 서명이 두 번 관찰될 때만 교체, 실패 시 이전 엔진 유지"""
+from datetime import date
+from types import SimpleNamespace
+
+from cnc.loader import data_version
+from cnc.watcher import DatasetWatcher
+from tests.conftest import bump_mtime
+
+
+def _watcher(tmp_path, fail=None):
+    event, content = tmp_path / 'event.csv', tmp_path / 'content.csv'
+    event.write_text('a\n1\n')
+    content.write_text('b\n1\n')
+    built = []
+
+    def build(base_date, previous):
+        if fail and fail[0]:
+            raise RuntimeError('읽기 실패')
+        engine = SimpleNamespace(version=data_version(str(event), str(content)), previous=previous)
+        built.append(engine)
+        return engine
+
+    watcher = DatasetWatcher(str(event), str(content), build, today=lambda: date(2025, 12, 10))
+    return watcher, content, built
+
+
+def test_first_check_loads_immediately(tmp_path):
+    watcher, _, built = _watcher(tmp_path)
+    assert watcher.get() is None
+    assert watcher.check_now() is True
+    assert watcher.get() is built[0] and watcher.builds == 1
+    assert watcher.check_now() is False
+
+
+def test_change_is_swapped_after_second_observation(tmp_path):
+    watcher, content, built = _watcher(tmp_path)
+    watcher.check_now()
+    first = watcher.get()
+
+    content.write_text('b\n1\n2\n')
+    assert watcher.check_now() is False  # 쓰는 중일 수 있으므로 한 번 더 확인
+    assert watcher.get() is first and watcher.status()['pending'] is not None
+    assert watcher.check_now() is True
+    assert watcher.get() is built[-1] and watcher.get().previous is first
+
+
+def test_signature_still_changing_waits(tmp_path):
+    watcher, content, _ = _watcher(tmp_path)
+    watcher.check_now()
+    for rows in ('1\n2\n', '1\n2\n3\n', '1\n2\n3\n4\n'):
+        content.write_text('b\n' + rows)
+        bump_mtime(content)
+        assert watcher.check_now() is False
+    assert watcher.builds == 1
+
+
+def test_failed_rebuild_keeps_previous_engine(tmp_path):
+    fail = [False]
+    watcher, content, _ = _watcher(tmp_path, fail)
+    watcher.check_now()
+    first = watcher.get()
+
+    fail[0] = True
+    content.write_text('b\n9\n')
+    watcher.check_now()
+    assert watcher.check_now() is False
+    assert watcher.get() is first
+    assert 'RuntimeError' in watcher.last_error
+
+    fail[0] = False
+    assert watcher.check_now() is True
+    assert watcher.last_error is None
+
+
+def test_base_date_change_rebuilds(tmp_path):
+    watcher, _, _ = _watcher(tmp_path)
+    watcher.check_now()
+    watcher.today = lambda: date(2025, 12, 17)
+    assert watcher.check_now() is False
+    assert watcher.check_now() is True
+    assert watcher.status()['base_date'] == '2025-12-17'
@@ -0,0 +1,58 @@
+"""cnc.weeks.WeekIndex: 이진 탐색 주차 구간이 발행일시 비교(전체 마스크)와 같은 행을 고르는지"""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from cnc.loader import parse_content_csv, parse_event_csv
+from cnc.weeks import WeekIndex, week_bounds, week_ranges
+from tests.conftest import CONTENT_CSV, EVENT_CSV
+
+
+@pytest.fixture(scope='module')
+def frames():
+    return parse_event_csv(EVENT_CSV), parse_content_csv(CONTENT_CSV)
+
+
+def _masked(df_content, ranges):
+    """주차별 기대 행 (week_bounds와 같은 반열림 구간을 불리언 마스크로)"""
+    week_ids, starts, ends = week_bounds(ranges)
+    times = df_content['publishing_datetime']
+    return {int(w): df_content[(times >= s) & (times < e)] for w, s, e in zip(week_ids, starts, ends)}
+
+
+@pytest.mark.parametrize('base_date', [date(2025, 12, 10), date(2025, 11, 26)])
+def test_rows_match_mask(frames, base_date):
+    df_event, df_content = frames
+    ranges = week_ranges(df_event, base_date)
+    index = WeekIndex(df_content, ranges)
+    expected = _masked(df_content, ranges)
+    assert sum(len(rows) for rows in expected.values()) > 0
+    for week_id, rows in expected.items():
+        assert index.count(week_id) == len(rows)
+        assert list(index.rows(week_id)['page_path']) == list(rows['page_path'])
+
+
+def test_unsorted_input_is_sorted_first(frames):
+    df_event, df_content = frames
+    ranges = week_ranges(df_event, date(2025, 12, 10))
+    shuffled = df_content.sample(frac=1, random_state=0)
+    index = WeekIndex(shuffled, ranges)
+    expected = _masked(df_content, ranges)
+    for week_id, rows in expected.items():
+        assert sorted(index.rows(week_id)['page_path']) == sorted(rows['page_path'])
+
+
+def test_unknown_week_is_empty(frames):
+    df_event, df_content = frames
+    index = WeekIndex(df_content, week_ranges(df_event, date(2025, 12, 10)))
+    assert index.count(-5) == 0 and index.rows(-5).empty
+
+
+def test_missing_publish_time_is_never_selected(frames):
+    df_event, df_content = frames
+    df = df_content.head(100).copy()
+    df.loc[df.index[:10], 'publishing_datetime'] = pd.NaT
+    ranges = week_ranges(df_event, date(2025, 12, 10))
+    index = WeekIndex(df, ranges)
+    assert sum(index.count(w) for w in ranges) == 90
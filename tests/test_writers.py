@@ -0,0 +1,97 @@
+"""cnc.writers: 큐브 기반 기자 집계표/순위표가 주차 기사 행에 필명 매핑을 직접 적용해 합산한 결과와 같은지"""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from cnc.cube import CUBE_MEASURES
+from cnc.engine import ReportEngine
+from cnc.loader import parse_content_csv, parse_event_csv
+from cnc.weeks import week_bounds
+from cnc.writers import PenNameMap, leaderboard, parse_pen_name_csv, writer_table
+from tests.conftest import CONTENT_CSV, EVENT_CSV
+
+# 본명 바이라인(이경엽, 김철호, 조용수), 필명 바이라인(오요리), 한 기자의 필명 두 개(조용수)가 섞인 매핑
+PEN_NAMES = pd.DataFrame({
+    'pen_name': ['맛객', '오요리', 'Chef J', '요리왕'],
+    'real_name': ['이경엽', '김철호', '조용수', '조용수'],
+})
+MEASURES = ['article_count', 'total_views', 'likes_count', 'comments_count']
+
+
+@pytest.fixture(scope='module')
+def engine():
+    df_event, df_content = parse_event_csv(EVENT_CSV), parse_content_csv(CONTENT_CSV)
+    return ReportEngine(df_event, df_content, version='test', base_date=date(2025, 12, 10)).prepare()
+
+
+def _baseline_names(byline):
+    """기존 방식: 기사 행마다 사전으로 (본명, 필명) 조회"""
+    pen_to_real = dict(zip(PEN_NAMES['pen_name'], PEN_NAMES['real_name']))
+    real_to_pen = {}
+    for pen, real in zip(PEN_NAMES['pen_name'], PEN_NAMES['real_name']):
+        real_to_pen.setdefault(real, pen)
+    if byline in pen_to_real:
+        return pen_to_real[byline], byline
+    return byline, real_to_pen.get(byline, byline)
+
+
+def _baseline(engine, week_id):
+    """주차 기사 행 -> (본명, 필명)별 기사 수/조회/좋아요/댓글 합계"""
+    times = engine.df_content['publishing_datetime']
+    bounds = {int(w): (s, e) for w, s, e in zip(*week_bounds(engine.week_ranges))}
+    start, end = bounds[week_id]
+    rows = engine.df_content[(times >= start) & (times < end)]
+    names = [_baseline_names(str(b)) for b in rows['writer_name']]
+    df = pd.DataFrame({
+        '본명': [real for real, _ in names],
+        '필명': [pen for _, pen in names],
+        'article_count': 1,
+        'total_views': rows['total_views'].astype('int64').to_numpy(),
+        'likes_count': rows['likes_count'].astype('int64').to_numpy(),
+        'comments_count': rows['comments_count'].astype('int64').to_numpy(),
+    })
+    return df.groupby(['본명', '필명'], as_index=False)[MEASURES].sum()
+
+
+def _weeks(engine):
+    return [int(week[:2]) for week in engine.week_map if engine.cube_week(int(week[:2]))['article_count'].sum() > 0]
+
+
+def test_writer_table_matches_row_mapping(engine):
+    weeks = _weeks(engine)
+    assert len(weeks) >= 3
+    for week_id in weeks:
+        actual = writer_table(engine.cube_week(week_id), PenNameMap(PEN_NAMES))
+        actual = actual[['본명', '필명'] + MEASURES].sort_values(['본명', '필명'], ignore_index=True)
+        expected = _baseline(engine, week_id)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('by', ['본명', '필명'])
+def test_leaderboard_matches_row_mapping(engine, by):
+    week_id = _weeks(engine)[0]
+    board = leaderboard(writer_table(engine.cube_week(week_id), PenNameMap(PEN_NAMES)), by)
+    expected = _baseline(engine, week_id).groupby(by, as_index=False)[MEASURES].sum()
+    expected = expected.sort_values(['total_views', by], ascending=[False, True], ignore_index=True)
+    assert list(board[by]) == list(expected[by])
+    assert (board[MEASURES].to_numpy() == expected[MEASURES].to_numpy()).all()
+    assert list(board['순위']) == list(range(1, len(board) + 1))
+    if by == '필명':
+        # 한 기자의 필명 두 개는 필명 순위표에서 따로, 본명 순위표에서는 한 행
+        assert '조용수' not in set(board['필명'])
+
+
+def test_without_mapping_byline_is_both_names(engine):
+    week_id = _weeks(engine)[0]
+    table = writer_table(engine.cube_week(week_id))
+    assert (table['본명'] == table['필명']).all()
+    assert table['article_count'].sum() == engine.cube_week(week_id)['article_count'].sum()
+    assert set(CUBE_MEASURES) <= set(table.columns)
+
+
+def test_parse_pen_name_csv_korean_header(tmp_path):
+    path = tmp_path / 'pen_names.csv'
+    path.write_text('필명,본명\n 맛객 ,이경엽\n,빈값\n맛객,이경엽2\n', encoding='utf-8-sig')
+    df = parse_pen_name_csv(str(path))
+    assert df.to_dict('records') == [{'pen_name': '맛객', 'real_name': '이경엽2'}]